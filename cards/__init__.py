@@ -1,3 +1,3 @@
 """Helper utilities for handling card data structures."""
 
-from .utils import create_card, find_card, normalize_cards_tree  # noqa: F401
+from .utils import build_front_index, clone_card_columns, clone_table, create_card, empty_card_columns, find_card, find_card_index, intern_strings, normalize_cards_tree  # noqa: F401
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+import sys
+from typing import Any, Dict, List
 
 DEFAULT_CARD_WEIGHT = 100.0
 
 CardDict = Dict[str, object]
+FrontIndex = Dict[str, int]
 
 
 # Creates a normalized card dictionary that is JSON serializable.
@@ -33,6 +35,26 @@ def normalize_card_entry(card: object) -> CardDict:
     return create_card(str(card))
 
 
+# Returns a fresh card matrix row with its own empty list per column.
+def empty_card_columns(columns: List[str]) -> Dict[str, List[CardDict]]:
+    return {col: [] for col in columns}
+
+
+# Copies one row's column lists and card dicts; card values are all immutable scalars.
+def clone_card_columns(row_data: Dict[str, List[CardDict]]) -> Dict[str, List[CardDict]]:
+    return {col: [dict(card) for card in card_list] for col, card_list in row_data.items()}
+
+
+# Copies a whole space along its fixed schema, which is far cheaper than a generic deep copy.
+def clone_table(table: Dict[str, Any]) -> Dict[str, Any]:
+    cloned = dict(table)
+    cloned["columns"] = list(table.get("columns", []))
+    cloned["rows"] = list(table.get("rows", []))
+    cloned["row_colors"] = dict(table.get("row_colors", {}))
+    cloned["cards"] = {row: clone_card_columns(row_data) for row, row_data in table.get("cards", {}).items()}
+    return cloned
+
+
 # Walks the nested row/column structure and normalizes every card entry.
 def normalize_cards_tree(cards: Dict[str, Dict[str, List[CardDict]]]) -> None:
     for row_data in cards.values():
@@ -41,9 +63,43 @@ def normalize_cards_tree(cards: Dict[str, Dict[str, List[CardDict]]]) -> None:
                 card_list[idx] = normalize_card_entry(card)
 
 
+# Returns a copy of loaded JSON data with its dict keys and card fronts interned; other text such as backs stays as is.
+def intern_strings(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            sys.intern(key) if isinstance(key, str) else key: (
+                sys.intern(item) if key == "front" and isinstance(item, str) else intern_strings(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [intern_strings(item) for item in value]
+    return value
+
+
 # Finds and returns the first card dictionary that matches the provided front text.
 def find_card(card_list: List[CardDict], front_text: str) -> CardDict | None:
     for card in card_list:
         if str(card.get("front")) == front_text:
             return card
     return None
+
+
+# Maps each card front to the position of its first occurrence in the list.
+def build_front_index(card_list: List[CardDict]) -> FrontIndex:
+    index: FrontIndex = {}
+    for idx, card in enumerate(card_list):
+        index.setdefault(str(card.get("front")), idx)
+    return index
+
+
+# Returns the position of the first card with the given front, consulting the front index first if one is passed.
+def find_card_index(card_list: List[CardDict], front_text: str, front_index: FrontIndex | None = None) -> int | None:
+    if front_index is not None:
+        idx = front_index.get(front_text)
+        if idx is not None and idx < len(card_list) and str(card_list[idx].get("front")) == front_text:
+            return idx
+    for idx, card in enumerate(card_list):
+        if str(card.get("front")) == front_text:
+            return idx
+    return None
@@ -1,3 +1,3 @@
 """Math helpers that calculate aggregated card statistics."""
 
-from .ratio import calculate_ratio, calculate_expected_grade  # noqa: F401
+from .ratio import calculate_ratio, calculate_expected_grade, calculate_row_statistics  # noqa: F401
@@ -61,3 +61,44 @@ def calculate_expected_grade(row_name: str, cards: CardMatrix, columns: list[str
     if total_weight == 0:
         return 0.0
     return weighted_sum / total_weight
+
+
+# Sums the positive card weights of one column.
+def _positive_weight_sum(card_list: List[CardDict]) -> float:
+    total = 0.0
+    for card in card_list:
+        try:
+            weight = float(card.get("weight", 100.0))
+        except (TypeError, ValueError):
+            weight = 100.0
+        if weight > 0:
+            total += weight
+    return total
+
+
+# Computes card count, ratio and expected grade together in a single pass over the row's cards.
+def calculate_row_statistics(row_name: str, cards: CardMatrix, columns: list[str]) -> tuple[int, float, float]:
+    if row_name not in cards:
+        return 0, 0.0, 0.0
+
+    row = cards[row_name]
+    total_cards = 0
+    sum_factors = 0.0
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for col in columns:
+        card_list = row[col]
+        total_cards += len(card_list)
+        try:
+            col_value = _effective_grade_value(float(col))
+        except (TypeError, ValueError):
+            continue
+        sum_factors += len(card_list) * ((5.0 - col_value) / 3.0)
+        # All cards of a column share its grade, so only the weights are summed per card.
+        column_weight = _positive_weight_sum(card_list) / 100.0
+        total_weight += column_weight
+        weighted_sum += col_value * column_weight
+
+    ratio = sum_factors / total_cards if total_cards else 0.0
+    expected_grade = weighted_sum / total_weight if total_weight else 0.0
+    return total_cards, ratio, expected_grade
@@ -2,19 +2,48 @@
 
 from __future__ import annotations
 
-import copy
+import hashlib
 import json
 import os
+import re
+import string
 import sys
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
-from tkinter import colorchooser, filedialog, messagebox, simpledialog, ttk
+from functools import lru_cache, partial
+from itertools import count
+from types import MappingProxyType
+from tkinter import font as tkfont, messagebox, ttk
 import tkinter as tk
 
-from cards import create_card, find_card, normalize_cards_tree
-from formula import calculate_ratio, calculate_expected_grade
-from table import generate_columns, interpolate_color, random_pastel_color
-from main import updater
+from cards import build_front_index, clone_card_columns, clone_table, create_card, empty_card_columns, find_card_index, intern_strings, normalize_cards_tree
+from formula import calculate_row_statistics
+from table import contrast_text_color, generate_columns, random_pastel_color
+from main.storage import (
+    JOURNAL_COMPACT_THRESHOLD,
+    append_journal_entry,
+    clone_json,
+    dump_json_bytes,
+    encode_json,
+    encode_snapshot,
+    journal_path_for,
+    list_snapshots,
+    load_json_bytes,
+    load_json_file,
+    migrate_bin_history_file,
+    read_journal,
+    read_snapshot,
+    snapshot_dir_for,
+    snapshot_name,
+    snapshot_timestamp,
+    write_file_atomic,
+    write_save_file,
+    write_snapshots,
+)
+from main.translations import TRANSLATIONS
 from main.runtime_paths import (
     APP_NAME,
     APP_VERSION,
@@ -33,8 +62,26 @@ from main.runtime_paths import (
 
 SAVE_FILE = ""
 
-THEMES = {
-    "dark": {
+REDRAW_COLUMNS = 1
+REDRAW_HEADER = 2
+REDRAW_ALL = 4
+
+REBUILD_NAV = 1
+REBUILD_TABLE = 2
+
+BIN_HISTORY_LIMIT = 100
+MAX_TABLE_ROWS = 9
+SAVE_DEBOUNCE_MS = 200
+PREVIEW_DEBOUNCE_MS = 50
+STATUS_MESSAGE_MS = 4000
+DRAG_MOTION_MS = 16
+DRAG_PREVIEW_DETAIL_MS = 300
+# One "front::back" card per ";"-separated entry; the first "::" separates front and back.
+CARD_LINE_PATTERN = re.compile(r"([^;]*?)(?:::([^;]*))?(?:;|$)")
+CARD_CANVAS_MIN_WIDTH = 260
+
+_THEMES = {
+    "dark": MappingProxyType({
         "APP_BG": "#070b16",
         "PANEL_BG": "#0f172a",
         "CONTENT_BG": "#0b1120",
@@ -44,8 +91,8 @@ THEMES = {
         "PRIMARY_ACCENT": "#38bdf8",
         "TEXT_PRIMARY": "#f1f5f9",
         "TEXT_MUTED": "#94a3b8",
-    },
-    "beige": {
+    }),
+    "beige": MappingProxyType({
         "APP_BG": "#fdfdfc",
         "PANEL_BG": "#f1f5fb",
         "CONTENT_BG": "#ffffff",
@@ -55,10 +102,12 @@ THEMES = {
         "PRIMARY_ACCENT": "#d64045",
         "TEXT_PRIMARY": "#1e2a3b",
         "TEXT_MUTED": "#55657a",
-    },
+    }),
 }
+# Read-only view; only the custom theme dialog registers a new entry in _THEMES.
+THEMES = MappingProxyType(_THEMES)
 
-THEME_KEYS = [
+THEME_KEYS = (
     "APP_BG",
     "PANEL_BG",
     "CONTENT_BG",
@@ -68,524 +117,182 @@ THEME_KEYS = [
     "PRIMARY_ACCENT",
     "TEXT_PRIMARY",
     "TEXT_MUTED",
-]
-
-APP_BG = THEMES["dark"]["APP_BG"]
-PANEL_BG = THEMES["dark"]["PANEL_BG"]
-CONTENT_BG = THEMES["dark"]["CONTENT_BG"]
-CARD_BG = THEMES["dark"]["CARD_BG"]
-CARD_BORDER = THEMES["dark"]["CARD_BORDER"]
-CARD_DELETE_BG = THEMES["dark"]["CARD_DELETE_BG"]
-PRIMARY_ACCENT = THEMES["dark"]["PRIMARY_ACCENT"]
-TEXT_PRIMARY = THEMES["dark"]["TEXT_PRIMARY"]
-TEXT_MUTED = THEMES["dark"]["TEXT_MUTED"]
-
-LANGUAGE_OPTIONS = {
+)
+
+
+class _ActiveTheme:
+    """Colors of the theme currently applied; updated in place by apply_theme."""
+
+    __slots__ = THEME_KEYS
+
+    def __init__(self, palette: Mapping[str, str]) -> None:
+        self.update(palette)
+
+    def update(self, palette: Mapping[str, str]) -> None:
+        for key in THEME_KEYS:
+            setattr(self, key, palette[key])
+
+
+THEME = _ActiveTheme(THEMES["dark"])
+
+
+def _tcl_word(value: object) -> str:
+    # Brace-quotes a value (tuples become Tcl lists); values with braces or backslashes are rejected.
+    if isinstance(value, (tuple, list)):
+        return "{" + " ".join(_tcl_word(item) for item in value) + "}"
+    text = str(value)
+    if "{" in text or "}" in text or "\\" in text:
+        raise ValueError(f"Wert kann nicht gebündelt werden: {text!r}")
+    return "{" + text + "}"
+
+
+class _StyleBatch:
+    """Collects ttk style configure/map calls and sends them to Tcl as one script."""
+
+    __slots__ = ("configures", "maps")
+
+    def __init__(self) -> None:
+        self.configures: list[tuple[str, dict[str, object]]] = []
+        self.maps: list[tuple[str, dict[str, list[tuple[str, ...]]]]] = []
+
+    def configure(self, style_name: str, **options: object) -> None:
+        self.configures.append((style_name, options))
+
+    def map(self, style_name: str, **options: list[tuple[str, ...]]) -> None:
+        self.maps.append((style_name, options))
+
+    def _script(self) -> str:
+        lines = []
+        for style_name, options in self.configures:
+            words = [f"-{option} {_tcl_word(value)}" for option, value in options.items()]
+            lines.append(f"ttk::style configure {_tcl_word(style_name)} {' '.join(words)}")
+        for style_name, options in self.maps:
+            words = []
+            for option, specs in options.items():
+                flat: list[object] = []
+                for spec in specs:
+                    flat.append(list(spec[:-1]))
+                    flat.append(spec[-1])
+                words.append(f"-{option} {_tcl_word(flat)}")
+            lines.append(f"ttk::style map {_tcl_word(style_name)} {' '.join(words)}")
+        return "\n".join(lines)
+
+    def apply(self, style: ttk.Style) -> None:
+        if not self.configures and not self.maps:
+            return
+        try:
+            style.tk.eval(self._script())
+            return
+        except (tk.TclError, ValueError):
+            pass
+        for style_name, options in self.configures:
+            style.configure(style_name, **options)
+        for style_name, options in self.maps:
+            style.map(style_name, **options)
+
+
+class _TreeInsertBatch:
+    """Queues Treeview inserts with client-side ids and sends them to Tcl as one script."""
+
+    __slots__ = ("items", "pending")
+
+    def __init__(self) -> None:
+        self.items: list[tuple[str, str, str, bool]] = []
+        self.pending: set[str] = set()
+
+    def add(self, parent: str, iid: str, text: str, is_open: bool) -> None:
+        self.items.append((parent, iid, text, is_open))
+        self.pending.add(iid)
+
+    def apply(self, tree: ttk.Treeview) -> None:
+        if not self.items:
+            return
+        items, self.items, self.pending = self.items, [], set()
+        try:
+            path = str(tree)
+            tree.tk.eval("\n".join(
+                f"{path} insert {_tcl_word(parent)} end -id {_tcl_word(iid)} -text {_tcl_word(text)} -open {int(is_open)}"
+                for parent, iid, text, is_open in items
+            ))
+            return
+        except (tk.TclError, ValueError):
+            pass
+        for parent, iid, text, is_open in items:
+            if not tree.exists(iid):
+                tree.insert(parent, "end", iid=iid, text=text, open=is_open)
+
+
+LANGUAGE_OPTIONS = MappingProxyType({
     "de": "Deutsch",
     "en": "English",
     "es": "Español",
     "fr": "Français",
     "sq": "Shqip",
-}
+})
 
-TRANSLATIONS: dict[str, dict[str, str]] = {
-    "app.subtitle": {
-        "de": "Wähle links Space und Tabelle, um Karten zu fokussieren.",
-        "en": "Choose a space and table on the left to focus your cards.",
-        "es": "Elige a la izquierda un espacio y una tabla para enfocarte en las tarjetas.",
-        "fr": "Choisissez à gauche un espace et une table pour vous concentrer sur les cartes.",
-        "sq": "Zgjidh në të majtë një hapësirë dhe tabelë për t'u fokusuar te kartat.",
-    },
-    "nav.collections": {
-        "de": "Sammlungen",
-        "en": "Collections",
-        "es": "Colecciones",
-        "fr": "Collections",
-        "sq": "Koleksione",
-    },
-    "menu.file": {
-        "de": "Datei",
-        "en": "File",
-        "es": "Archivo",
-        "fr": "Fichier",
-        "sq": "Skedar",
-    },
-    "menu.edit": {
-        "de": "Bearbeiten",
-        "en": "Edit",
-        "es": "Editar",
-        "fr": "Édition",
-        "sq": "Redakto",
-    },
-    "menu.space": {
-        "de": "Space",
-        "en": "Space",
-        "es": "Espacio",
-        "fr": "Espace",
-        "sq": "Hapësirë",
-    },
-    "menu.help": {
-        "de": "Hilfe",
-        "en": "Help",
-        "es": "Ayuda",
-        "fr": "Aide",
-        "sq": "Ndihmë",
-    },
-    "menu.language": {
-        "de": "Sprache",
-        "en": "Language",
-        "es": "Idioma",
-        "fr": "Langue",
-        "sq": "Gjuha",
-    },
-    "menu.actions": {
-        "de": "Aktionen",
-        "en": "Actions",
-        "es": "Acciones",
-        "fr": "Actions",
-        "sq": "Veprime",
-    },
-    "menu.file.save": {
-        "de": "Speichern",
-        "en": "Save",
-        "es": "Guardar",
-        "fr": "Enregistrer",
-        "sq": "Ruaj",
-    },
-    "menu.file.reload": {
-        "de": "Neu laden",
-        "en": "Reload",
-        "es": "Recargar",
-        "fr": "Recharger",
-        "sq": "Ringarko",
-    },
-    "menu.file.view_state": {
-        "de": "Status ansehen aus…",
-        "en": "View state from…",
-        "es": "Ver estado desde…",
-        "fr": "Afficher l'état depuis…",
-        "sq": "Shiko gjendjen nga…",
-    },
-    "menu.file.load_state": {
-        "de": "Status laden aus…",
-        "en": "Load state from…",
-        "es": "Cargar estado desde…",
-        "fr": "Charger l'état depuis…",
-        "sq": "Ngarko gjendjen nga…",
-    },
-    "menu.file.add_table": {
-        "de": "Tabelle hinzufügen (Strg+N)",
-        "en": "Add table (Ctrl+N)",
-        "es": "Añadir tabla (Ctrl+N)",
-        "fr": "Ajouter une table (Ctrl+N)",
-        "sq": "Shto tabelë (Ctrl+N)",
-    },
-    "menu.file.delete_table": {
-        "de": "Tabelle löschen",
-        "en": "Delete table",
-        "es": "Eliminar tabla",
-        "fr": "Supprimer la table",
-        "sq": "Fshi tabelën",
-    },
-    "menu.file.add_card": {
-        "de": "Karte hinzufügen (1–9)",
-        "en": "Add card (1–9)",
-        "es": "Añadir tarjeta (1–9)",
-        "fr": "Ajouter une carte (1–9)",
-        "sq": "Shto kartë (1–9)",
-    },
-    "menu.file.toggle_delete": {
-        "de": "Löschmodus umschalten (Strg+W)",
-        "en": "Toggle delete mode (Ctrl+W)",
-        "es": "Cambiar modo borrar (Ctrl+W)",
-        "fr": "Basculer le mode suppression (Ctrl+W)",
-        "sq": "Ndrysho modalitetin e fshirjes (Ctrl+W)",
-    },
-    "menu.file.cancel_action": {
-        "de": "Aktion abbrechen (Esc)",
-        "en": "Cancel action (Esc)",
-        "es": "Cancelar acción (Esc)",
-        "fr": "Annuler l'action (Esc)",
-        "sq": "Anulo veprimin (Esc)",
-    },
-    "menu.file.choose_folder": {
-        "de": "Speicherordner wählen…",
-        "en": "Choose save folder…",
-        "es": "Elegir carpeta de guardado…",
-        "fr": "Choisir le dossier de sauvegarde…",
-        "sq": "Zgjidh dosjen e ruajtjes…",
-    },
-    "menu.file.change_file": {
-        "de": "Speicherdatei ändern…",
-        "en": "Change save file…",
-        "es": "Cambiar archivo de guardado…",
-        "fr": "Changer le fichier de sauvegarde…",
-        "sq": "Ndrysho skedarin e ruajtjes…",
-    },
-    "menu.file.exit": {
-        "de": "Beenden",
-        "en": "Exit",
-        "es": "Salir",
-        "fr": "Quitter",
-        "sq": "Dalje",
-    },
-    "menu.edit.undo": {
-        "de": "Rückgängig (Strg+Z)",
-        "en": "Undo (Ctrl+Z)",
-        "es": "Deshacer (Ctrl+Z)",
-        "fr": "Annuler (Ctrl+Z)",
-        "sq": "Zhbëj (Ctrl+Z)",
-    },
-    "menu.edit.redo": {
-        "de": "Wiederholen (Strg+Shift+Z)",
-        "en": "Redo (Ctrl+Shift+Z)",
-        "es": "Rehacer (Ctrl+Shift+Z)",
-        "fr": "Rétablir (Ctrl+Shift+Z)",
-        "sq": "Ribëj (Ctrl+Shift+Z)",
-    },
-    "menu.space.new": {
-        "de": "Neuer Space (Strg+S)",
-        "en": "New space (Ctrl+S)",
-        "es": "Nuevo espacio (Ctrl+S)",
-        "fr": "Nouvel espace (Ctrl+S)",
-        "sq": "Hapësirë e re (Ctrl+S)",
-    },
-    "menu.space.load": {
-        "de": "Space laden…",
-        "en": "Load space…",
-        "es": "Cargar espacio…",
-        "fr": "Charger un espace…",
-        "sq": "Ngarko hapësirë…",
-    },
-    "menu.space.import_space": {
-        "de": "Space importieren…",
-        "en": "Import space…",
-        "es": "Importar espacio…",
-        "fr": "Importer un espace…",
-        "sq": "Importo hapësirë…",
-    },
-    "menu.space.export_space": {
-        "de": "Space exportieren…",
-        "en": "Export space…",
-        "es": "Exportar espacio…",
-        "fr": "Exporter un espace…",
-        "sq": "Eksporto hapësirë…",
-    },
-    "menu.space.import_cards": {
-        "de": "Karten importieren…",
-        "en": "Import cards…",
-        "es": "Importar tarjetas…",
-        "fr": "Importer des cartes…",
-        "sq": "Importo karta…",
-    },
-    "menu.space.import_short": {
-        "de": "Import",
-        "en": "Import",
-        "es": "Importar",
-        "fr": "Importer",
-        "sq": "Importo",
-    },
-    "menu.space.duplicate": {
-        "de": "Space duplizieren…",
-        "en": "Duplicate space…",
-        "es": "Duplicar espacio…",
-        "fr": "Dupliquer l'espace…",
-        "sq": "Dupliko hapësirën…",
-    },
-    "menu.space.transfer": {
-        "de": "Tabelle verschieben/kopieren…",
-        "en": "Move/copy table…",
-        "es": "Mover/copiar tabla…",
-        "fr": "Déplacer/copier la table…",
-        "sq": "Zhvendos/kopjo tabelën…",
-    },
-    "menu.space.delete": {
-        "de": "Space löschen…",
-        "en": "Delete space…",
-        "es": "Eliminar espacio…",
-        "fr": "Supprimer l'espace…",
-        "sq": "Fshi hapësirën…",
-    },
-    "menu.space.theme": {
-        "de": "Theme",
-        "en": "Theme",
-        "es": "Tema",
-        "fr": "Thème",
-        "sq": "Tema",
-    },
-    "menu.space.theme.dark": {
-        "de": "Dunkel",
-        "en": "Dark",
-        "es": "Oscuro",
-        "fr": "Sombre",
-        "sq": "I errët",
-    },
-    "menu.space.theme.beige": {
-        "de": "Beige",
-        "en": "Beige",
-        "es": "Beige",
-        "fr": "Beige",
-        "sq": "Bezhë",
-    },
-    "menu.space.theme.custom": {
-        "de": "Eigenes Theme…",
-        "en": "Custom theme…",
-        "es": "Tema personalizado…",
-        "fr": "Thème personnalisé…",
-        "sq": "Temë e personalizuar…",
-    },
-    "menu.help.check_updates": {
-        "de": "Auf Updates prüfen…",
-        "en": "Check for updates…",
-        "es": "Buscar actualizaciones…",
-        "fr": "Rechercher des mises à jour…",
-        "sq": "Kontrollo për përditësime…",
-    },
-    "menu.help.about": {
-        "de": "Über",
-        "en": "About",
-        "es": "Acerca de",
-        "fr": "À propos",
-        "sq": "Rreth",
-    },
-    "action.toggle_mark_mode": {
-        "de": "Markiermodus umschalten",
-        "en": "Toggle mark mode",
-        "es": "Cambiar modo marcado",
-        "fr": "Basculer le mode de marquage",
-        "sq": "Ndrysho modalitetin e shënimit",
-    },
-    "save_prompt.title": {
-        "de": "Speicherort wählen",
-        "en": "Choose storage location",
-        "es": "Elegir ubicación de guardado",
-        "fr": "Choisir l'emplacement de stockage",
-        "sq": "Zgjidh vendndodhjen e ruajtjes",
-    },
-    "save_prompt.body": {
-        "de": "Klausurmaster benötigt einen Speicherordner für Ihre Tabellen.\n\nMöchten Sie jetzt einen Ordner wählen? Andernfalls wird der Standardordner im Benutzerverzeichnis verwendet.",
-        "en": "Klausurmaster needs a folder to store your tables.\n\nDo you want to choose one now? Otherwise the default directory in your user profile will be used.",
-        "es": "Klausurmaster necesita una carpeta para guardar tus tablas.\n\n¿Quieres elegir una ahora? De lo contrario se usará la carpeta predeterminada de tu perfil.",
-        "fr": "Klausurmaster a besoin d'un dossier pour enregistrer vos tableaux.\n\nSouhaitez-vous en choisir un maintenant ? Sinon, le dossier par défaut de votre profil sera utilisé.",
-        "sq": "Klausurmaster ka nevojë për një dosje për të ruajtur tabelat tuaja.\n\nDëshiron të zgjedhësh tani një dosje? Përndryshe përdoret dosja standarde në profilin tënd.",
-    },
-    "save_prompt.default_title": {
-        "de": "Standard verwendet",
-        "en": "Default used",
-        "es": "Se usa el predeterminado",
-        "fr": "Emplacement par défaut",
-        "sq": "Është përdorur parazgjedhja",
-    },
-    "save_prompt.default_body": {
-        "de": "Es wird der Standardordner verwendet.",
-        "en": "The default folder will be used.",
-        "es": "Se usará la carpeta predeterminada.",
-        "fr": "Le dossier par défaut sera utilisé.",
-        "sq": "Do të përdoret dosja e parazgjedhur.",
-    },
-    "save_prompt.option_custom": {
-        "de": "Eigenen Ordner wählen",
-        "en": "Choose custom folder",
-        "es": "Elegir carpeta personalizada",
-        "fr": "Choisir un dossier personnalisé",
-        "sq": "Zgjidh dosje të personalizuar",
-    },
-    "save_prompt.option_default": {
-        "de": "Standard verwenden",
-        "en": "Use default",
-        "es": "Usar predeterminado",
-        "fr": "Utiliser par défaut",
-        "sq": "Përdor parazgjedhjen",
-    },
-    "save_prompt.option_existing": {
-        "de": "Bestehende Daten suchen",
-        "en": "Locate existing data",
-        "es": "Buscar datos existentes",
-        "fr": "Rechercher des données existantes",
-        "sq": "Gjej të dhëna ekzistuese",
-    },
-    "save_prompt.locate_save_title": {
-        "de": "Tabellenspeicher-Datei auswählen",
-        "en": "Select table storage file",
-        "es": "Selecciona el archivo de tablas",
-        "fr": "Sélectionner le fichier des tableaux",
-        "sq": "Zgjidh skedarin e tabelave",
-    },
-    "save_prompt.locate_bin_title": {
-        "de": "Versionshistorie-Datei auswählen",
-        "en": "Select history file",
-        "es": "Selecciona el archivo de historial",
-        "fr": "Sélectionner le fichier d'historique",
-        "sq": "Zgjidh skedarin e historikut",
-    },
-    "save_prompt.existing_cancelled_title": {
-        "de": "Suche abgebrochen",
-        "en": "Search canceled",
-        "es": "Búsqueda cancelada",
-        "fr": "Recherche annulée",
-        "sq": "Kërkimi u anulua",
-    },
-    "save_prompt.existing_cancelled_body": {
-        "de": "Es wurden keine Dateien gewählt. Der Standardordner wird verwendet.",
-        "en": "No files were selected. The default folder will be used.",
-        "es": "No se seleccionaron archivos. Se usará la carpeta predeterminada.",
-        "fr": "Aucun fichier sélectionné. Le dossier par défaut sera utilisé.",
-        "sq": "Nuk u zgjodhën skedarë. Do të përdoret dosja e parazgjedhur.",
-    },
-    "save_prompt.existing_success_title": {
-        "de": "Daten gefunden",
-        "en": "Data linked",
-        "es": "Datos vinculados",
-        "fr": "Données liées",
-        "sq": "Të dhënat u lidhën",
-    },
-    "save_prompt.existing_success_body": {
-        "de": "Tabellen: {save}\nHistorie: {bin}",
-        "en": "Tables: {save}\nHistory: {bin}",
-        "es": "Tablas: {save}\nHistorial: {bin}",
-        "fr": "Tables : {save}\nHistorique : {bin}",
-        "sq": "Tabela: {save}\nHistoria: {bin}",
-    },
-    "status.current_path": {
-        "de": "Aktueller Speicherpfad: {path}",
-        "en": "Current save path: {path}",
-        "es": "Ruta de guardado actual: {path}",
-        "fr": "Chemin d'enregistrement actuel : {path}",
-        "sq": "Shtegu aktual i ruajtjes: {path}",
-    },
-    "choose_directory.success_title": {
-        "de": "Erfolg",
-        "en": "Success",
-        "es": "Éxito",
-        "fr": "Succès",
-        "sq": "Sukses",
-    },
-    "choose_directory.success_body": {
-        "de": "Speicherpfad gesetzt auf:\n{path}",
-        "en": "Save path set to:\n{path}",
-        "es": "Ruta de guardado establecida en:\n{path}",
-        "fr": "Chemin d'enregistrement défini sur :\n{path}",
-        "sq": "Shtegu i ruajtjes u vendos në:\n{path}",
-    },
-    "change_save.option_title": {
-        "de": "Speicheroption",
-        "en": "Storage option",
-        "es": "Opción de guardado",
-        "fr": "Option de stockage",
-        "sq": "Opsioni i ruajtjes",
-    },
-    "change_save.option_question": {
-        "de": "Möchten Sie eine neue JSON-Datei erstellen oder eine bestehende Datei laden?",
-        "en": "Do you want to create a new JSON file or load an existing one?",
-        "es": "¿Quieres crear un archivo JSON nuevo o cargar uno existente?",
-        "fr": "Souhaitez-vous créer un nouveau fichier JSON ou en charger un existant ?",
-        "sq": "Dëshiron të krijosh një skedar të ri JSON apo të ngarkosh një ekzistues?",
-    },
-    "change_save.new_dialog_title": {
-        "de": "Neuen Speicherort für die JSON-Datei wählen",
-        "en": "Choose a new location for the JSON file",
-        "es": "Elige una nueva ubicación para el archivo JSON",
-        "fr": "Choisir un nouvel emplacement pour le fichier JSON",
-        "sq": "Zgjidh një vendndodhje të re për skedarin JSON",
-    },
-    "change_save.existing_dialog_title": {
-        "de": "Vorhandene JSON-Datei auswählen",
-        "en": "Select an existing JSON file",
-        "es": "Selecciona un archivo JSON existente",
-        "fr": "Sélectionner un fichier JSON existant",
-        "sq": "Zgjidh një skedar ekzistues JSON",
-    },
-    "change_save.no_change": {
-        "de": "Keine Änderung vorgenommen.",
-        "en": "No changes were made.",
-        "es": "No se realizaron cambios.",
-        "fr": "Aucun changement effectué.",
-        "sq": "Asnjë ndryshim nuk u bë.",
-    },
-    "update.available.title": {
-        "de": "Update verfügbar",
-        "en": "Update available",
-        "es": "Actualización disponible",
-        "fr": "Mise à jour disponible",
-        "sq": "Përditësim i disponueshëm",
-    },
-    "update.available.body": {
-        "de": "Version {version} ist verfügbar. Installer herunterladen und starten? Deine gespeicherten Tabellen bleiben erhalten.\n\nHinweise:\n{notes}",
-        "en": "Version {version} is available. Download and launch the installer? Your saved tables stay untouched.\n\nNotes:\n{notes}",
-        "es": "La versión {version} está disponible. ¿Descargar e iniciar el instalador? Tus tablas guardadas no se tocan.\n\nNotas:\n{notes}",
-        "fr": "La version {version} est disponible. Télécharger et lancer l'installateur ? Vos tableaux enregistrés restent inchangés.\n\nNotes :\n{notes}",
-        "sq": "Versioni {version} është gati. Ta shkarkoj dhe nis instaluesin? Tabelat e ruajtura mbeten të paprekura.\n\nShënime:\n{notes}",
-    },
-    "update.no_notes": {
-        "de": "Keine zusätzlichen Hinweise.",
-        "en": "No additional notes.",
-        "es": "Sin notas adicionales.",
-        "fr": "Aucune note supplémentaire.",
-        "sq": "Pa shënime shtesë.",
-    },
-    "update.asset.missing": {
-        "de": "Für dieses Betriebssystem wurde kein Installationspaket gefunden.",
-        "en": "No installer asset was found for this operating system.",
-        "es": "No se encontró un instalador para este sistema operativo.",
-        "fr": "Aucun installateur n'a été trouvé pour ce système.",
-        "sq": "Nuk u gjet instalues për këtë sistem.",
-    },
-    "update.up_to_date": {
-        "de": "Sie verwenden bereits Version {version}.",
-        "en": "You're already running version {version}.",
-        "es": "Ya usas la versión {version}.",
-        "fr": "Vous utilisez déjà la version {version}.",
-        "sq": "Po përdor tashmë versionin {version}.",
-    },
-    "update.error.title": {
-        "de": "Update fehlgeschlagen",
-        "en": "Update failed",
-        "es": "Actualización fallida",
-        "fr": "Échec de la mise à jour",
-        "sq": "Përditësimi dështoi",
-    },
-    "update.error.generic": {
-        "de": "Fehler: {error}",
-        "en": "Error: {error}",
-        "es": "Error: {error}",
-        "fr": "Erreur : {error}",
-        "sq": "Gabim: {error}",
-    },
-    "update.error.no_version": {
-        "de": "Im Release wurde keine Version gefunden.",
-        "en": "No version value was found in the release metadata.",
-        "es": "No se encontró ninguna versión en los metadatos de la publicación.",
-        "fr": "Aucune version n'a été trouvée dans la publication.",
-        "sq": "Nuk u gjet version në publikim.",
-    },
-    "update.download.success.title": {
-        "de": "Installer bereit",
-        "en": "Installer ready",
-        "es": "Instalador listo",
-        "fr": "Programme d'installation prêt",
-        "sq": "Instaluesi gati",
-    },
-    "update.download.success.body": {
-        "de": "Der Installer befindet sich unter:\n{path}\nEr startet jetzt; schließe die App danach, damit die Installation abschließen kann.",
-        "en": "The installer was saved to:\n{path}\nIt will launch now; close the app afterward to let it finish.",
-        "es": "El instalador se guardó en:\n{path}\nSe iniciará ahora; cierra la app después para completar la instalación.",
-        "fr": "L'installateur a été enregistré ici :\n{path}\nIl va se lancer maintenant ; fermez l'app ensuite pour terminer.",
-        "sq": "Instaluesi u ruajt te:\n{path}\nDo të niset tani; mbylle aplikacionin më pas që të përfundojë.",
-    },
-}
+
+def _flatten_translations() -> dict[tuple[str, str], str]:
+    # Resolves the language fallbacks once so a lookup is a single (key, language) probe.
+    # Keys and language codes are interned so the tuple hash/compare short-circuits on identity.
+    flat: dict[tuple[str, str], str] = {}
+    for key, values in TRANSLATIONS.items():
+        if not values:
+            continue
+        key = sys.intern(key)
+        fallback = values.get(DEFAULT_LANGUAGE) or next(iter(values.values()))
+        for language in LANGUAGE_OPTIONS:
+            flat[(key, sys.intern(language))] = values.get(language) or fallback
+    return flat
+
+
+_TR_FLAT = _flatten_translations()
+
+
+def _lookup_translation(key: str, language: str) -> str:
+    text = _TR_FLAT.get((key, language))
+    if text is None:
+        text = _TR_FLAT.get((key, DEFAULT_LANGUAGE), key)
+    return text
+
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=None)
+def _parsed_template(key: str, language: str) -> tuple[tuple[str, str | None, str, str | None], ...] | None:
+    # Splits a template once; None marks templates that need the full str.format machinery.
+    try:
+        parts = tuple(_FORMATTER.parse(_lookup_translation(key, language)))
+    except ValueError:
+        return None
+    for _literal, field, spec, _conversion in parts:
+        if field is not None and (not field.isidentifier() or "{" in spec):
+            return None
+    return parts
+
+
+def translate_format(key: str, language: str, mapping: Mapping[str, object]) -> str:
+    parts = _parsed_template(key, language)
+    if parts is None:
+        return _lookup_translation(key, language).format_map(mapping)
+    pieces = []
+    for literal, field, spec, conversion in parts:
+        pieces.append(literal)
+        if field is not None:
+            value = mapping[field]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            pieces.append(format(value, spec))
+    return "".join(pieces)
 
 
 def translate_text(key: str, language: str, **kwargs) -> str:
-    values = TRANSLATIONS.get(key)
-    if not values:
-        return key
-    text = values.get(language) or values.get(DEFAULT_LANGUAGE) or next(iter(values.values()))
     if kwargs:
         try:
-            return text.format(**kwargs)
+            return translate_format(key, language, kwargs)
         except (KeyError, ValueError):
-            return text
-    return text
+            return _lookup_translation(key, language)
+    return _lookup_translation(key, language)
 
 
 def _show_initial_save_choice_dialog(root: tk.Misc, language_code: str) -> str:
@@ -631,6 +338,7 @@ def _show_initial_save_choice_dialog(root: tk.Misc, language_code: str) -> str:
 
 
 def _locate_existing_save_files(root: tk.Misc, language_code: str) -> tuple[str, str] | None:
+    from tkinter import filedialog
     save_path = filedialog.askopenfilename(
         parent=root,
         title=translate_text("save_prompt.locate_save_title", language_code),
@@ -656,8 +364,9 @@ def ensure_save_path_initialized(root: tk.Misc | None = None) -> None:
     global SAVE_FILE
     if SAVE_FILE:
         return
+    from tkinter import filedialog
 
-    config_exists = get_user_config_path().exists()
+    config_exists = get_user_config_path().is_file()
     env_override = os.environ.get("KLAUSURMASTER_SAVE_FILE")
     language_code = load_user_language()
 
@@ -715,15 +424,98 @@ def ensure_save_path_initialized(root: tk.Misc | None = None) -> None:
 
 
 class CardApp:
+    __slots__ = (
+        "root",
+        "language",
+        "language_var",
+        "_icon_images",
+        "_fonts",
+        "theme_name",
+        "data",
+        "delete_mode",
+        "moving_card",
+        "mark_mode",
+        "selected_row_name",
+        "tree_nodes",
+        "tree_row_lookup",
+        "_nav_cache",
+        "_row_stats",
+        "_save_executor",
+        "_nav_items",
+        "_nav_batch",
+        "_nav_ids",
+        "column_frames",
+        "card_columns",
+        "_card_button_size",
+        "_note_icons",
+        "_bin_path_cache",
+        "_card_prompt",
+        "_window_title_table",
+        "_card_sync_pending",
+        "_front_indexes",
+        "drag_data",
+        "drag_preview",
+        "_drag_preview_parts",
+        "_preview_last_xy",
+        "_preview_detail_after_id",
+        "current_highlighted_column",
+        "_motion_after_id",
+        "_last_motion_xy",
+        "_hover_target",
+        "_column_bounds",
+        "row_header_widgets",
+        "_table_layout_key",
+        "card_weight_step",
+        "card_weight_min",
+        "card_weight_max",
+        "history",
+        "future",
+        "max_history",
+        "bin_history",
+        "_bin_history_loaded",
+        "_journal_length",
+        "_saved_digest",
+        "_save_after_id",
+        "active_dialogs",
+        "custom_theme",
+        "_applied_theme",
+        "_pending_theme_refresh",
+        "_rebuild_scope",
+        "_dirty_columns",
+        "_actions_menu_spec",
+        "_menu_entries",
+        "_ui_transition_depth",
+        "style",
+        "primary_accent",
+        "menubar",
+        "main_frame",
+        "toolbar",
+        "toolbar_title_label",
+        "toolbar_subtitle_label",
+        "nav_frame",
+        "nav_title_label",
+        "navigation_tree",
+        "content_frame",
+        "canvas",
+        "v_scrollbar",
+        "h_scrollbar",
+        "table",
+        "canvas_window",
+        "file_path_label",
+        "_status_after_id",
+        "_quiet",
+    )
+
     def __init__(self, root: tk.Tk):
         # Initializes widgets, state, and loads persisted data.
         self.root = root
         self.root.title(f"{APP_NAME} {APP_VERSION}")
         self.root.geometry("1400x820")
         self.root.minsize(960, 640)
-        self.language = load_user_language()
+        self.language = sys.intern(str(load_user_language()))
         self.language_var = tk.StringVar(master=self.root, value=self.language)
         self._icon_images: list[tk.PhotoImage] = []
+        self._fonts: dict[tuple[int, str], tkfont.Font] = {}
         self._set_window_icon()
 
         self.theme_name = "dark"
@@ -734,31 +526,71 @@ class CardApp:
         self.selected_row_name: str | None = None
         self.tree_nodes: dict[tuple[str, ...], str] = {}
         self.tree_row_lookup: dict[str, tuple[str, ...]] = {}
+        self._nav_cache: dict[str, tuple[int, str]] = {}
+        self._row_stats: dict[tuple[str, str], tuple[int, float, float]] = {}
+        # A single worker keeps file writes in submission order while the UI thread stays free.
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._nav_items: dict[str, str] = {}
+        self._nav_batch = _TreeInsertBatch()
+        self._nav_ids = count(1)
         self.column_frames: list[tk.Frame] = []
-        self.card_columns: dict[tuple[str, str], tk.Frame] = {}
+        self.card_columns: dict[tuple[str, str], tk.Canvas] = {}
+        self._card_button_size: tuple[int, int] | None = None
+        self._note_icons: dict[str, tk.PhotoImage] = {}
+        self._bin_path_cache: tuple[str, str] | None = None
+        self._card_prompt: dict[str, object] | None = None
+        self._window_title_table: str | None = None
+        self._card_sync_pending = False
+        self._front_indexes: dict[tuple[str, str], tuple[list[dict], int, dict[str, int]]] = {}
         self.drag_data: dict | None = None
         self.drag_preview: tk.Toplevel | None = None
+        self._drag_preview_parts: dict[str, tk.Widget] | None = None
+        self._preview_last_xy: tuple[int, int] | None = None
+        self._preview_detail_after_id: str | None = None
         self.current_highlighted_column: tk.Frame | None = None
+        self._motion_after_id: str | None = None
+        self._last_motion_xy: tuple[int, int] = (0, 0)
+        self._hover_target: tuple[int, int, tk.Frame | None] | None = None
+        self._column_bounds: list[tuple[int, int, int, int, tk.Frame]] | None = None
         self.row_header_widgets: dict[str, tk.Widget] = {}
+        self._table_layout_key: tuple | None = None
         self.card_weight_step = 10.0
         self.card_weight_min = 10.0
         self.card_weight_max = 200.0
-        self.history: list[dict] = []
-        self.future: list[dict] = []
         self.max_history = 7
-        self.bin_history: list[dict] = []
+        self.history: deque[dict | tuple] = deque(maxlen=self.max_history)
+        self.future: deque[dict | tuple] = deque(maxlen=self.max_history)
+        self.bin_history: deque[dict] = deque(maxlen=BIN_HISTORY_LIMIT)
+        self._bin_history_loaded = False
+        self._journal_length = 0
+        self._saved_digest: tuple[str, bytes] | None = None
+        self._save_after_id: str | None = None
         self.active_dialogs: list[tk.Toplevel] = []
-        self.custom_theme = copy.deepcopy(THEMES.get("beige", THEMES["dark"]))
+        self.custom_theme = dict(THEMES.get("beige", THEMES["dark"]))
+        self._applied_theme: dict[str, str] = {}
+        self._pending_theme_refresh = False
+        self._rebuild_scope = 0
+        self._dirty_columns: set[tuple[str, str]] = set()
+        self._actions_menu_spec: tuple[tuple[str, str, object], ...] | None = None
+        self._menu_entries: list[list] = []
         self._ui_transition_depth = 0
+        # Built later by build_main_layout; theme and language refreshes skip them until then.
+        self.toolbar_subtitle_label: ttk.Label | None = None
+        self.nav_title_label: ttk.Label | None = None
+        self.file_path_label: tk.Label | None = None
+        self._status_after_id: str | None = None
+        self._quiet = False
+        self.navigation_tree: ttk.Treeview | None = None
 
         self.style = ttk.Style()
-        self.primary_accent = PRIMARY_ACCENT
+        self.primary_accent = THEME.PRIMARY_ACCENT
         self.configure_styles()
         self.build_main_layout()
         self.build_menu()
         self.update_file_path_label()
 
-        self.bin_history = self.load_binary_history()
+        # The version history is only needed by the history dialogs and on exit, so it loads after first paint.
+        self.root.after_idle(self._ensure_bin_history)
         self.load_data_or_create_new_table()
         self.bind_shortcuts()
         self.root.protocol("WM_DELETE_WINDOW", self.handle_exit_request)
@@ -772,68 +604,109 @@ class CardApp:
         self.apply_theme(self.theme_name, initial=True)
 
     def apply_theme(self, theme_name: str, initial: bool = False):
+        theme = THEMES.get(theme_name, THEMES["dark"])
+        self.theme_name = theme_name
+        # Only styles that read a changed color are reconfigured, and all of them go to Tcl in one batch.
+        changed = {key for key, value in theme.items() if self._applied_theme.get(key) != value}
+        if not changed and not initial:
+            return
         with self.smooth_state_transition():
-            theme = THEMES.get(theme_name, THEMES["dark"])
-            self.theme_name = theme_name
-
-            global APP_BG, PANEL_BG, CONTENT_BG, CARD_BG, CARD_BORDER, CARD_DELETE_BG, PRIMARY_ACCENT, TEXT_PRIMARY, TEXT_MUTED
-            APP_BG = theme["APP_BG"]
-            PANEL_BG = theme["PANEL_BG"]
-            CONTENT_BG = theme["CONTENT_BG"]
-            CARD_BG = theme["CARD_BG"]
-            CARD_BORDER = theme["CARD_BORDER"]
-            CARD_DELETE_BG = theme["CARD_DELETE_BG"]
-            PRIMARY_ACCENT = theme["PRIMARY_ACCENT"]
-            TEXT_PRIMARY = theme["TEXT_PRIMARY"]
-            TEXT_MUTED = theme["TEXT_MUTED"]
-
-            self.primary_accent = PRIMARY_ACCENT
-            self.root.configure(bg=APP_BG)
-
-            self.style.configure("App.TFrame", background=APP_BG)
-            self.style.configure("Toolbar.TFrame", background=APP_BG)
-            self.style.configure("Nav.TFrame", background=APP_BG)
-            self.style.configure("Content.TFrame", background=APP_BG)
-            self.style.configure("Controls.TFrame", background=APP_BG)
-            self.style.configure("Board.TFrame", background=CONTENT_BG)
-            self.style.configure("Title.TLabel", font=("Segoe UI", 18, "bold"), foreground=TEXT_PRIMARY, background=APP_BG)
-            self.style.configure("Subtitle.TLabel", font=("Segoe UI", 11), foreground=TEXT_MUTED, background=APP_BG)
-            self.style.configure("Placeholder.TFrame", background=CONTENT_BG)
-            self.style.configure("PlaceholderTitle.TLabel", font=("Segoe UI", 16, "bold"), foreground=TEXT_PRIMARY, background=CONTENT_BG)
-            self.style.configure("PlaceholderBody.TLabel", font=("Segoe UI", 11), foreground=TEXT_MUTED, background=CONTENT_BG)
-            self.style.configure("Primary.TButton", font=("Segoe UI", 10, "bold"), foreground="#04111f", padding=(12, 6))
-            self.style.map(
-                "Primary.TButton",
-                background=[("pressed", PRIMARY_ACCENT), ("active", PRIMARY_ACCENT), ("!disabled", PRIMARY_ACCENT)],
-            )
-            self.style.configure("Secondary.TButton", font=("Segoe UI", 10), padding=(10, 6), foreground=TEXT_PRIMARY)
-            self.style.map(
-                "Secondary.TButton",
-                background=[("pressed", PANEL_BG), ("active", PANEL_BG), ("!disabled", PANEL_BG)],
-                foreground=[("disabled", TEXT_MUTED), ("!disabled", TEXT_PRIMARY)],
-            )
+            THEME.update(theme)
+
+            self.primary_accent = THEME.PRIMARY_ACCENT
+            batch = _StyleBatch()
+
+            if "APP_BG" in changed:
+                self.root.configure(bg=THEME.APP_BG)
+                batch.configure("App.TFrame", background=THEME.APP_BG)
+                batch.configure("Toolbar.TFrame", background=THEME.APP_BG)
+                batch.configure("Nav.TFrame", background=THEME.APP_BG)
+                batch.configure("Content.TFrame", background=THEME.APP_BG)
+                batch.configure("Controls.TFrame", background=THEME.APP_BG)
+            if "CONTENT_BG" in changed:
+                batch.configure("Board.TFrame", background=THEME.CONTENT_BG)
+                batch.configure("Placeholder.TFrame", background=THEME.CONTENT_BG)
+            if changed & {"APP_BG", "TEXT_PRIMARY"}:
+                batch.configure("Title.TLabel", font=("Segoe UI", 18, "bold"), foreground=THEME.TEXT_PRIMARY, background=THEME.APP_BG)
+            if changed & {"APP_BG", "TEXT_MUTED"}:
+                batch.configure("Subtitle.TLabel", font=("Segoe UI", 11), foreground=THEME.TEXT_MUTED, background=THEME.APP_BG)
+            if changed & {"CONTENT_BG", "TEXT_PRIMARY"}:
+                batch.configure("PlaceholderTitle.TLabel", font=("Segoe UI", 16, "bold"), foreground=THEME.TEXT_PRIMARY, background=THEME.CONTENT_BG)
+            if changed & {"CONTENT_BG", "TEXT_MUTED"}:
+                batch.configure("PlaceholderBody.TLabel", font=("Segoe UI", 11), foreground=THEME.TEXT_MUTED, background=THEME.CONTENT_BG)
+            if initial:
+                batch.configure("Primary.TButton", font=("Segoe UI", 10, "bold"), foreground="#04111f", padding=(12, 6))
+            if "PRIMARY_ACCENT" in changed:
+                batch.map(
+                    "Primary.TButton",
+                    background=[("pressed", THEME.PRIMARY_ACCENT), ("active", THEME.PRIMARY_ACCENT), ("!disabled", THEME.PRIMARY_ACCENT)],
+                )
+            if "TEXT_PRIMARY" in changed:
+                batch.configure("Secondary.TButton", font=("Segoe UI", 10), padding=(10, 6), foreground=THEME.TEXT_PRIMARY)
+            if changed & {"PANEL_BG", "TEXT_MUTED", "TEXT_PRIMARY"}:
+                batch.map(
+                    "Secondary.TButton",
+                    background=[("pressed", THEME.PANEL_BG), ("active", THEME.PANEL_BG), ("!disabled", THEME.PANEL_BG)],
+                    foreground=[("disabled", THEME.TEXT_MUTED), ("!disabled", THEME.TEXT_PRIMARY)],
+                )
 
-            self.style.configure(
-                "Navigation.Treeview",
-                rowheight=28,
-                background=PANEL_BG,
-                fieldbackground=PANEL_BG,
-                foreground=TEXT_PRIMARY,
-                borderwidth=0,
-            )
-            self.style.map(
-                "Navigation.Treeview",
-                background=[("selected", PRIMARY_ACCENT)],
-                foreground=[("selected", "#ffffff")],
-            )
+            if changed & {"PANEL_BG", "TEXT_PRIMARY"}:
+                batch.configure(
+                    "Navigation.Treeview",
+                    rowheight=28,
+                    background=THEME.PANEL_BG,
+                    fieldbackground=THEME.PANEL_BG,
+                    foreground=THEME.TEXT_PRIMARY,
+                    borderwidth=0,
+                )
+            if "PRIMARY_ACCENT" in changed:
+                batch.map(
+                    "Navigation.Treeview",
+                    background=[("selected", THEME.PRIMARY_ACCENT)],
+                    foreground=[("selected", "#ffffff")],
+                )
 
-            self.style.configure("TScrollbar", troughcolor=PANEL_BG, background=CARD_BORDER)
+            if changed & {"PANEL_BG", "CARD_BORDER"}:
+                batch.configure("TScrollbar", troughcolor=THEME.PANEL_BG, background=THEME.CARD_BORDER)
+            batch.apply(self.style)
             self._style_file_path_label()
+            self._applied_theme = dict(theme)
 
             if not initial:
                 self.update_file_path_label()
-                self.build_navigation_tree()
-                self.update_table()
+                # Bursts of theme changes (e.g. repeated "Anwenden") share one board rebuild.
+                if not self._pending_theme_refresh:
+                    self._pending_theme_refresh = True
+                    self.root.after(50, self._run_theme_refresh)
+
+    def _request_rebuild(self, scope: int = REBUILD_NAV | REBUILD_TABLE):
+        # Mutations only mark what they made dirty; one idle pass rebuilds the union of those parts.
+        if not self._rebuild_scope and not self._dirty_columns:
+            self.root.after_idle(self._flush_rebuild)
+        self._rebuild_scope |= scope
+
+    def _request_column_refresh(self, *columns: tuple[str, str]):
+        # Single-column changes are redrawn in the same idle pass, unless a full table rebuild is already due.
+        if not self._rebuild_scope and not self._dirty_columns:
+            self.root.after_idle(self._flush_rebuild)
+        self._dirty_columns.update(columns)
+
+    def _flush_rebuild(self):
+        scope, self._rebuild_scope = self._rebuild_scope, 0
+        columns, self._dirty_columns = self._dirty_columns, set()
+        if scope & REBUILD_NAV:
+            self.build_navigation_tree()
+        if columns and not scope & REBUILD_TABLE:
+            updated = [self.refresh_card_column(row_name, col_name) for row_name, col_name in columns]
+            if not any(updated):
+                scope |= REBUILD_TABLE
+        if scope & REBUILD_TABLE:
+            self.update_table()
+
+    def _run_theme_refresh(self):
+        self._pending_theme_refresh = False
+        self._table_layout_key = None
+        self._request_rebuild()
 
     def tr(self, key: str, **kwargs) -> str:
         return translate_text(key, self.language, **kwargs)
@@ -841,17 +714,17 @@ class CardApp:
     def change_language(self, language_code: str) -> None:
         if language_code not in LANGUAGE_OPTIONS:
             return
-        self.language = persist_user_language(language_code)
+        self.language = sys.intern(persist_user_language(language_code))
         if self.language_var.get() != language_code:
             self.language_var.set(language_code)
-        self.build_menu()
+        self.refresh_menu_labels()
         self.refresh_language_labels()
         self.update_file_path_label()
 
     def refresh_language_labels(self) -> None:
-        if hasattr(self, "toolbar_subtitle_label"):
+        if self.toolbar_subtitle_label is not None:
             self.toolbar_subtitle_label.config(text=self.tr("app.subtitle"))
-        if hasattr(self, "nav_title_label"):
+        if self.nav_title_label is not None:
             self.nav_title_label.config(text=self.tr("nav.collections"))
 
     def _normalize_hex_color(self, value: str) -> str:
@@ -869,35 +742,33 @@ class CardApp:
         return candidate.lower()
 
     def show_custom_theme_dialog(self):
+        from tkinter import colorchooser
         dialog = tk.Toplevel(self.root)
         dialog.title("Eigenes Theme")
         dialog.resizable(False, False)
         self.register_dialog(dialog)
 
-        current_values = {key: self.custom_theme.get(key, THEMES[self.theme_name].get(key, "#ffffff")) for key in THEME_KEYS}
+        fallback_theme = THEMES[self.theme_name]
+        current_values = tuple((key, self.custom_theme.get(key, fallback_theme.get(key, "#ffffff"))) for key in THEME_KEYS)
         vars_by_key: dict[str, tk.StringVar] = {}
 
         ttk.Label(dialog, text="Wähle individuelle Farben für die Oberfläche.", style="Subtitle.TLabel").pack(padx=16, pady=(16, 8), anchor=tk.W)
 
-        for key in THEME_KEYS:
+        def _pick_color(target_key: str):
+            initial = vars_by_key[target_key].get()
+            rgb, hex_value = colorchooser.askcolor(color=initial or "#ffffff", parent=dialog)
+            if hex_value:
+                vars_by_key[target_key].set(hex_value)
+
+        for key, initial in current_values:
             row = ttk.Frame(dialog)
             row.pack(fill=tk.X, padx=16, pady=4)
-            label_text = key.replace("_", " ")
-            ttk.Label(row, text=label_text).pack(side=tk.LEFT)
-            var = tk.StringVar(value=current_values.get(key, "#ffffff"))
+            ttk.Label(row, text=key.replace("_", " ")).pack(side=tk.LEFT)
+            var = tk.StringVar(value=initial)
             vars_by_key[key] = var
             entry = ttk.Entry(row, textvariable=var, width=12)
             entry.pack(side=tk.LEFT, padx=(8, 8))
-
-            def make_picker(target_key: str):
-                def _pick_color():
-                    initial = vars_by_key[target_key].get()
-                    rgb, hex_value = colorchooser.askcolor(color=initial or "#ffffff", parent=dialog)
-                    if hex_value:
-                        vars_by_key[target_key].set(hex_value)
-                return _pick_color
-
-            ttk.Button(row, text="Farbe wählen", command=make_picker(key)).pack(side=tk.LEFT)
+            ttk.Button(row, text="Farbe wählen", command=lambda k=key: _pick_color(k)).pack(side=tk.LEFT)
 
         status_var = tk.StringVar()
         ttk.Label(dialog, textvariable=status_var, foreground="red").pack(padx=16, pady=(8, 0), anchor=tk.W)
@@ -915,7 +786,7 @@ class CardApp:
                 return
 
             self.custom_theme = new_theme
-            THEMES["custom"] = new_theme
+            _THEMES["custom"] = MappingProxyType(dict(new_theme))
             status_var.set("Benutzerdefiniertes Theme aktiv.")
             self.apply_theme("custom")
             if close_after:
@@ -926,8 +797,8 @@ class CardApp:
         ttk.Button(button_frame, text="Speichern & schließen", command=lambda: apply_custom_theme(True)).pack(side=tk.RIGHT)
 
     def _style_file_path_label(self):
-        if hasattr(self, "file_path_label"):
-            self.file_path_label.config(bg=PANEL_BG, fg=TEXT_MUTED)
+        if self.file_path_label is not None:
+            self.file_path_label.config(bg=THEME.PANEL_BG, fg=THEME.TEXT_MUTED)
 
     def build_main_layout(self):
         self.main_frame = ttk.Frame(self.root, padding=0, style="App.TFrame")
@@ -951,53 +822,64 @@ class CardApp:
 
     def build_menu(self):
         self.menubar = tk.Menu(self.root)
+        self._menu_entries = []
 
         file_menu = tk.Menu(self.menubar, tearoff=0)
-        file_menu.add_command(label=self.tr("menu.file.save"), command=self.save_data)
-        file_menu.add_command(label=self.tr("menu.file.reload"), command=self.load_data_or_create_new_table)
-        file_menu.add_separator()
-        file_menu.add_command(label=self.tr("menu.space.new"), command=self.new_table)
-        file_menu.add_command(label=self.tr("menu.space.load"), command=self.load_table_via_menu)
-        file_menu.add_separator()
-        file_menu.add_command(label=self.tr("menu.space.import_space"), command=self.import_table_from_file)
-        file_menu.add_command(label=self.tr("menu.space.export_space"), command=self.export_current_table)
-        file_menu.add_command(label=self.tr("menu.space.import_cards"), command=self.import_cards_via_text)
-        file_menu.add_separator()
-        file_menu.add_command(label=self.tr("menu.file.choose_folder"), command=self.choose_save_directory)
-        file_menu.add_command(label=self.tr("menu.file.change_file"), command=self.change_save_location)
-        file_menu.add_separator()
-        file_menu.add_command(label=self.tr("menu.file.view_state"), command=self.view_history_state)
-        file_menu.add_command(label=self.tr("menu.file.load_state"), command=self.load_history_state)
-        file_menu.add_separator()
-        file_menu.add_command(label=self.tr("menu.file.exit"), command=self.handle_exit_request)
+        self._populate_menu(file_menu, (
+            ("menu.file.save", "", self.save_data),
+            ("menu.file.reload", "", self.load_data_or_create_new_table),
+            None,
+            ("menu.space.new", "", self.new_table),
+            ("menu.space.load", "", self.load_table_via_menu),
+            None,
+            ("menu.space.import_space", "", self.import_table_from_file),
+            ("menu.space.export_space", "", self.export_current_table),
+            ("menu.space.import_cards", "", self.import_cards_via_text),
+            None,
+            ("menu.file.choose_folder", "", self.choose_save_directory),
+            ("menu.file.change_file", "", self.change_save_location),
+            None,
+            ("menu.file.view_state", "", self.view_history_state),
+            ("menu.file.load_state", "", self.load_history_state),
+            None,
+            ("menu.file.exit", "", self.handle_exit_request),
+        ))
 
         edit_menu = tk.Menu(self.menubar, tearoff=0)
-        edit_menu.add_command(label=self.tr("menu.edit.undo"), command=self.undo_action)
-        edit_menu.add_command(label=self.tr("menu.edit.redo"), command=self.redo_action)
+        self._populate_menu(edit_menu, (
+            ("menu.edit.undo", "", self.undo_action),
+            ("menu.edit.redo", "", self.redo_action),
+        ))
 
         space_menu = tk.Menu(self.menubar, tearoff=0)
-        space_menu.add_command(label=self.tr("menu.file.add_table"), command=self.add_row, accelerator="Ctrl+N")
-        space_menu.add_command(label=self.tr("menu.file.delete_table"), command=self.delete_row)
-        space_menu.add_command(label=self.tr("menu.file.add_card"), command=self.add_card_via_button)
-        space_menu.add_command(label=self.tr("menu.file.toggle_delete"), command=self.toggle_delete_mode, accelerator="Ctrl+W")
-        space_menu.add_command(label=self.tr("action.toggle_mark_mode"), command=self.toggle_mark_mode, accelerator="Ctrl+M")
-        space_menu.add_command(label=self.tr("menu.file.cancel_action"), command=self.cancel_operations, accelerator="Esc")
-        space_menu.add_separator()
-        space_menu.add_command(label=self.tr("menu.space.duplicate"), command=self.duplicate_current_table)
-        space_menu.add_command(label=self.tr("menu.space.transfer"), command=self.transfer_table_between_spaces)
-        space_menu.add_command(label=self.tr("menu.space.delete"), command=self.delete_table_via_menu)
-        space_menu.add_separator()
+        self._populate_menu(space_menu, (
+            ("menu.file.add_table", "Ctrl+N", self.add_row),
+            ("menu.file.delete_table", "", self.delete_row),
+            ("menu.file.add_card", "", self.add_card_via_button),
+            ("menu.file.toggle_delete", "Ctrl+W", self.toggle_delete_mode),
+            ("action.toggle_mark_mode", "Ctrl+M", self.toggle_mark_mode),
+            ("menu.file.cancel_action", "Esc", self.cancel_operations),
+            None,
+            ("menu.space.duplicate", "", self.duplicate_current_table),
+            ("menu.space.transfer", "", self.transfer_table_between_spaces),
+            ("menu.space.delete", "", self.delete_table_via_menu),
+            None,
+        ))
         theme_menu = tk.Menu(space_menu, tearoff=0)
-        theme_menu.add_command(label=self.tr("menu.space.theme.dark"), command=lambda: self.apply_theme("dark"))
-        theme_menu.add_command(label=self.tr("menu.space.theme.beige"), command=lambda: self.apply_theme("beige"))
-        theme_menu.add_separator()
-        theme_menu.add_command(label=self.tr("menu.space.theme.custom"), command=self.show_custom_theme_dialog)
-        space_menu.add_cascade(label=self.tr("menu.space.theme"), menu=theme_menu)
+        self._populate_menu(theme_menu, (
+            ("menu.space.theme.dark", "", partial(self.apply_theme, "dark")),
+            ("menu.space.theme.beige", "", partial(self.apply_theme, "beige")),
+            None,
+            ("menu.space.theme.custom", "", self.show_custom_theme_dialog),
+        ))
+        self._add_menu_entry(space_menu, "cascade", "menu.space.theme", menu=theme_menu)
 
         help_menu = tk.Menu(self.menubar, tearoff=0)
-        help_menu.add_command(label=self.tr("menu.help.check_updates"), command=self.check_for_updates)
-        help_menu.add_separator()
-        help_menu.add_command(label=self.tr("menu.help.about"), command=self.show_about_dialog)
+        self._populate_menu(help_menu, (
+            ("menu.help.check_updates", "", self.check_for_updates),
+            None,
+            ("menu.help.about", "", self.show_about_dialog),
+        ))
 
         language_menu = tk.Menu(self.menubar, tearoff=0)
         for code, label in LANGUAGE_OPTIONS.items():
@@ -1005,53 +887,75 @@ class CardApp:
                 label=label,
                 value=code,
                 variable=self.language_var,
-                command=lambda c=code: self.change_language(c),
+                command=partial(self.change_language, code),
             )
 
         actions_menu = tk.Menu(self.menubar, tearoff=0)
-        for action in self._get_actions_menu_items():
-            accelerator = action.get("accelerator") or ""
-            actions_menu.add_command(
-                label=self.tr(action["label_key"]),
-                accelerator=accelerator,
-                command=action["command"],
-            )
-
-        self.menubar.add_cascade(label=self.tr("menu.file"), menu=file_menu)
-        self.menubar.add_cascade(label=self.tr("menu.edit"), menu=edit_menu)
-        self.menubar.add_cascade(label=self.tr("menu.space"), menu=space_menu)
-        self.menubar.add_cascade(label=self.tr("menu.actions"), menu=actions_menu)
-        self.menubar.add_cascade(label=self.tr("menu.help"), menu=help_menu)
-        self.menubar.add_cascade(label=self.tr("menu.language"), menu=language_menu)
+        self._populate_menu(actions_menu, self._get_actions_menu_items())
+
+        self._add_menu_entry(self.menubar, "cascade", "menu.file", menu=file_menu)
+        self._add_menu_entry(self.menubar, "cascade", "menu.edit", menu=edit_menu)
+        self._add_menu_entry(self.menubar, "cascade", "menu.space", menu=space_menu)
+        self._add_menu_entry(self.menubar, "cascade", "menu.actions", menu=actions_menu)
+        self._add_menu_entry(self.menubar, "cascade", "menu.help", menu=help_menu)
+        self._add_menu_entry(self.menubar, "cascade", "menu.language", menu=language_menu)
         self.root.config(menu=self.menubar)
 
-    def _get_actions_menu_items(self) -> list[dict[str, object]]:
-        return [
-            {"label_key": "menu.file.save", "command": self.save_data},
-            {"label_key": "menu.file.reload", "command": self.load_data_or_create_new_table},
-            {"label_key": "menu.file.view_state", "command": self.view_history_state},
-            {"label_key": "menu.file.load_state", "command": self.load_history_state},
-            {"label_key": "menu.file.add_table", "command": self.add_row, "accelerator": "Ctrl+N"},
-            {"label_key": "menu.file.delete_table", "command": self.delete_row},
-            {"label_key": "menu.file.add_card", "command": self.add_card_via_button, "accelerator": "1–9"},
-            {"label_key": "menu.file.toggle_delete", "command": self.toggle_delete_mode, "accelerator": "Ctrl+W"},
-            {"label_key": "action.toggle_mark_mode", "command": self.toggle_mark_mode, "accelerator": "Ctrl+M"},
-            {"label_key": "menu.file.cancel_action", "command": self.cancel_operations, "accelerator": "Esc"},
-            {"label_key": "menu.file.choose_folder", "command": self.choose_save_directory},
-            {"label_key": "menu.file.change_file", "command": self.change_save_location},
-            {"label_key": "menu.edit.undo", "command": self.undo_action, "accelerator": "Ctrl+Z"},
-            {"label_key": "menu.edit.redo", "command": self.redo_action, "accelerator": "Ctrl+Shift+Z / Ctrl+Y"},
-            {"label_key": "menu.space.new", "command": self.new_table, "accelerator": "Ctrl+S"},
-            {"label_key": "menu.space.load", "command": self.load_table_via_menu},
-            {"label_key": "menu.space.import_space", "command": self.import_table_from_file},
-            {"label_key": "menu.space.export_space", "command": self.export_current_table},
-            {"label_key": "menu.space.import_cards", "command": self.import_cards_via_text},
-            {"label_key": "menu.space.duplicate", "command": self.duplicate_current_table},
-            {"label_key": "menu.space.transfer", "command": self.transfer_table_between_spaces},
-            {"label_key": "menu.space.delete", "command": self.delete_table_via_menu},
-            {"label_key": "menu.help.check_updates", "command": self.check_for_updates},
-            {"label_key": "menu.help.about", "command": self.show_about_dialog},
-        ]
+    def _add_menu_entry(self, parent: tk.Menu, kind: str, label_key: str, **options):
+        # Remembers where each translated entry sits so a language switch only relabels it.
+        label = self.tr(label_key)
+        getattr(parent, f"add_{kind}")(label=label, **options)
+        self._menu_entries.append([parent, parent.index(tk.END), label_key, label])
+
+    def _populate_menu(self, parent: tk.Menu, entries):
+        # Each entry is (translation key, accelerator, command); None adds a separator.
+        for entry in entries:
+            if entry is None:
+                parent.add_separator()
+                continue
+            label_key, accelerator, command = entry
+            self._add_menu_entry(parent, "command", label_key, accelerator=accelerator, command=command)
+
+    def refresh_menu_labels(self):
+        # Labels that read the same in the new language are not sent to Tcl again.
+        for entry in self._menu_entries:
+            menu, index, label_key, shown_label = entry
+            label = self.tr(label_key)
+            if label == shown_label:
+                continue
+            menu.entryconfigure(index, label=label)
+            entry[3] = label
+
+    def _get_actions_menu_items(self) -> tuple[tuple[str, str, object], ...]:
+        # The entries never change, so only the labels are re-translated on each menu rebuild.
+        if self._actions_menu_spec is None:
+            self._actions_menu_spec = (
+                ("menu.file.save", "", self.save_data),
+                ("menu.file.reload", "", self.load_data_or_create_new_table),
+                ("menu.file.view_state", "", self.view_history_state),
+                ("menu.file.load_state", "", self.load_history_state),
+                ("menu.file.add_table", "Ctrl+N", self.add_row),
+                ("menu.file.delete_table", "", self.delete_row),
+                ("menu.file.add_card", "1–9", self.add_card_via_button),
+                ("menu.file.toggle_delete", "Ctrl+W", self.toggle_delete_mode),
+                ("action.toggle_mark_mode", "Ctrl+M", self.toggle_mark_mode),
+                ("menu.file.cancel_action", "Esc", self.cancel_operations),
+                ("menu.file.choose_folder", "", self.choose_save_directory),
+                ("menu.file.change_file", "", self.change_save_location),
+                ("menu.edit.undo", "Ctrl+Z", self.undo_action),
+                ("menu.edit.redo", "Ctrl+Shift+Z / Ctrl+Y", self.redo_action),
+                ("menu.space.new", "Ctrl+S", self.new_table),
+                ("menu.space.load", "", self.load_table_via_menu),
+                ("menu.space.import_space", "", self.import_table_from_file),
+                ("menu.space.export_space", "", self.export_current_table),
+                ("menu.space.import_cards", "", self.import_cards_via_text),
+                ("menu.space.duplicate", "", self.duplicate_current_table),
+                ("menu.space.transfer", "", self.transfer_table_between_spaces),
+                ("menu.space.delete", "", self.delete_table_via_menu),
+                ("menu.help.check_updates", "", self.check_for_updates),
+                ("menu.help.about", "", self.show_about_dialog),
+            )
+        return self._actions_menu_spec
 
     def _build_toolbar(self):
         self.toolbar = ttk.Frame(self.main_frame, padding=(24, 16), style="Toolbar.TFrame")
@@ -1079,6 +983,8 @@ class CardApp:
         nav_scroll.grid(row=1, column=1, sticky=tk.NS, padx=(8, 0))
         self.navigation_tree.configure(yscrollcommand=nav_scroll.set)
         self.navigation_tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.navigation_tree.bind("<<TreeviewOpen>>", self.on_tree_open)
+        self.navigation_tree.bind("<<TreeviewClose>>", self.on_tree_close)
 
     def _build_content_area(self):
         self.content_frame = ttk.Frame(self.main_frame, padding=(0, 16, 24, 24), style="Content.TFrame")
@@ -1086,13 +992,13 @@ class CardApp:
         self.content_frame.rowconfigure(0, weight=1)
         self.content_frame.columnconfigure(0, weight=1)
 
-        self.canvas = tk.Canvas(self.content_frame, bg=CONTENT_BG, highlightthickness=0)
+        self.canvas = tk.Canvas(self.content_frame, bg=THEME.CONTENT_BG, highlightthickness=0)
         self.canvas.grid(row=0, column=0, sticky=tk.NSEW)
         self.v_scrollbar = ttk.Scrollbar(self.content_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         self.v_scrollbar.grid(row=0, column=1, sticky=tk.NS)
         self.h_scrollbar = ttk.Scrollbar(self.content_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
         self.h_scrollbar.grid(row=1, column=0, sticky=tk.EW, pady=(8, 0))
-        self.canvas.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_content_scroll, xscrollcommand=self.h_scrollbar.set)
 
         self.table = ttk.Frame(self.canvas, style="Content.TFrame")
         self.canvas_window = self.canvas.create_window((0, 0), window=self.table, anchor="nw")
@@ -1105,12 +1011,63 @@ class CardApp:
     def on_canvas_configure(self, event):
         canvas_width = event.width
         self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        self._schedule_card_sync()
+
+    def _on_content_scroll(self, first, last):
+        self.v_scrollbar.set(first, last)
+        self._schedule_card_sync()
+
+    def _schedule_card_sync(self):
+        if not self._card_sync_pending:
+            self._card_sync_pending = True
+            self.root.after_idle(self._sync_card_widgets)
+
+    def _sync_card_widgets(self):
+        self._card_sync_pending = False
+        # The viewport is queried once for all columns; names used per column are bound locally.
+        try:
+            viewport = (self.canvas.winfo_rooty(), max(self.canvas.winfo_height(), 1))
+        except tk.TclError:
+            return
+        sync_column = self._sync_column_widgets
+        tcl_error = tk.TclError
+        for canvas in self.card_columns.values():
+            try:
+                sync_column(canvas, viewport)
+            except tcl_error:
+                pass
 
     def update_file_path_label(self):
         global SAVE_FILE
+        if self._status_after_id is not None:
+            return
         self.file_path_label.config(text=self.tr("status.current_path", path=SAVE_FILE))
 
+    def _notify_success(self, title: str, message: str):
+        # Bulk operations set _quiet so their confirmations go to the status line instead of one modal dialog each.
+        if not self._quiet:
+            messagebox.showinfo(title, message)
+            return
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+        self.file_path_label.config(text=message)
+        self._status_after_id = self.root.after(STATUS_MESSAGE_MS, self._clear_status_message)
+
+    def _clear_status_message(self):
+        self._status_after_id = None
+        self.update_file_path_label()
+
+    def _font(self, size: int, weight: str = "normal") -> tkfont.Font:
+        # Widgets created per card share one named Tk font per size instead of parsing a font tuple each time.
+        font = self._fonts.get((size, weight))
+        if font is None:
+            font = tkfont.Font(root=self.root, family="Segoe UI", size=size, weight=weight)
+            self._fonts[(size, weight)] = font
+        return font
+
     def _set_window_icon(self):
+        if self._icon_images:
+            return
         icon_candidates = ["favicon.ico", "favicon.png"]
         for candidate in icon_candidates:
             icon_path = resource_path(candidate)
@@ -1129,7 +1086,8 @@ class CardApp:
 
     def load_data_or_create_new_table(self):
         self.load_data()
-        self.convert_old_cards_format()
+        # Interned names turn the many row/column/front comparisons into identity checks.
+        self.data = intern_strings(self.data)
         self._reset_history()
 
         if not self.data.get("tables"):
@@ -1141,12 +1099,11 @@ class CardApp:
             self.new_table(skip_history=True)
 
         if self.data["current_table"] is None and self.data["tables"]:
-            self.data["current_table"] = list(self.data["tables"].keys())[0]
+            self.data["current_table"] = next(iter(self.data["tables"]))
 
         self.update_file_path_label()
         self.ensure_row_selection_valid()
-        self.build_navigation_tree()
-        self.update_table()
+        self._request_rebuild()
 
     def convert_old_cards_format(self):
         tables = self.data.get("tables", {})
@@ -1213,43 +1170,180 @@ class CardApp:
 
     def _capture_history_state(self) -> dict:
         return {
-            "data": copy.deepcopy(self.data),
+            # Snapshots are kept as serialized JSON bytes: cheaper to create than a deepcopy and far smaller.
+            "data": dump_json_bytes(self.data),
             "selected_row": self.selected_row_name,
         }
 
-    def _record_history(self):
-        snapshot = self._capture_history_state()
+    def _record_history(self, *table_names: str):
+        # Naming the touched spaces snapshots only those; every other space is shared with the live data.
+        snapshot = self._capture_spaces_state(table_names) if table_names else self._capture_history_state()
         self.history.append(snapshot)
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
         self.future.clear()
 
+    def _capture_spaces_state(self, table_names) -> tuple:
+        tables = self.data.get("tables", {})
+        payload = {name: (dump_json_bytes(tables[name]) if name in tables else None) for name in table_names}
+        return ("spaces", payload, tuple(tables), self.data.get("current_table"), self.selected_row_name)
+
+    def _apply_spaces_state(self, entry: tuple):
+        _, payload, order, current_table, selected_row = entry
+        tables = self.data.setdefault("tables", {})
+        for name, blob in payload.items():
+            if blob is None:
+                tables.pop(name, None)
+            else:
+                tables[name] = load_json_bytes(blob)
+            self._invalidate_nav_cache(name)
+        # Re-create the dict so restored spaces return to their old position in the navigation.
+        ordered = {name: tables[name] for name in order if name in tables}
+        ordered.update(tables)
+        self.data["tables"] = ordered
+        if current_table in ordered:
+            self.data["current_table"] = current_table
+        elif self.data.get("current_table") not in ordered:
+            self.data["current_table"] = next(iter(ordered), None)
+        self.selected_row_name = selected_row
+        self.ensure_row_selection_valid()
+        self._request_rebuild()
+        self._request_save()
+
+    def _record_row_history(self, row_name: str):
+        # Edits confined to one row snapshot only that row's cards and colour instead of every space.
+        self.history.append(self._capture_row_state(self.data.get("current_table"), row_name))
+        self.future.clear()
+
+    def _capture_row_state(self, table_name: str, row_name: str) -> tuple:
+        table_data = self.data.get("tables", {}).get(table_name, {})
+        payload = {
+            "cards": table_data.get("cards", {}).get(row_name),
+            "color": table_data.get("row_colors", {}).get(row_name),
+        }
+        return ("row", table_name, row_name, dump_json_bytes(payload), self.selected_row_name)
+
+    def _apply_row_state(self, entry: tuple):
+        _, table_name, row_name, payload, selected_row = entry
+        table_data = self.data.get("tables", {}).get(table_name)
+        if table_data is None or row_name not in table_data.get("rows", []):
+            return
+        restored = load_json_bytes(payload)
+        if restored["cards"] is not None:
+            table_data["cards"][row_name] = restored["cards"]
+        if restored["color"] is not None:
+            table_data["row_colors"][row_name] = restored["color"]
+        self.data["current_table"] = table_name
+        self.selected_row_name = selected_row
+        self._invalidate_row_stats(table_name, row_name)
+        self.ensure_row_selection_valid()
+        self._request_rebuild()
+        self._request_save()
+
+    def _record_weight_change(self, row_name: str, col_name: str, card_front: str, old_weight: float, new_weight: float):
+        # Weight clicks are the most frequent edit, so they are stored as a small delta tuple.
+        entry = ("weight", self.data.get("current_table"), row_name, col_name, card_front, old_weight, new_weight)
+        self.history.append(entry)
+        self.future.clear()
+
+    def _apply_weight_entry(self, entry: tuple, reverse: bool):
+        _, table_name, row_name, col_name, card_front, old_weight, new_weight = entry
+        table_data = self.data.get("tables", {}).get(table_name)
+        if table_data is None:
+            return
+        card_list = table_data.get("cards", {}).get(row_name, {}).get(col_name)
+        if card_list is None:
+            return
+        card_dict = self._find_card_in_column(row_name, col_name, card_list, card_front)
+        if card_dict is None:
+            return
+        card_dict["weight"] = old_weight if reverse else new_weight
+        self._invalidate_row_stats(table_name, row_name)
+        self._request_save()
+        if self.data.get("current_table") == table_name:
+            self._show_weight_change(row_name, col_name, card_dict)
+        else:
+            self.data["current_table"] = table_name
+            self.ensure_row_selection_valid()
+            self._request_rebuild()
+
+    def _record_move(self, source_row: str, source_col: str, source_index: int, target_row: str, target_col: str, card_front: str):
+        # Card moves are stored as small delta entries instead of full snapshots of self.data.
+        entry = ("move", self.data.get("current_table"), source_row, source_col, source_index, target_row, target_col, card_front)
+        self.history.append(entry)
+        self.future.clear()
+
+    def _apply_move_entry(self, entry: tuple, reverse: bool):
+        _, table_name, source_row, source_col, source_index, target_row, target_col, card_front = entry
+        table_data = self.data.get("tables", {}).get(table_name)
+        if table_data is None:
+            return
+        cards = table_data.get("cards", {})
+        source_cards = cards.get(source_row, {}).get(source_col)
+        target_cards = cards.get(target_row, {}).get(target_col)
+        if source_cards is None or target_cards is None:
+            return
+        if reverse:
+            for idx in range(len(target_cards) - 1, -1, -1):
+                if str(target_cards[idx].get("front")) == card_front:
+                    source_cards.insert(source_index, target_cards.pop(idx))
+                    break
+        else:
+            idx = find_card_index(source_cards, card_front)
+            if idx is not None:
+                target_cards.append(source_cards.pop(idx))
+        self.data["current_table"] = table_name
+        self._invalidate_row_stats(table_name, source_row, target_row)
+        self.ensure_row_selection_valid()
+        self._request_rebuild()
+        self._request_save()
+
     def _apply_history_state(self, state: dict):
-        self.data = copy.deepcopy(state.get("data", {}))
+        self.data = load_json_bytes(state["data"])
+        self._invalidate_nav_cache()
         self.selected_row_name = state.get("selected_row")
         self.ensure_row_selection_valid()
-        self.build_navigation_tree()
-        self.update_table()
-        self.save_data()
+        self._request_rebuild()
+        self._request_save()
 
     def undo_action(self, event=None):
         if not self.history:
             return "break"
-        self.future.append(self._capture_history_state())
-        if len(self.future) > self.max_history:
-            self.future.pop(0)
         state = self.history.pop()
-        self._apply_history_state(state)
+        if isinstance(state, tuple) and state[0] == "row":
+            self.future.append(self._capture_row_state(state[1], state[2]))
+            self._apply_row_state(state)
+        elif isinstance(state, tuple) and state[0] == "spaces":
+            self.future.append(self._capture_spaces_state(state[1]))
+            self._apply_spaces_state(state)
+        elif isinstance(state, tuple) and state[0] == "weight":
+            self.future.append(state)
+            self._apply_weight_entry(state, reverse=True)
+        elif isinstance(state, tuple):
+            self.future.append(state)
+            self._apply_move_entry(state, reverse=True)
+        else:
+            self.future.append(self._capture_history_state())
+            self._apply_history_state(state)
         return "break"
 
     def redo_action(self, event=None):
         if not self.future:
             return "break"
-        self.history.append(self._capture_history_state())
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
         state = self.future.pop()
-        self._apply_history_state(state)
+        if isinstance(state, tuple) and state[0] == "row":
+            self.history.append(self._capture_row_state(state[1], state[2]))
+            self._apply_row_state(state)
+        elif isinstance(state, tuple) and state[0] == "spaces":
+            self.history.append(self._capture_spaces_state(state[1]))
+            self._apply_spaces_state(state)
+        elif isinstance(state, tuple) and state[0] == "weight":
+            self.history.append(state)
+            self._apply_weight_entry(state, reverse=False)
+        elif isinstance(state, tuple):
+            self.history.append(state)
+            self._apply_move_entry(state, reverse=False)
+        else:
+            self.history.append(self._capture_history_state())
+            self._apply_history_state(state)
         return "break"
 
     def shortcut_new_space(self, event=None):
@@ -1257,58 +1351,86 @@ class CardApp:
         return "break"
 
     def get_bin_file_path(self) -> str:
-        path = load_bin_history_file_path(SAVE_FILE or None)
-        return str(path)
+        # Resolving the path reads the config file, so the result is kept until the save file moves.
+        cached = self._bin_path_cache
+        if cached is None or cached[0] != SAVE_FILE:
+            cached = (SAVE_FILE, str(load_bin_history_file_path(SAVE_FILE or None)))
+            self._bin_path_cache = cached
+        return cached[1]
 
     def load_binary_history(self) -> list[dict]:
-        path = self.get_bin_file_path()
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
-        if isinstance(payload, dict):
-            history = payload.get("history", [])
-            if isinstance(history, list):
-                return history[-100:]
-        return []
-
-    def save_binary_history(self):
-        path = self.get_bin_file_path()
-        directory = os.path.dirname(path)
-        if directory:
-            os.makedirs(directory, exist_ok=True)
-        payload = {"history": self.bin_history[-100:]}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        # Lists the snapshot files only; their contents are read when a version is opened.
+        self._wait_for_writes()
+        bin_file = self.get_bin_file_path()
+        if os.path.isfile(bin_file):
+            try:
+                migrate_bin_history_file(bin_file, BIN_HISTORY_LIMIT)
+            except OSError:
+                pass
+        entries = []
+        for path in list_snapshots(snapshot_dir_for(bin_file))[-BIN_HISTORY_LIMIT:]:
+            timestamp = snapshot_timestamp(path)
+            entries.append({
+                "timestamp": timestamp.isoformat() if timestamp else "",
+                "label": timestamp.strftime("%d.%m.%Y %H:%M") if timestamp else "Unbekannt",
+                "path": str(path),
+            })
+        return entries
+
+    def save_binary_history(self) -> Future:
+        snapshots = []
+        for entry in self.bin_history:
+            if entry.pop("unsaved", False):
+                manifest, blobs = encode_snapshot(entry["timestamp"], entry["label"], entry["data"])
+                snapshots.append((os.path.basename(entry["path"]), manifest, blobs))
+        directory = snapshot_dir_for(self.get_bin_file_path())
+        return self._submit_write(write_snapshots, directory, snapshots, BIN_HISTORY_LIMIT)
+
+    def _history_entry_data(self, entry: dict) -> dict | None:
+        if "data" not in entry:
+            self._wait_for_writes()
+            try:
+                entry["data"] = read_snapshot(entry["path"]).get("data", {})
+            except (OSError, ValueError) as exc:
+                messagebox.showerror("Fehler", f"Version konnte nicht gelesen werden: {exc}")
+                return None
+        return entry["data"]
+
+    def _ensure_bin_history(self):
+        if not self._bin_history_loaded:
+            self.refresh_bin_history()
 
     def add_snapshot_to_bin(self):
+        self._ensure_bin_history()
         timestamp = datetime.now()
         entry = {
             "timestamp": timestamp.isoformat(),
             "label": timestamp.strftime("%d.%m.%Y %H:%M"),
-            "data": copy.deepcopy(self.data),
+            "path": str(snapshot_dir_for(self.get_bin_file_path()) / snapshot_name(timestamp)),
+            "data": clone_json(self.data),
+            "unsaved": True,
         }
         self.bin_history.append(entry)
-        if len(self.bin_history) > 100:
-            self.bin_history = self.bin_history[-100:]
 
     def refresh_bin_history(self):
-        self.bin_history = self.load_binary_history()
+        self.bin_history = deque(self.load_binary_history(), maxlen=BIN_HISTORY_LIMIT)
+        self._bin_history_loaded = True
 
     def handle_exit_request(self):
         try:
-            self.save_data()
+            pending = [self.save_data()]
             self.add_snapshot_to_bin()
-            self.save_binary_history()
+            pending.append(self.save_binary_history())
+            for future in pending:
+                future.result()
         except Exception as exc:
             messagebox.showerror("Fehler", f"Konnte Versionierung nicht speichern: {exc}")
         finally:
+            self._save_executor.shutdown(wait=True)
             self.root.destroy()
 
     def _pick_history_entry(self, action: str) -> dict | None:
+        self._ensure_bin_history()
         if not self.bin_history:
             messagebox.showinfo("Keine Versionen", "Es sind noch keine gespeicherten Versionen vorhanden.")
             return None
@@ -1346,13 +1468,16 @@ class CardApp:
         entry = self._pick_history_entry("anzeigen")
         if not entry:
             return
+        data = self._history_entry_data(entry)
+        if data is None:
+            return
         viewer = tk.Toplevel(self.root)
         viewer.title(f"Stand vom {entry.get('label','')}")
         viewer.transient(self.root)
         viewer.grab_set()
         text = tk.Text(viewer, wrap="word")
         text.pack(fill=tk.BOTH, expand=True)
-        text.insert("1.0", json.dumps(entry.get("data", {}), indent=2, ensure_ascii=False))
+        text.insert("1.0", encode_json(data, indent=2).decode("utf-8"))
         text.config(state="disabled")
         ttk.Button(viewer, text="Schließen", command=viewer.destroy).pack(pady=8)
 
@@ -1360,71 +1485,198 @@ class CardApp:
         entry = self._pick_history_entry("laden")
         if not entry:
             return
+        data = self._history_entry_data(entry)
+        if data is None:
+            return
         confirm = messagebox.askyesno(
             "Version laden",
             f"Soll der Stand vom {entry.get('label','')} geladen werden? Aktuelle Daten werden überschrieben.",
         )
         if not confirm:
             return
-        self.data = copy.deepcopy(entry.get("data", {})) or {"tables": {}, "current_table": None}
+        if entry.get("unsaved"):
+            data = clone_json(data)
+        else:
+            # A snapshot that is on disk can simply be read again, so its parsed data is handed over uncopied.
+            del entry["data"]
+        self.data = data or {"tables": {}, "current_table": None}
+        self.convert_old_cards_format()
+        self._invalidate_nav_cache()
         self._reset_history()
         self.save_data()
         self.ensure_row_selection_valid()
-        self.build_navigation_tree()
-        self.update_table()
+        self._request_rebuild()
 
     def build_navigation_tree(self):
         with self.smooth_state_transition():
             self._build_navigation_tree_impl()
 
     def _build_navigation_tree_impl(self):
-        if not hasattr(self, "navigation_tree"):
+        if self.navigation_tree is None:
             return
 
-        self.navigation_tree.delete(*self.navigation_tree.get_children())
-        self.tree_nodes.clear()
-        self.tree_row_lookup.clear()
-
+        tree = self.navigation_tree
+        tables = self.data.get("tables", {})
         current_table = self.data.get("current_table")
         selected_row = self.selected_row_name
 
-        space_averages: dict[str, str] = {}
-        for table_name, table_data in self.data.get("tables", {}).items():
-            rows = table_data.get("rows", [])
-            if not rows:
-                space_averages[table_name] = "—"
-                continue
-            columns = table_data.get("columns", [])
-            cards = table_data.get("cards", {})
-            values = []
-            for row_name in rows:
-                ratio = calculate_ratio(row_name, cards, columns)
-                expected_grade = calculate_expected_grade(row_name, cards, columns)
-                if ratio is None or expected_grade is None:
-                    continue
-                values.append(expected_grade)
-            space_averages[table_name] = "—" if not values else f"{sum(values) / len(values):.2f}"
+        # The tree is diffed against the data: existing nodes are relabeled/moved, only new ones inserted.
+        stale_tables = [item_id for key, item_id in self.tree_nodes.items() if key[0] == "table" and key[1] not in tables]
+        for item_id in stale_tables:
+            self._forget_nav_item(item_id)
+        if stale_tables:
+            tree.delete(*stale_tables)
 
-        for table_index, (table_name, table_data) in enumerate(self.data.get("tables", {}).items(), start=1):
-            avg = space_averages.get(table_name, "—")
+        table_ids = []
+        for table_index, (table_name, table_data) in enumerate(tables.items(), start=1):
+            avg = self._space_average(table_name, table_data)
             table_label = f"{table_index}. {table_name} · xG {avg}"
-            table_id = self.navigation_tree.insert("", "end", text=table_label, open=(table_name == current_table))
-            self.tree_nodes[("table", table_name)] = table_id
-            self.tree_row_lookup[table_id] = ("table", table_name)
-            for row_index, row_name in enumerate(table_data.get("rows", []), start=1):
-                row_label = f"{row_name} ({row_index})"
-                row_id = self.navigation_tree.insert(table_id, "end", text=row_label)
-                self.tree_nodes[("row", table_name, row_name)] = row_id
-                self.tree_row_lookup[row_id] = ("row", table_name, row_name)
+            is_open = table_name == current_table
+            table_id = self._sync_nav_item(("table", table_name), "", table_label, is_open)
+            table_ids.append(table_id)
+            # Only the open space gets its row nodes; collapsed spaces carry a placeholder until expanded.
+            if is_open:
+                self._populate_table_rows(table_id, table_name)
+            else:
+                self._collapse_table_rows(table_id, bool(table_data.get("rows")))
+        self._reorder_nav_children("", table_ids)
 
         target_id = None
         if current_table and selected_row:
             target_id = self.tree_nodes.get(("row", current_table, selected_row))
         if not target_id and current_table:
             target_id = self.tree_nodes.get(("table", current_table))
-        if target_id:
-            self.navigation_tree.selection_set(target_id)
-            self.navigation_tree.see(target_id)
+        if target_id and tuple(tree.selection()) != (target_id,):
+            tree.selection_set(target_id)
+            tree.see(target_id)
+
+    def _sync_nav_item(self, key: tuple[str, ...], parent: str, label: str, is_open: bool = False) -> str:
+        item_id = self.tree_nodes.get(key)
+        if item_id is None:
+            item_id = self._queue_nav_insert(parent, label, is_open)
+            self.tree_nodes[key] = item_id
+            self.tree_row_lookup[item_id] = key
+        elif self._nav_items.get(item_id) != label:
+            self.navigation_tree.item(item_id, text=label, open=is_open)
+        else:
+            # The user may have expanded or collapsed the node since the last sync, so the open state is always reset.
+            self.navigation_tree.item(item_id, open=is_open)
+        self._nav_items[item_id] = label
+        return item_id
+
+    def _queue_nav_insert(self, parent: str, label: str, is_open: bool = False) -> str:
+        # New nodes get their ids here and reach Tk in one batch before the next reorder or close.
+        item_id = f"nav{next(self._nav_ids)}"
+        self._nav_batch.add(parent, item_id, label, is_open)
+        return item_id
+
+    def _nav_children(self, item_id: str) -> tuple[str, ...]:
+        if item_id in self._nav_batch.pending:
+            return ()
+        return self.navigation_tree.get_children(item_id)
+
+    def _forget_nav_item(self, item_id: str):
+        for child in self.navigation_tree.get_children(item_id):
+            self._forget_nav_item(child)
+        key = self.tree_row_lookup.pop(item_id, None)
+        if key is not None:
+            self.tree_nodes.pop(key, None)
+        self._nav_items.pop(item_id, None)
+
+    def _reorder_nav_children(self, parent: str, wanted: list[str]):
+        self._nav_batch.apply(self.navigation_tree)
+        # One set_children call reorders all siblings instead of a move per displaced node.
+        if list(self.navigation_tree.get_children(parent)) != wanted:
+            self.navigation_tree.set_children(parent, *wanted)
+
+    def _space_average(self, table_name: str, table_data: dict) -> str:
+        # Averages are cached per space and built from the per-row stats, so only edited rows are recomputed.
+        cards = table_data.get("cards", {})
+        cached = self._nav_cache.get(table_name)
+        if cached is not None and cached[0] == id(cards):
+            return cached[1]
+        rows = table_data.get("rows", [])
+        columns = table_data.get("columns", [])
+        values = []
+        for row_name in rows:
+            _total_cards, ratio, expected_grade = self._row_statistics(table_name, row_name, cards, columns)
+            if ratio is None or expected_grade is None:
+                continue
+            values.append(expected_grade)
+        avg = "—" if not values else f"{sum(values) / len(values):.2f}"
+        self._nav_cache[table_name] = (id(cards), avg)
+        return avg
+
+    def _row_statistics(self, table_name: str, row_name: str, cards: dict, columns: list[str]) -> tuple[int, float, float]:
+        key = (table_name, row_name)
+        stats = self._row_stats.get(key)
+        if stats is None:
+            stats = calculate_row_statistics(row_name, cards, columns)
+            self._row_stats[key] = stats
+        return stats
+
+    def _invalidate_row_stats(self, table_name: str | None, *row_names: str):
+        # Must be called whenever the cards of a row change; also drops that space's cached average.
+        self._nav_cache.pop(table_name, None)
+        for row_name in row_names:
+            self._row_stats.pop((table_name, row_name), None)
+
+    def _invalidate_nav_cache(self, table_name: str | None = None):
+        if table_name is None:
+            self._nav_cache.clear()
+            self._row_stats.clear()
+        else:
+            self._nav_cache.pop(table_name, None)
+            for key in [key for key in self._row_stats if key[0] == table_name]:
+                del self._row_stats[key]
+
+    def _populate_table_rows(self, table_id: str, table_name: str):
+        tree = self.navigation_tree
+        rows = self.data.get("tables", {}).get(table_name, {}).get("rows", [])
+        wanted_rows = set(rows)
+        stale = []
+        for child in self._nav_children(table_id):
+            key = self.tree_row_lookup.get(child)
+            if key is None or key[2] not in wanted_rows:
+                self._forget_nav_item(child)
+                stale.append(child)
+        if stale:
+            tree.delete(*stale)
+        row_ids = [
+            self._sync_nav_item(("row", table_name, row_name), table_id, f"{row_name} ({row_index})")
+            for row_index, row_name in enumerate(rows, start=1)
+        ]
+        self._reorder_nav_children(table_id, row_ids)
+
+    def _collapse_table_rows(self, table_id: str, has_rows: bool):
+        tree = self.navigation_tree
+        children = self._nav_children(table_id)
+        if has_rows and len(children) == 1 and children[0] not in self.tree_row_lookup:
+            return
+        for child in children:
+            self._forget_nav_item(child)
+        if children:
+            tree.delete(*children)
+        if has_rows:
+            self._queue_nav_insert(table_id, "")
+
+    def on_tree_open(self, _event):
+        item_id = self.navigation_tree.focus()
+        node_info = self.tree_row_lookup.get(item_id)
+        if node_info and node_info[0] == "table":
+            self._populate_table_rows(item_id, node_info[1])
+
+    def on_tree_close(self, _event):
+        item_id = self.navigation_tree.focus()
+        node_info = self.tree_row_lookup.get(item_id)
+        if not node_info or node_info[0] != "table":
+            return
+        children = self.navigation_tree.get_children(item_id)
+        # A selected row stays in place so collapsing does not change the board selection.
+        if not children or set(children) & set(self.navigation_tree.selection()):
+            return
+        self._collapse_table_rows(item_id, True)
+        self._nav_batch.apply(self.navigation_tree)
 
     def ensure_row_selection_valid(self):
         table_data = self.get_current_table_data()
@@ -1438,10 +1690,14 @@ class CardApp:
             self.selected_row_name = None
 
     def get_current_table_data(self):
-        if self.data["current_table"] is None:
+        table_name = self.data["current_table"]
+        if table_name is None:
             return None
-        self.root.title(f"Klausurmaster2D - {self.data['current_table']}")
-        return self.data["tables"].get(self.data["current_table"], None)
+        # Setting the title is a Tcl round trip, so it only happens when the active space changes.
+        if table_name != self._window_title_table:
+            self.root.title(f"Klausurmaster2D - {table_name}")
+            self._window_title_table = table_name
+        return self.data["tables"].get(table_name, None)
 
     def get_current_columns(self):
         table_data = self.get_current_table_data()
@@ -1452,6 +1708,7 @@ class CardApp:
     def render_placeholder(self, title: str, subtitle: str):
         self.card_columns = {}
         self.row_header_widgets = {}
+        self._table_layout_key = None
         for widget in self.table.winfo_children():
             widget.destroy()
 
@@ -1464,43 +1721,36 @@ class CardApp:
 
     def _get_contrast_color(self, hex_color: str | None) -> str:
         if not hex_color:
-            return TEXT_PRIMARY
-        try:
-            cleaned = hex_color.lstrip("#")
-            r = int(cleaned[0:2], 16)
-            g = int(cleaned[2:4], 16)
-            b = int(cleaned[4:6], 16)
-        except (ValueError, IndexError, TypeError):
-            return TEXT_PRIMARY
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        return "#000000" if luminance > 0.6 else "#ffffff"
+            return THEME.TEXT_PRIMARY
+        return contrast_text_color(hex_color) or THEME.TEXT_PRIMARY
 
     def render_row_header(self, row_name: str, ratio: float, expected_grade: float, row_color: str, total_cards: int):
-        header_color = row_color or PANEL_BG
+        header_color = row_color or THEME.PANEL_BG
         header = tk.Frame(self.table, bg=header_color, padx=18, pady=18, highlightthickness=0)
         header.grid(row=0, column=0, sticky=tk.EW, pady=(0, 18))
         header.columnconfigure(0, weight=1)
         header.columnconfigure(1, weight=0)
 
-        title = tk.Label(header, text=row_name, font=("Segoe UI", 18, "bold"), bg=header_color, fg=TEXT_PRIMARY)
+        title = tk.Label(header, text=row_name, font=("Segoe UI", 18, "bold"), bg=header_color, fg=THEME.TEXT_PRIMARY)
         title.grid(row=0, column=0, sticky=tk.W)
         expected = "—" if total_cards == 0 else f"{expected_grade:.2f}"
+        subtitle_text = f"{total_cards} Karten · xG {expected}"
         subtitle = tk.Label(
             header,
-            text=f"{total_cards} Karten · xG {expected}",
+            text=subtitle_text,
             font=("Segoe UI", 11),
             bg=header_color,
-            fg=TEXT_PRIMARY,
+            fg=THEME.TEXT_PRIMARY,
         )
         subtitle.grid(row=1, column=0, sticky=tk.W, pady=(8, 0))
 
-        button_bg = row_color or PANEL_BG
+        button_bg = row_color or THEME.PANEL_BG
         contrast_fg = self._get_contrast_color(button_bg)
         color_button = tk.Button(
             header,
             text="Farbe",
             font=("Segoe UI", 9, "bold"),
-            command=lambda rn=row_name: self.pick_row_color(rn),
+            command=partial(self.pick_row_color, row_name),
             bg=button_bg,
             fg=contrast_fg,
             activebackground=button_bg,
@@ -1518,6 +1768,8 @@ class CardApp:
             "title": title,
             "subtitle": subtitle,
             "color_button": color_button,
+            "last_bg": header_color,
+            "last_text": subtitle_text,
         }
 
     def render_board_for_row(self, row_name: str, columns: list[str], cards: dict, row_color: str):
@@ -1532,7 +1784,7 @@ class CardApp:
             board.columnconfigure(idx, weight=1)
             column_frame = tk.Frame(
                 board,
-                bg=PANEL_BG,
+                bg=THEME.PANEL_BG,
                 padx=16,
                 pady=16,
                 highlightbackground=row_color,
@@ -1542,160 +1794,296 @@ class CardApp:
             column_frame._row_name = row_name
             column_frame._col_name = col_name
             column_frame._base_highlight_color = row_color
-            column_frame.bind("<ButtonPress-1>", lambda event, rn=row_name, cn=col_name: self.on_column_click(rn, cn))
+            column_click = partial(self.on_column_click, row_name, col_name)
+            column_frame.bind("<ButtonPress-1>", column_click)
             self.column_frames.append(column_frame)
 
-            header = tk.Label(column_frame, text=col_name, font=("Segoe UI", 12, "bold"), bg=PANEL_BG, fg=TEXT_PRIMARY)
+            header = tk.Label(column_frame, text=col_name, font=self._font(12, "bold"), bg=THEME.PANEL_BG, fg=THEME.TEXT_PRIMARY)
             header.pack(fill=tk.X, pady=(0, 12))
-            header.bind("<ButtonPress-1>", lambda event, rn=row_name, cn=col_name: self.on_column_click(rn, cn))
+            header.bind("<ButtonPress-1>", column_click)
 
-            cards_container = tk.Frame(column_frame, bg=PANEL_BG)
+            cards_container = tk.Canvas(
+                column_frame,
+                bg=THEME.PANEL_BG,
+                width=CARD_CANVAS_MIN_WIDTH,
+                height=1,
+                bd=0,
+                highlightthickness=0,
+            )
             cards_container.pack(fill=tk.BOTH, expand=True)
+            cards_container._card_column = (row_name, col_name)
+            cards_container._cards = {}
+            cards_container._card_slots = {}
+            cards_container._card_widgets = {}
+            cards_container._card_tags = {}
+            cards_container._weight_items = {}
+            cards_container._layout_width = 0
+            self._bind_card_canvas(cards_container)
             self.card_columns[(row_name, col_name)] = cards_container
             self.render_cards_in_column(row_name, col_name, cards_container, cards)
 
-    def _bind_card_widget(self, widget: tk.Widget, row_name: str, col_name: str, card_front: str):
-        widget.bind(
-            "<ButtonPress-1>",
-            lambda event, rn=row_name, cn=col_name, cf=card_front: self.on_card_press(event, rn, cn, cf),
-        )
-        widget.bind("<B1-Motion>", self.on_card_motion)
-        widget.bind(
-            "<ButtonRelease-1>",
-            lambda event, rn=row_name, cn=col_name, cf=card_front: self.on_card_release(event, rn, cn, cf),
-        )
-        widget.bind(
+    def _bind_card_canvas(self, canvas: tk.Canvas):
+        # Every card item carries the shared "card" tag, so each column canvas needs just one set of bindings.
+        canvas.tag_bind("card", "<ButtonPress-1>", lambda event: self._dispatch_card_event(event, self.on_card_press))
+        canvas.tag_bind("card", "<B1-Motion>", self.on_card_motion)
+        canvas.tag_bind("card", "<ButtonRelease-1>", lambda event: self._dispatch_card_event(event, self.on_card_release))
+        canvas.tag_bind(
+            "card",
             "<Button-3>",
-            lambda event, rn=row_name, cn=col_name, cf=card_front: self.on_card_right_click(rn, cn, cf),
+            lambda event: self._dispatch_card_event(event, lambda _event, rn, cn, cf: self.on_card_right_click(rn, cn, cf)),
         )
+        canvas.bind("<Configure>", self._on_card_canvas_configure)
+
+    def _card_under_pointer(self, canvas: tk.Canvas) -> dict | None:
+        cards = getattr(canvas, "_cards", {})
+        for tag in canvas.gettags("current"):
+            card_dict = cards.get(tag)
+            if card_dict is not None:
+                return card_dict
+        return None
 
-    def render_cards_in_column(self, row_name: str, col_name: str, container: tk.Frame, cards: dict):
+    def _dispatch_card_event(self, event, handler):
+        card_dict = self._card_under_pointer(event.widget)
+        if card_dict is None:
+            return
+        row_name, col_name = event.widget._card_column
+        handler(event, row_name, col_name, card_dict["front"])
+
+    def _on_card_canvas_configure(self, event):
+        canvas = event.widget
+        if event.width == canvas._layout_width:
+            return
+        table_data = self.get_current_table_data()
+        if table_data is not None:
+            row_name, col_name = canvas._card_column
+            self.render_cards_in_column(row_name, col_name, canvas, table_data["cards"])
+
+    def render_cards_in_column(self, row_name: str, col_name: str, container: tk.Canvas, cards: dict):
+        # Cards are drawn as canvas items; only the note and weight buttons are real widgets.
         for widget in container.winfo_children():
             widget.destroy()
+        container.delete("all")
+        container._cards = {}
+        container._card_slots = {}
+        container._card_widgets = {}
+        container._card_tags = {}
+        container._weight_items = {}
+        width = container.winfo_width()
+        container._layout_width = width
+        if width <= 1:
+            # Not mapped yet; the first <Configure> lays the cards out again at the real width.
+            width = CARD_CANVAS_MIN_WIDTH
 
         if row_name not in cards or col_name not in cards[row_name]:
+            container.configure(height=1)
             return
 
-        for card_dict in cards[row_name][col_name]:
-            card_front = card_dict["front"]
-            base_bg = CARD_DELETE_BG if self.delete_mode else CARD_BG
-            highlight_color = self.primary_accent if card_dict["marked"] else CARD_BORDER
-            thickness = 2 if (card_dict["marked"] or self.delete_mode) else 1
-            card_frame = tk.Frame(
-                container,
-                bg=base_bg,
-                padx=12,
-                pady=10,
-                bd=0,
-                highlightbackground=highlight_color,
-                highlightthickness=thickness,
-            )
-            card_frame.pack(fill=tk.X, pady=6)
-            self._bind_card_widget(card_frame, row_name, col_name, card_front)
-            card_frame._is_card_frame = True
-            card_frame._card_payload = card_dict
-
-            header_bar = tk.Frame(card_frame, bg=base_bg)
-            header_bar.pack(fill=tk.X)
-            self._bind_card_widget(header_bar, row_name, col_name, card_front)
-
-            title = tk.Label(
-                header_bar,
-                text=card_front,
-                font=("Segoe UI", 11, "bold"),
-                bg=base_bg,
-                fg=TEXT_PRIMARY,
-                wraplength=220,
-                justify=tk.LEFT,
-            )
-            title.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            self._bind_card_widget(title, row_name, col_name, card_front)
-
-            has_back_text = bool(card_dict.get("back", "").strip())
-            note_bg = self.primary_accent if has_back_text else CARD_BORDER
-            note_fg = "#ffffff" if has_back_text else TEXT_PRIMARY
-            note_button = tk.Button(
-                header_bar,
-                text="📝",
-                width=2,
-                bg=note_bg,
-                fg=note_fg,
-                bd=0,
-                relief="flat",
-                activebackground=self.primary_accent,
-                activeforeground="#ffffff",
-                command=lambda rn=row_name, cn=col_name, cf=card_front: self._open_card_back_editor(rn, cn, cf),
-            )
-            note_button.pack(side=tk.RIGHT, padx=(8, 0))
-
-            if card_dict.get("back"):
-                display_text = card_dict["back"]
-                if len(display_text) > 120:
-                    display_text = display_text[:120] + "…"
-                snippet = tk.Label(
-                    card_frame,
-                    text=display_text,
-                    font=("Segoe UI", 9),
-                    bg=base_bg,
-                    fg=TEXT_MUTED,
-                    justify=tk.LEFT,
-                    wraplength=220,
-                )
-                snippet.pack(fill=tk.X, pady=(6, 0))
-                self._bind_card_widget(snippet, row_name, col_name, card_front)
-
-            weight = self._extract_card_weight(card_dict)
-            weight_controls = tk.Frame(card_frame, bg=base_bg)
-            weight_controls.pack(fill=tk.X, pady=(10, 0))
-            control_bg = CARD_BORDER
-
-            minus_btn = tk.Button(
-                weight_controls,
-                text="<",
-                width=2,
-                bg=control_bg,
-                fg=TEXT_PRIMARY,
-                activebackground=self.primary_accent,
-                activeforeground=TEXT_PRIMARY,
-                relief="flat",
-                bd=0,
-                command=lambda rn=row_name, cn=col_name, cf=card_front: self.adjust_card_weight(rn, cn, cf, -self.card_weight_step),
-            )
-            minus_btn.pack(side=tk.LEFT)
-
-            weight_label = tk.Label(
-                weight_controls,
-                text=f"Gewicht: {weight:.0f}",
-                bg=base_bg,
-                fg=TEXT_MUTED,
-                font=("Segoe UI", 9, "bold"),
-            )
-            weight_label.pack(side=tk.LEFT, expand=True, padx=6)
-
-            plus_btn = tk.Button(
-                weight_controls,
-                text=">",
-                width=2,
-                bg=control_bg,
-                fg=TEXT_PRIMARY,
-                activebackground=self.primary_accent,
-                activeforeground=TEXT_PRIMARY,
-                relief="flat",
-                bd=0,
-                command=lambda rn=row_name, cn=col_name, cf=card_front: self.adjust_card_weight(rn, cn, cf, self.card_weight_step),
+        # Everything that is the same for every card of this render is looked up once here.
+        wmin = self.card_weight_min
+        inv_range = 1.0 / (self.card_weight_max - wmin)
+        style = (
+            THEME.CARD_DELETE_BG if self.delete_mode else THEME.CARD_BG,
+            THEME.CARD_BORDER,
+            self.primary_accent,
+            THEME.TEXT_PRIMARY,
+            THEME.TEXT_MUTED,
+            self.delete_mode,
+            self._measure_card_button(),
+            wmin,
+            inv_range,
+        )
+        draw_card = self._draw_card
+        column_cards = container._cards
+        top = 6
+        for index, card_dict in enumerate(cards[row_name][col_name]):
+            tag = f"card{index}"
+            column_cards[tag] = card_dict
+            top = draw_card(container, tag, card_dict, width, top, style) + 12
+        container.configure(height=max(1, top - 6))
+        self._sync_column_widgets(container)
+
+    def _measure_card_button(self) -> tuple[int, int]:
+        if self._card_button_size is None:
+            probe = tk.Button(self.table, text="<", width=2, bd=0, relief="flat")
+            self._card_button_size = (probe.winfo_reqwidth(), probe.winfo_reqheight())
+            probe.destroy()
+        return self._card_button_size
+
+    def _note_icon(self, color: str) -> tk.PhotoImage:
+        # A small page glyph drawn once per colour and shared by every note button instead of shaping the emoji per widget.
+        icon = self._note_icons.get(color)
+        if icon is None:
+            icon = tk.PhotoImage(master=self.root, width=12, height=14)
+            icon.put(color, to=(1, 0, 11, 1))
+            icon.put(color, to=(1, 13, 11, 14))
+            icon.put(color, to=(1, 0, 2, 14))
+            icon.put(color, to=(10, 0, 11, 14))
+            for line_y in (4, 7, 10):
+                icon.put(color, to=(3, line_y, 9, line_y + 1))
+            self._note_icons[color] = icon
+        return icon
+
+    def _draw_card(self, canvas: tk.Canvas, tag: str, card_dict: dict, width: int, top: int, style: tuple) -> int:
+        # Draws the static parts of a card; its buttons are created by _materialize_card once it scrolls into view.
+        base_bg, card_border, accent, text_primary, text_muted, delete_mode, button_size, wmin, inv_range = style
+        button_width, button_height = button_size
+        card_front = card_dict["front"]
+        tags = (tag, "card")
+        marked = card_dict["marked"]
+        highlight_color = accent if marked else card_border
+        thickness = 2 if (marked or delete_mode) else 1
+        left = 12 + thickness
+        right = width - left
+        frame_id = canvas.create_rectangle(0, top, width - 1, top, fill=base_bg, outline=highlight_color, width=thickness, tags=tags)
+        note_y = y = top + 10 + thickness
+
+        title_id = canvas.create_text(
+            left,
+            y,
+            text=card_front,
+            anchor=tk.NW,
+            width=min(220, max(40, right - left - button_width - 8)),
+            font=self._font(11, "bold"),
+            fill=text_primary,
+            tags=tags,
+        )
+        y = max(canvas.bbox(title_id)[3], y + button_height)
+
+        if card_dict.get("back"):
+            display_text = card_dict["back"]
+            if len(display_text) > 120:
+                display_text = display_text[:120] + "…"
+            snippet_id = canvas.create_text(
+                left,
+                y + 6,
+                text=display_text,
+                anchor=tk.NW,
+                width=min(220, right - left),
+                font=self._font(9),
+                fill=text_muted,
+                tags=tags,
             )
-            plus_btn.pack(side=tk.RIGHT)
-
-            weight_bar = tk.Frame(card_frame, bg=base_bg)
-            weight_bar.pack(fill=tk.X, pady=(4, 0))
-            weight_canvas = tk.Canvas(weight_bar, height=6, bg=base_bg, highlightthickness=0)
-            weight_canvas.pack(fill=tk.X)
-            width = 150
-            weight_canvas.configure(width=width)
-            weight_canvas.create_rectangle(0, 0, width, 6, fill=CARD_BORDER, outline="")
-            normalized = (weight - self.card_weight_min) / (self.card_weight_max - self.card_weight_min)
-            normalized = max(0.0, min(1.0, normalized))
-            weight_canvas.create_rectangle(0, 0, int(width * normalized), 6, fill=self.primary_accent, outline="")
+            y = canvas.bbox(snippet_id)[3]
+
+        weight = card_dict["weight"]
+        y += 10
+        control_y = y
+        weight_text_id = canvas.create_text(
+            width // 2,
+            y + button_height // 2,
+            text=f"Gewicht: {weight:.0f}",
+            fill=text_muted,
+            font=self._font(9, "bold"),
+            tags=tags,
+        )
+        y += button_height + 4
+
+        bar_width = min(150, right - left)
+        normalized = min(1.0, max(0.0, (weight - wmin) * inv_range))
+        canvas.create_rectangle(left, y, left + bar_width, y + 6, fill=card_border, outline="", tags=tags)
+        bar_id = canvas.create_rectangle(left, y, left + int(bar_width * normalized), y + 6, fill=accent, outline="", tags=tags)
+        bottom = y + 6 + 10 + thickness
+        canvas.coords(frame_id, 0, top, width - 1, bottom)
+        canvas._card_slots[tag] = (top, bottom, left, right, note_y, control_y)
+        canvas._card_tags[id(card_dict)] = tag
+        canvas._weight_items[tag] = (weight_text_id, bar_id, left, y, bar_width)
+        return bottom
+
+    def _materialize_card(self, canvas: tk.Canvas, tag: str):
+        row_name, col_name = canvas._card_column
+        card_dict = canvas._cards[tag]
+        card_front = card_dict["front"]
+        _top, _bottom, left, right, note_y, control_y = canvas._card_slots[tag]
+        has_back_text = bool(card_dict.get("back", "").strip())
+        note_bg = self.primary_accent if has_back_text else THEME.CARD_BORDER
+        note_fg = "#ffffff" if has_back_text else THEME.TEXT_PRIMARY
+        button_width, button_height = self._measure_card_button()
+        note_button = tk.Button(
+            canvas,
+            image=self._note_icon(note_fg),
+            compound="center",
+            width=button_width,
+            height=button_height,
+            bg=note_bg,
+            fg=note_fg,
+            bd=0,
+            relief="flat",
+            activebackground=self.primary_accent,
+            activeforeground="#ffffff",
+            command=partial(self._open_card_back_editor, row_name, col_name, card_front),
+        )
+        control_bg = THEME.CARD_BORDER
+        minus_btn = tk.Button(
+            canvas,
+            text="<",
+            width=2,
+            bg=control_bg,
+            fg=THEME.TEXT_PRIMARY,
+            activebackground=self.primary_accent,
+            activeforeground=THEME.TEXT_PRIMARY,
+            relief="flat",
+            bd=0,
+            command=partial(self.adjust_card_weight, row_name, col_name, card_front, -self.card_weight_step),
+        )
+        plus_btn = tk.Button(
+            canvas,
+            text=">",
+            width=2,
+            bg=control_bg,
+            fg=THEME.TEXT_PRIMARY,
+            activebackground=self.primary_accent,
+            activeforeground=THEME.TEXT_PRIMARY,
+            relief="flat",
+            bd=0,
+            command=partial(self.adjust_card_weight, row_name, col_name, card_front, self.card_weight_step),
+        )
+        item_ids = (
+            canvas.create_window(right, note_y, window=note_button, anchor=tk.NE),
+            canvas.create_window(left, control_y, window=minus_btn, anchor=tk.NW),
+            canvas.create_window(right, control_y, window=plus_btn, anchor=tk.NE),
+        )
+        canvas._card_widgets[tag] = (item_ids, (note_button, minus_btn, plus_btn))
+
+    def _release_card(self, canvas: tk.Canvas, tag: str):
+        item_ids, buttons = canvas._card_widgets.pop(tag)
+        canvas.delete(*item_ids)
+        for button in buttons:
+            button.destroy()
+
+    def _sync_column_widgets(self, canvas: tk.Canvas, viewport: tuple[int, int] | None = None):
+        # Only cards near the visible part of the board own real button widgets; far-away ones give them back.
+        if viewport is None:
+            viewport = (self.canvas.winfo_rooty(), max(self.canvas.winfo_height(), 1))
+        viewport_top, view_height = viewport
+        view_top = viewport_top - canvas.winfo_rooty()
+        view_bottom = view_top + view_height
+        keep_top = view_top - 2 * view_height
+        keep_bottom = view_bottom + 2 * view_height
+        widgets = canvas._card_widgets
+        release = self._release_card
+        materialize = self._materialize_card
+        for tag, (top, bottom, *_positions) in canvas._card_slots.items():
+            if tag in widgets:
+                if bottom < keep_top or top > keep_bottom:
+                    release(canvas, tag)
+            elif bottom >= view_top and top <= view_bottom:
+                materialize(canvas, tag)
+
+    def _update_card_weight_items(self, row_name: str, col_name: str, card_dict: dict) -> bool:
+        # A weight change only touches the label text and the bar of one card, so the column is not redrawn.
+        canvas = self.card_columns.get((row_name, col_name))
+        if canvas is None:
+            return False
+        tag = canvas._card_tags.get(id(card_dict))
+        if tag is None:
+            return False
+        weight_text_id, bar_id, left, top, bar_width = canvas._weight_items[tag]
+        weight = card_dict["weight"]
+        wmin = self.card_weight_min
+        normalized = min(1.0, max(0.0, (weight - wmin) / (self.card_weight_max - wmin)))
+        canvas.itemconfigure(weight_text_id, text=f"Gewicht: {weight:.0f}")
+        canvas.coords(bar_id, left, top, left + int(bar_width * normalized), top + 6)
+        return True
 
     def refresh_card_column(self, row_name: str, col_name: str) -> bool:
         container = self.card_columns.get((row_name, col_name))
@@ -1717,18 +2105,13 @@ class CardApp:
         cards = table_data["cards"]
         columns = table_data["columns"]
         row_colors = table_data["row_colors"]
-        if row_name not in cards:
+        row_cards = cards.get(row_name)
+        if row_cards is None:
             return False
 
-        total_cards = 0
-        for col in columns:
-            if col in cards[row_name]:
-                total_cards += len(cards[row_name][col])
-
         row_color = row_colors.get(row_name, self.primary_accent)
-        ratio = calculate_ratio(row_name, cards, columns)
-        expected_grade = calculate_expected_grade(row_name, cards, columns)
-        header_color = row_color or PANEL_BG
+        total_cards, ratio, expected_grade = self._row_statistics(self.data.get("current_table"), row_name, cards, columns)
+        header_color = row_color or THEME.PANEL_BG
 
         header = header_info.get("frame")
         title = header_info.get("title")
@@ -1737,27 +2120,30 @@ class CardApp:
         if not header or not title or not subtitle:
             return False
 
+        # Only what actually changed is sent to Tk; a weight tick usually just changes the subtitle text.
+        expected = "—" if total_cards == 0 else f"{expected_grade:.2f}"
+        subtitle_text = f"{total_cards} Karten · xG {expected}"
+        if header_info.get("last_text") != subtitle_text:
+            subtitle.configure(text=subtitle_text)
+            header_info["last_text"] = subtitle_text
+        if header_info.get("last_bg") == header_color:
+            return True
         header.configure(bg=header_color)
         title.configure(bg=header_color)
-        expected = "—" if total_cards == 0 else f"{expected_grade:.2f}"
-        subtitle.configure(bg=header_color, text=f"{total_cards} Karten · xG {expected}")
-        for child in header.winfo_children():
-            try:
-                child.configure(bg=header_color)
-            except tk.TclError:
-                continue
+        subtitle.configure(bg=header_color)
         if color_button:
-            button_bg = row_color or PANEL_BG
-            contrast_fg = self._get_contrast_color(button_bg)
+            contrast_fg = self._get_contrast_color(header_color)
             color_button.configure(
-                bg=button_bg,
+                bg=header_color,
                 fg=contrast_fg,
-                activebackground=button_bg,
+                activebackground=header_color,
                 activeforeground=contrast_fg,
             )
+        header_info["last_bg"] = header_color
         return True
 
     def pick_row_color(self, row_name: str):
+        from tkinter import colorchooser
         table_data = self.get_current_table_data()
         if table_data is None:
             return
@@ -1773,17 +2159,23 @@ class CardApp:
         if not new_hex or new_hex == current_color:
             return
 
-        self._record_history()
+        self._record_row_history(row_name)
         row_colors[row_name] = new_hex
-        self.save_data()
+        self._request_save()
         if not self.update_row_header_info(row_name):
-            self.update_table()
+            self._request_rebuild(REBUILD_TABLE)
 
-    def _extract_card_weight(self, card_dict: dict) -> float:
-        try:
-            return float(card_dict.get("weight", 100.0))
-        except (TypeError, ValueError):
-            return 100.0
+    def _find_card_position(self, row_name: str, col_name: str, card_list: list[dict], card_front: str) -> int | None:
+        # Reuses the front -> position index of a column until the column list is replaced or resized.
+        cached = self._front_indexes.get((row_name, col_name))
+        if cached is None or cached[0] is not card_list or cached[1] != len(card_list):
+            cached = (card_list, len(card_list), build_front_index(card_list))
+            self._front_indexes[(row_name, col_name)] = cached
+        return find_card_index(card_list, card_front, cached[2])
+
+    def _find_card_in_column(self, row_name: str, col_name: str, card_list: list[dict], card_front: str) -> dict | None:
+        idx = self._find_card_position(row_name, col_name, card_list, card_front)
+        return None if idx is None else card_list[idx]
 
     def adjust_card_weight(self, row_name: str, col_name: str, card_front: str, delta: float):
         table_data = self.get_current_table_data()
@@ -1792,20 +2184,26 @@ class CardApp:
         cards = table_data["cards"]
         if row_name not in cards or col_name not in cards[row_name]:
             return
-        card_dict = find_card(cards[row_name][col_name], card_front)
+        card_dict = self._find_card_in_column(row_name, col_name, cards[row_name][col_name], card_front)
         if not card_dict:
             return
-        self._record_history()
-        current_weight = self._extract_card_weight(card_dict)
-        new_weight = max(self.card_weight_min, min(self.card_weight_max, current_weight + delta))
-        card_dict["weight"] = round(new_weight, 2)
-        self.save_data()
-        refreshed = self.refresh_card_column(row_name, col_name)
+        current_weight = card_dict["weight"]
+        new_weight = round(max(self.card_weight_min, min(self.card_weight_max, current_weight + delta)), 2)
+        if new_weight == current_weight:
+            return
+        self._record_weight_change(row_name, col_name, card_front, current_weight, new_weight)
+        card_dict["weight"] = new_weight
+        self._invalidate_row_stats(self.data.get("current_table"), row_name)
+        self._request_save()
+        self._show_weight_change(row_name, col_name, card_dict)
+
+    def _show_weight_change(self, row_name: str, col_name: str, card_dict: dict):
+        refreshed = self._update_card_weight_items(row_name, col_name, card_dict) or self.refresh_card_column(row_name, col_name)
         header_updated = True
         if self.selected_row_name == row_name:
             header_updated = self.update_row_header_info(row_name)
         if not refreshed or (self.selected_row_name == row_name and not header_updated):
-            self.update_table()
+            self._request_rebuild(REBUILD_TABLE)
 
     def _create_row_entry(self, row_name: str, preferred_color: str | None = None) -> tuple[bool, str | None]:
         table_data = self.get_current_table_data()
@@ -1817,8 +2215,8 @@ class CardApp:
             return False, "Name darf nicht leer sein"
 
         rows = table_data["rows"]
-        if len(rows) >= 9:
-            return False, "Maximal 9 Tabellen sind erlaubt!"
+        if len(rows) >= MAX_TABLE_ROWS:
+            return False, f"Maximal {MAX_TABLE_ROWS} Tabellen sind erlaubt!"
         if row_name in rows:
             return False, "Tabelle existiert bereits"
 
@@ -1826,15 +2224,15 @@ class CardApp:
         columns = table_data["columns"]
         row_colors = table_data["row_colors"]
 
-        self._record_history()
+        self._record_history(self.data["current_table"])
         rows.append(row_name)
-        cards[row_name] = {col: [] for col in columns}
+        cards[row_name] = empty_card_columns(columns)
         row_colors[row_name] = preferred_color or random_pastel_color()
         self.selected_row_name = row_name
-        self.save_data()
+        self._invalidate_row_stats(self.data.get("current_table"), row_name)
+        self._request_save()
         self.ensure_row_selection_valid()
-        self.build_navigation_tree()
-        self.update_table()
+        self._request_rebuild()
         return True, None
 
     def add_row(self):
@@ -1844,8 +2242,8 @@ class CardApp:
             return
 
         rows = table_data["rows"]
-        if len(rows) >= 9:
-            messagebox.showerror("Fehler", "Maximal 9 Tabellen sind erlaubt!")
+        if len(rows) >= MAX_TABLE_ROWS:
+            messagebox.showerror("Fehler", f"Maximal {MAX_TABLE_ROWS} Tabellen sind erlaubt!")
             return
 
         self._bring_dialog_to_front()
@@ -1860,13 +2258,17 @@ class CardApp:
         color_value = tk.StringVar(value=random_pastel_color())
 
         color_chip = tk.Canvas(dialog, width=120, height=24, highlightthickness=0, bd=0)
+        chip_color: list[str | None] = [None]
 
         def update_preview(*_args):
-            # Keep preview text and color swatch in sync with user input.
+            # Keep preview text and color swatch in sync with user input; the swatch only changes on a reroll.
             row_name = name_var.get().strip() or "Neue Tabelle"
             preview_var.set(f"Name: {row_name}")
-            color_preview.set(f"Vorschlagsfarbe: {color_value.get()}")
-            color_chip.configure(bg=color_value.get())
+            color = color_value.get()
+            if color != chip_color[0]:
+                color_preview.set(f"Vorschlagsfarbe: {color}")
+                color_chip.configure(bg=color)
+                chip_color[0] = color
 
         def shuffle_color():
             color_value.set(random_pastel_color())
@@ -1876,7 +2278,7 @@ class CardApp:
         entry = ttk.Entry(dialog, textvariable=name_var, width=30)
         entry.pack(padx=16, fill=tk.X)
         ttk.Label(dialog, textvariable=preview_var).pack(padx=16, pady=(10, 0), anchor=tk.W)
-        ttk.Label(dialog, textvariable=color_preview, foreground=TEXT_MUTED).pack(padx=16, pady=(0, 4), anchor=tk.W)
+        ttk.Label(dialog, textvariable=color_preview, foreground=THEME.TEXT_MUTED).pack(padx=16, pady=(0, 4), anchor=tk.W)
         color_chip.pack(padx=16, pady=(0, 8), anchor=tk.W, fill=tk.X)
         ttk.Button(dialog, text="Farbe neu würfeln", command=shuffle_color).pack(padx=16, pady=(0, 8), anchor=tk.W)
         error_var = tk.StringVar()
@@ -1892,9 +2294,25 @@ class CardApp:
         ttk.Button(dialog, text="Anlegen", command=submit).pack(padx=16, pady=(0, 16))
         entry.focus_set()
         dialog.bind("<Return>", lambda event: submit())
-        name_var.trace_add("write", update_preview)
+        name_var.trace_add("write", self._debounced_trace(dialog, update_preview))
         update_preview()
 
+    def _debounced_trace(self, widget: tk.Misc, callback, delay_ms: int = PREVIEW_DEBOUNCE_MS):
+        # Returns a variable trace that runs the callback once typing pauses instead of on every keystroke.
+        pending: list[str | None] = [None]
+
+        def run():
+            pending[0] = None
+            if widget.winfo_exists():
+                callback()
+
+        def schedule(*_args):
+            if pending[0] is not None:
+                widget.after_cancel(pending[0])
+            pending[0] = widget.after(delay_ms, run)
+
+        return schedule
+
     def delete_row(self):
         table_data = self.get_current_table_data()
         if table_data is None:
@@ -1911,16 +2329,16 @@ class CardApp:
 
         row_name = self._prompt_row_name("Tabelle löschen", "Welche Tabelle möchtest du löschen?", rows)
         if row_name and row_name in rows:
-            self._record_history()
+            self._record_history(self.data["current_table"])
             rows.remove(row_name)
             cards.pop(row_name, None)
             row_colors.pop(row_name, None)
             if self.selected_row_name == row_name:
                 self.selected_row_name = None
-            self.save_data()
+            self._invalidate_row_stats(self.data.get("current_table"), row_name)
+            self._request_save()
             self.ensure_row_selection_valid()
-            self.build_navigation_tree()
-            self.update_table()
+            self._request_rebuild()
         else:
             messagebox.showerror("Fehler", "Tabelle nicht gefunden.")
 
@@ -1937,8 +2355,8 @@ class CardApp:
 
         matching_list = tk.Listbox(dialog, height=6)
         matching_list.pack(fill=tk.X, padx=16, pady=(0, 12))
-        for option in options:
-            matching_list.insert(tk.END, option)
+        if options:
+            matching_list.insert(tk.END, *options)
 
         result = {"value": None}
 
@@ -1990,18 +2408,35 @@ class CardApp:
         row_colors = table_data["row_colors"]
         columns = table_data["columns"]
         row_name = self.selected_row_name
+        row_color = row_colors.get(row_name, self.primary_accent)
+
+        # The header and column widgets only depend on which row is shown and its columns; anything else is a data update.
+        layout_key = (self.data.get("current_table"), row_name, tuple(columns), row_color)
+        if layout_key == self._table_layout_key and self._sync_table_data(row_name, columns, cards):
+            return
+        self._rebuild_table_layout(row_name, columns, cards, row_color)
+        self._table_layout_key = layout_key
 
+    def _rebuild_table_layout(self, row_name: str, columns: list[str], cards: dict, row_color: str):
         for widget in self.table.winfo_children():
             widget.destroy()
 
-        total_cards = sum(len(cards[row_name][col]) for col in columns)
-        ratio = calculate_ratio(row_name, cards, columns)
-        expected_grade = calculate_expected_grade(row_name, cards, columns)
-        row_color = row_colors.get(row_name, self.primary_accent)
+        # Count, ratio and grade come from one cached pass over the row.
+        total_cards, ratio, expected_grade = self._row_statistics(self.data.get("current_table"), row_name, cards, columns)
 
         self.render_row_header(row_name, ratio, expected_grade, row_color, total_cards)
         self.render_board_for_row(row_name, columns, cards, row_color)
 
+    def _sync_table_data(self, row_name: str, columns: list[str], cards: dict) -> bool:
+        # Redraws the card items of the existing column canvases and the header labels without recreating widgets.
+        self._clear_column_highlight()
+        for col_name in columns:
+            container = self.card_columns.get((row_name, col_name))
+            if container is None:
+                return False
+            self.render_cards_in_column(row_name, col_name, container, cards)
+        return self.update_row_header_info(row_name)
+
     def add_card_to_row(self, row_index: int):
         table_data = self.get_current_table_data()
         if table_data is None:
@@ -2030,47 +2465,76 @@ class CardApp:
         card_name = prompt.get("value")
         if card_name:
             first_col = columns[0]
-            self._record_history()
+            self._record_row_history(row_name)
             cards[row_name][first_col].append(create_card(card_name))
             self.selected_row_name = row_name
-            self.save_data()
-            self.build_navigation_tree()
-            self.update_table()
-
-    def _build_card_prompt(self, row_name: str) -> dict | None:
+            self._invalidate_row_stats(self.data.get("current_table"), row_name)
+            self._request_save()
+            self._request_rebuild()
+
+    def _get_card_prompt(self) -> dict[str, object]:
+        # The card name dialog is built once and only withdrawn between prompts, so repeated adds create no widgets.
+        prompt = self._card_prompt
+        if prompt is not None and prompt["dialog"].winfo_exists():
+            return prompt
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Karte hinzufügen")
         dialog.resizable(False, False)
-        self.register_dialog(dialog)
+        dialog.transient(self.root)
 
-        ttk.Label(dialog, text=f"Wie soll die Karte für '{row_name}' heißen?").pack(padx=16, pady=(16, 8))
-        name_var = tk.StringVar()
+        label = ttk.Label(dialog)
+        label.pack(padx=16, pady=(16, 8))
+        name_var = tk.StringVar(master=dialog)
         entry = ttk.Entry(dialog, textvariable=name_var, width=32)
         entry.pack(padx=16, pady=(0, 12))
-
-        result = {"value": None}
+        outcome_var = tk.StringVar(master=dialog)
 
         def submit():
-            value = name_var.get().strip()
-            if not value:
-                return
-            result["value"] = value
-            self.close_dialog(dialog)
+            if name_var.get().strip():
+                outcome_var.set("submit")
 
         def cancel():
-            result["value"] = None
-            self.close_dialog(dialog)
+            outcome_var.set("cancel")
 
         button_frame = ttk.Frame(dialog)
         button_frame.pack(padx=16, pady=(0, 16), fill=tk.X)
         ttk.Button(button_frame, text="Abbrechen", command=cancel).pack(side=tk.RIGHT, padx=(8, 0))
         ttk.Button(button_frame, text="Speichern", command=submit).pack(side=tk.RIGHT)
 
-        entry.focus_set()
         dialog.bind("<Return>", lambda event: submit())
         dialog.bind("<Escape>", lambda event: cancel())
-        self.root.wait_window(dialog)
-        return result
+        dialog.protocol("WM_DELETE_WINDOW", cancel)
+        prompt = {"dialog": dialog, "label": label, "entry": entry, "name": name_var, "outcome": outcome_var}
+        self._card_prompt = prompt
+        return prompt
+
+    def _build_card_prompt(self, row_name: str) -> dict | None:
+        prompt = self._get_card_prompt()
+        dialog = prompt["dialog"]
+        prompt["label"].configure(text=f"Wie soll die Karte für '{row_name}' heißen?")
+        prompt["name"].set("")
+        prompt["outcome"].set("")
+
+        dialog.deiconify()
+        self.active_dialogs.append(dialog)
+        dialog.grab_set()
+        self._bring_dialog_to_front()
+        prompt["entry"].focus_set()
+        try:
+            self.root.wait_variable(prompt["outcome"])
+        finally:
+            if dialog in self.active_dialogs:
+                self.active_dialogs.remove(dialog)
+            try:
+                dialog.grab_release()
+                dialog.withdraw()
+            except tk.TclError:
+                pass
+
+        if prompt["outcome"].get() != "submit":
+            return {"value": None}
+        return {"value": prompt["name"].get().strip()}
 
     def add_card_via_button(self):
         table_data = self.get_current_table_data()
@@ -2099,38 +2563,137 @@ class CardApp:
         self.selected_row_name = row_name
         self.add_card_to_row_by_name(row_name)
 
-    def save_data(self):
+    def save_data(self) -> Future:
         global SAVE_FILE
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         with self.smooth_state_transition():
-            try:
-                directory = os.path.dirname(SAVE_FILE)
-                if directory:
-                    os.makedirs(directory, exist_ok=True)
-                with open(SAVE_FILE, "w", encoding='utf-8') as f:
-                    json.dump(self.data, f, indent=4, ensure_ascii=False)
-            except Exception as exc:
-                messagebox.showerror("Fehler", f"Fehler beim Speichern der Daten: {exc}")
+            # The snapshot is encoded here so the worker never sees self.data mid-edit; only the disk write is offloaded.
+            payload = dump_json_bytes(self.data)
+            saved = (SAVE_FILE, hashlib.blake2b(payload, digest_size=16).digest())
+            if saved == self._saved_digest and not self._journal_length:
+                # Identical to the last snapshot written to this file, so the rewrite is skipped.
+                future = Future()
+                future.set_result(None)
+                return future
+            self._saved_digest = saved
+            future = self._submit_write(write_save_file, SAVE_FILE, payload, on_error=self._on_save_error)
+            self._journal_length = 0
             self.update_file_path_label()
+        return future
+
+    def _on_save_error(self, exc: BaseException):
+        # The file no longer matches the remembered snapshot, so the next save must write again.
+        self._saved_digest = None
+        messagebox.showerror("Fehler", f"Fehler beim Speichern der Daten: {exc}")
+
+    def _request_save(self):
+        # Bursts of edits (e.g. repeated weight clicks) share one full save once they pause.
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(SAVE_DEBOUNCE_MS, self._flush_pending_save)
+
+    def _flush_pending_save(self):
+        if self._save_after_id is not None:
+            self.save_data()
+
+    def _submit_write(self, task, *args, on_error=None, on_success=None) -> Future:
+        future = self._save_executor.submit(task, *args)
+        self.root.after(100, self._poll_write, future, on_error, on_success)
+        return future
+
+    def _poll_write(self, future: Future, on_error=None, on_success=None):
+        if not future.done():
+            self.root.after(100, self._poll_write, future, on_error, on_success)
+            return
+        exc = future.exception()
+        if exc is None:
+            if on_success is not None:
+                on_success()
+            return
+        if on_error is not None:
+            on_error(exc)
+        else:
+            messagebox.showerror("Fehler", f"Fehler beim Speichern der Daten: {exc}")
+
+    def _wait_for_writes(self):
+        # The worker runs tasks in order, so an empty task finishing means every earlier write is on disk.
+        self._save_executor.submit(lambda: None).result()
 
     def load_data(self):
         global SAVE_FILE
         with self.smooth_state_transition():
+            self._flush_pending_save()
+            self._wait_for_writes()
+            self._saved_digest = None
             try:
-                with open(SAVE_FILE, "r", encoding='utf-8') as f:
-                    self.data = json.load(f)
+                self.data = load_json_file(SAVE_FILE)
             except FileNotFoundError:
                 self.data = {"tables": {}, "current_table": None}
             except json.JSONDecodeError:
                 messagebox.showerror("Fehler", "Die JSON-Datei ist beschädigt oder hat ein ungültiges Format.")
                 self.data = {"tables": {}, "current_table": None}
+            self._invalidate_nav_cache()
 
             if "tables" not in self.data:
                 self.data["tables"] = {}
             if "current_table" not in self.data:
                 self.data["current_table"] = None
 
+            entries = read_journal(journal_path_for(SAVE_FILE))
+            self._replay_journal(entries)
+            self._journal_length = len(entries)
+            # Card weights are coerced to float here once, so the UI can read them without validation.
+            self.convert_old_cards_format()
+
             self.update_file_path_label()
 
+    def _journal_card_move(self, source_row: str, source_col: str, target_row: str, target_col: str, card_front: str):
+        # Persists a single card move as one journal line instead of rewriting the whole save file.
+        self._invalidate_row_stats(self.data.get("current_table"), source_row, target_row)
+        if self._save_after_id is not None:
+            # The pending full save will contain this move anyway.
+            return
+        if self._journal_length >= JOURNAL_COMPACT_THRESHOLD:
+            self.save_data()
+            return
+        entry = {
+            "op": "move",
+            "t": self.data.get("current_table"),
+            "src": [source_row, source_col],
+            "dst": [target_row, target_col],
+            "front": card_front,
+        }
+        # Appends go through the save worker so they cannot race a pending full save that clears the journal.
+        self._submit_write(
+            append_journal_entry,
+            journal_path_for(SAVE_FILE),
+            entry,
+            on_error=lambda _exc: self.save_data(),
+        )
+        self._journal_length += 1
+
+    def _replay_journal(self, entries: list[dict]):
+        tables = self.data.get("tables", {})
+        for entry in entries:
+            if entry.get("op") != "move":
+                continue
+            try:
+                source_row, source_col = entry["src"]
+                target_row, target_col = entry["dst"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            cards = tables.get(entry.get("t"), {}).get("cards", {})
+            source_cards = cards.get(source_row, {}).get(source_col)
+            target_cards = cards.get(target_row, {}).get(target_col)
+            if source_cards is None or target_cards is None:
+                continue
+            idx = find_card_index(source_cards, str(entry.get("front", "")))
+            if idx is None:
+                continue
+            target_cards.append(source_cards.pop(idx))
+
     def open_options_dialog(self):
         options_popup = tk.Toplevel(self.root)
         options_popup.title("Optionen")
@@ -2161,12 +2724,16 @@ class CardApp:
         inline_status_var = tk.StringVar()
 
         inline_color_chip = tk.Canvas(inline_frame, width=120, height=24, highlightthickness=0, bd=0)
+        inline_chip_color: list[str | None] = [None]
 
         def inline_update_preview(*_args):
             row_name = inline_name_var.get().strip() or "Neue Tabelle"
             inline_preview_var.set(f"Name: {row_name}")
-            inline_color_label.set(f"Farbe: {inline_color_value.get()}")
-            inline_color_chip.configure(bg=inline_color_value.get())
+            color = inline_color_value.get()
+            if color != inline_chip_color[0]:
+                inline_color_label.set(f"Farbe: {color}")
+                inline_color_chip.configure(bg=color)
+                inline_chip_color[0] = color
 
         def inline_shuffle_color():
             inline_color_value.set(random_pastel_color())
@@ -2187,7 +2754,7 @@ class CardApp:
 
         ttk.Entry(inline_frame, textvariable=inline_name_var).pack(fill=tk.X, pady=(8, 4))
         ttk.Label(inline_frame, textvariable=inline_preview_var).pack(anchor=tk.W)
-        ttk.Label(inline_frame, textvariable=inline_color_label, foreground=TEXT_MUTED).pack(anchor=tk.W, pady=(2, 0))
+        ttk.Label(inline_frame, textvariable=inline_color_label, foreground=THEME.TEXT_MUTED).pack(anchor=tk.W, pady=(2, 0))
         inline_color_chip.pack(anchor=tk.W, pady=(2, 4))
         ttk.Button(inline_frame, text="Farbe neu würfeln", command=inline_shuffle_color).pack(anchor=tk.W)
         ttk.Button(inline_frame, text="Tabelle erstellen", command=submit_inline_row).pack(fill=tk.X, pady=(8, 4))
@@ -2213,21 +2780,19 @@ class CardApp:
             if not confirm:
                 return
 
-            self._record_history()
+            self._record_history(table_name)
             self.data["tables"].pop(table_name, None)
+            self._invalidate_nav_cache(table_name)
             if self.data["current_table"] == table_name:
-                if self.data["tables"]:
-                    self.data["current_table"] = list(self.data["tables"].keys())[0]
-                else:
-                    self.data["current_table"] = None
+                self.data["current_table"] = next(iter(self.data["tables"]), None)
+                if self.data["current_table"] is None:
                     self.new_table(skip_history=True)
             self.selected_row_name = None
 
             self.save_data()
             self.ensure_row_selection_valid()
-            self.build_navigation_tree()
-            self.update_table()
-            messagebox.showinfo("Erfolg", f"Space '{table_name}' wurde gelöscht.")
+            self._request_rebuild()
+            self._notify_success("Erfolg", f"Space '{table_name}' wurde gelöscht.")
             delete_popup.destroy()
             popup.destroy()
 
@@ -2292,7 +2857,7 @@ class CardApp:
         ttk.Label(dialog, text="Spaltenanzahl").pack(padx=16, pady=(12, 4), anchor=tk.W)
         cols_entry = ttk.Entry(dialog, textvariable=cols_var, width=10)
         cols_entry.pack(padx=16, fill=tk.X)
-        ttk.Label(dialog, textvariable=preview_var, wraplength=280, foreground=TEXT_MUTED).pack(padx=16, pady=12)
+        ttk.Label(dialog, textvariable=preview_var, wraplength=280, foreground=THEME.TEXT_MUTED).pack(padx=16, pady=12)
 
         error_var = tk.StringVar()
         error_label = ttk.Label(dialog, textvariable=error_var, foreground="red")
@@ -2300,7 +2865,7 @@ class CardApp:
 
         ttk.Separator(dialog, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=16, pady=(0, 12))
         ttk.Label(dialog, text="Tabellen vorbereiten", font=("Segoe UI", 10, "bold")).pack(padx=16, anchor=tk.W)
-        ttk.Label(dialog, text="Tabellen verwenden die oben festgelegte Spaltenanzahl.", foreground=TEXT_MUTED).pack(padx=16, pady=(0, 8), anchor=tk.W)
+        ttk.Label(dialog, text="Tabellen verwenden die oben festgelegte Spaltenanzahl.", foreground=THEME.TEXT_MUTED).pack(padx=16, pady=(0, 8), anchor=tk.W)
 
         pending_frame = ttk.Frame(dialog)
         pending_frame.pack(fill=tk.X, padx=16)
@@ -2309,10 +2874,16 @@ class CardApp:
         pending_name_entry.grid(row=0, column=0, sticky=tk.EW, pady=(0, 6))
         pending_frame.columnconfigure(0, weight=1)
 
+        shown_pending: list[tuple[str, ...]] = [()]
+
         def refresh_pending_list():
-            pending_listbox.delete(0, tk.END)
-            for idx, row_name in enumerate(pending_rows, start=1):
-                pending_listbox.insert(tk.END, f"{idx}. {row_name}")
+            # The listbox is refilled with one insert call, and not at all if the entries are unchanged.
+            entries = tuple(f"{idx}. {row_name}" for idx, row_name in enumerate(pending_rows, start=1))
+            if entries != shown_pending[0]:
+                pending_listbox.delete(0, tk.END)
+                if entries:
+                    pending_listbox.insert(tk.END, *entries)
+                shown_pending[0] = entries
             pending_status_var.set(f"{len(pending_rows)} Tabellen geplant")
 
         def add_pending_row():
@@ -2320,8 +2891,8 @@ class CardApp:
             if not row_name:
                 pending_error_var.set("Tabellenname darf nicht leer sein")
                 return
-            if len(pending_rows) >= 9:
-                pending_error_var.set("Maximal 9 Tabellen pro Space")
+            if len(pending_rows) >= MAX_TABLE_ROWS:
+                pending_error_var.set(f"Maximal {MAX_TABLE_ROWS} Tabellen pro Space")
                 return
             if row_name in pending_rows:
                 pending_error_var.set("Tabelle bereits geplant")
@@ -2346,7 +2917,7 @@ class CardApp:
         pending_listbox.pack(fill=tk.X, padx=16, pady=(0, 4))
         ttk.Button(dialog, text="Ausgewählte entfernen", command=remove_selected_row).pack(padx=16, anchor=tk.E)
         ttk.Label(dialog, textvariable=pending_error_var, foreground="red").pack(padx=16, pady=(4, 0), anchor=tk.W)
-        ttk.Label(dialog, textvariable=pending_status_var, foreground=TEXT_MUTED).pack(padx=16, pady=(0, 8), anchor=tk.W)
+        ttk.Label(dialog, textvariable=pending_status_var, foreground=THEME.TEXT_MUTED).pack(padx=16, pady=(0, 8), anchor=tk.W)
         pending_status_var.set("0 Tabellen geplant")
         refresh_pending_list()
 
@@ -2369,26 +2940,26 @@ class CardApp:
 
             columns = generate_columns(num_cols)
             if not skip_history:
-                self._record_history()
+                self._record_history(table_name)
             self.data["tables"][table_name] = {"rows": [], "cards": {}, "row_colors": {}, "columns": columns}
+            self._invalidate_nav_cache(table_name)
             self.data["current_table"] = table_name
             rows = self.data["tables"][table_name]["rows"]
             cards = self.data["tables"][table_name]["cards"]
             row_colors = self.data["tables"][table_name]["row_colors"]
             for row_name in pending_rows:
                 rows.append(row_name)
-                cards[row_name] = {col: [] for col in columns}
+                cards[row_name] = empty_card_columns(columns)
                 row_colors[row_name] = random_pastel_color()
             self.selected_row_name = pending_rows[0] if pending_rows else None
-            self.root.title(f"Klausurmaster2D - {table_name}")
             self.save_data()
-            self.build_navigation_tree()
-            self.update_table()
+            self._request_rebuild()
             self.close_dialog(dialog)
 
         ttk.Button(dialog, text="Erstellen", command=submit).pack(padx=16, pady=(0, 16))
-        name_var.trace_add("write", update_preview)
-        cols_var.trace_add("write", update_preview)
+        schedule_preview = self._debounced_trace(dialog, update_preview)
+        name_var.trace_add("write", schedule_preview)
+        cols_var.trace_add("write", schedule_preview)
         update_preview()
         space_name_entry.focus_set()
         dialog.bind("<Return>", lambda event: submit())
@@ -2414,9 +2985,8 @@ class CardApp:
             self.selected_row_name = None
             self.save_data()
             self.ensure_row_selection_valid()
-            self.build_navigation_tree()
-            self.update_table()
-            messagebox.showinfo("Erfolg", f"Space '{table_name}' wurde geladen.")
+            self._request_rebuild()
+            self._notify_success("Erfolg", f"Space '{table_name}' wurde geladen.")
             load_popup.destroy()
             popup.destroy()
 
@@ -2425,13 +2995,13 @@ class CardApp:
             btn.pack(fill=tk.X, pady=2)
 
     def import_save_state(self, parent_popup: tk.Toplevel):
+        from tkinter import filedialog
         import_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")], title="Speicherstand importieren")
         if not import_path:
             return
 
         try:
-            with open(import_path, "r", encoding='utf-8') as f:
-                imported_data = json.load(f)
+            imported_data = load_json_file(import_path)
         except Exception as exc:
             messagebox.showerror("Fehler", f"Fehler beim Laden der Datei: {exc}")
             return
@@ -2447,32 +3017,35 @@ class CardApp:
 
         if merge:
             self._record_history()
+            tables = self.data["tables"]
+            # Only spaces that are actually taken over get normalized; existing ones already are.
             for table_name, table_data in imported_data["tables"].items():
-                if table_name in self.data["tables"]:
-                    overwrite = messagebox.askyesno(
-                        "Doppelter Space", f"Der Space '{table_name}' existiert bereits. Möchten Sie ihn überschreiben?"
-                    )
-                    if overwrite:
-                        self.data["tables"][table_name] = table_data
-                else:
-                    self.data["tables"][table_name] = table_data
-
-            if imported_data["current_table"] in self.data["tables"]:
+                if table_name in tables and not messagebox.askyesno(
+                    "Doppelter Space", f"Der Space '{table_name}' existiert bereits. Möchten Sie ihn überschreiben?"
+                ):
+                    continue
+                normalize_cards_tree(table_data.get("cards", {}))
+                tables[table_name] = table_data
+
+            if imported_data["current_table"] in tables:
                 self.data["current_table"] = imported_data["current_table"]
         else:
             self._record_history()
             self.data = imported_data
+            self.convert_old_cards_format()
 
+        self._invalidate_nav_cache()
         self.selected_row_name = None
         self.save_data()
         self.ensure_row_selection_valid()
-        self.build_navigation_tree()
-        self.update_table()
-        messagebox.showinfo("Erfolg", "Speicherstand erfolgreich importiert.")
+        self._request_rebuild()
+        self._notify_success("Erfolg", "Speicherstand erfolgreich importiert.")
         parent_popup.destroy()
 
     def change_save_location(self):
         global SAVE_FILE
+        from tkinter import filedialog
+        self._flush_pending_save()
 
         user_choice = messagebox.askquestion(
             self.tr("change_save.option_title"),
@@ -2504,11 +3077,14 @@ class CardApp:
         else:
             print(self.tr("change_save.no_change"))
 
+        self._bin_path_cache = None
         self.update_file_path_label()
         self.refresh_bin_history()
 
     def choose_save_directory(self):
         global SAVE_FILE
+        from tkinter import filedialog
+        self._flush_pending_save()
         directory = filedialog.askdirectory(title="Speicherordner wählen")
         if not directory:
             return
@@ -2521,11 +3097,12 @@ class CardApp:
             self.tr("choose_directory.success_title"),
             self.tr("choose_directory.success_body", path=SAVE_FILE),
         )
+        self._bin_path_cache = None
         self.update_file_path_label()
         self.refresh_bin_history()
 
     def prompt_table_choice(self, title: str, prompt: str) -> str | None:
-        tables = list(self.data.get("tables", {}).keys())
+        tables = list(self.data.get("tables", {}))
         if not tables:
             messagebox.showerror("Fehler", "Keine Spaces vorhanden!")
             return None
@@ -2557,9 +3134,8 @@ class CardApp:
         if not table_name:
             return
         self.set_active_table(table_name)
-        self.build_navigation_tree()
-        self.update_table()
-        messagebox.showinfo("Erfolg", f"Space '{table_name}' wurde geladen.")
+        self._request_rebuild()
+        self._notify_success("Erfolg", f"Space '{table_name}' wurde geladen.")
 
     def delete_table_via_menu(self):
         table_name = self.prompt_table_choice("Space löschen", "Wähle einen Space zum Löschen:")
@@ -2568,8 +3144,9 @@ class CardApp:
         confirm = messagebox.askokcancel("Bestätigung", f"Soll der Space '{table_name}' wirklich gelöscht werden?")
         if not confirm:
             return
-        self._record_history()
+        self._record_history(table_name)
         self.data["tables"].pop(table_name, None)
+        self._invalidate_nav_cache(table_name)
         if self.data["current_table"] == table_name:
             if self.data["tables"]:
                 self.data["current_table"] = next(iter(self.data["tables"]), None)
@@ -2579,12 +3156,11 @@ class CardApp:
         self.selected_row_name = None
         self.save_data()
         self.ensure_row_selection_valid()
-        self.build_navigation_tree()
-        self.update_table()
-        messagebox.showinfo("Erfolg", f"Space '{table_name}' wurde gelöscht.")
+        self._request_rebuild()
+        self._notify_success("Erfolg", f"Space '{table_name}' wurde gelöscht.")
 
     def transfer_table_between_spaces(self):
-        spaces = list(self.data.get("tables", {}).keys())
+        spaces = list(self.data.get("tables", {}))
         if len(spaces) < 2:
             messagebox.showerror("Fehler", "Es werden mindestens zwei Spaces benötigt.")
             return
@@ -2630,7 +3206,7 @@ class CardApp:
         name_entry = ttk.Entry(dialog, textvariable=name_var)
         name_entry.pack(padx=16, fill=tk.X)
 
-        ttk.Label(dialog, textvariable=info_var, foreground=TEXT_MUTED, wraplength=320, justify=tk.LEFT).pack(padx=16, pady=(8, 0), anchor=tk.W)
+        ttk.Label(dialog, textvariable=info_var, foreground=THEME.TEXT_MUTED, wraplength=320, justify=tk.LEFT).pack(padx=16, pady=(8, 0), anchor=tk.W)
         ttk.Label(dialog, textvariable=error_var, foreground="red", wraplength=320, justify=tk.LEFT).pack(padx=16, pady=(4, 0), anchor=tk.W)
 
         def update_table_choices(*_args):
@@ -2681,32 +3257,37 @@ class CardApp:
             if not src_data or not dest_data:
                 error_var.set("Ungültige Space-Auswahl.")
                 return
-            if table_name not in src_data["rows"]:
+            # Rows are capped at MAX_TABLE_ROWS, so plain list scans beat building sets here.
+            src_rows = src_data["rows"]
+            dest_rows = dest_data["rows"]
+            if table_name not in src_rows:
                 error_var.set("Die ausgewählte Tabelle existiert nicht mehr.")
                 return
-            if len(dest_data["rows"]) >= 9:
-                error_var.set("Der Ziel-Space ist bereits voll (9 Tabellen).")
+            if len(dest_rows) >= MAX_TABLE_ROWS:
+                error_var.set(f"Der Ziel-Space ist bereits voll ({MAX_TABLE_ROWS} Tabellen).")
                 return
-            if desired_name in dest_data["rows"]:
+            if desired_name in dest_rows:
                 error_var.set("Im Ziel existiert bereits eine Tabelle mit diesem Namen.")
                 return
             if src_data["columns"] != dest_data["columns"]:
                 error_var.set("Spaces haben unterschiedliche Spalten. Bitte zuerst angleichen.")
                 return
 
-            self._record_history()
+            self._record_history(source, dest)
 
             columns = dest_data["columns"]
             source_cards = src_data["cards"].get(table_name, {})
-            cloned_cards = {col: copy.deepcopy(source_cards.get(col, [])) for col in columns}
-            dest_data["rows"].append(desired_name)
+            cloned_cards = clone_card_columns({col: source_cards.get(col, []) for col in columns})
+            dest_rows.append(desired_name)
             dest_data["cards"][desired_name] = cloned_cards
-            dest_data["row_colors"][desired_name] = src_data["row_colors"].get(table_name, random_pastel_color())
+            dest_data["row_colors"][desired_name] = src_data["row_colors"].get(table_name) or random_pastel_color()
+            self._invalidate_row_stats(dest, desired_name)
 
             if action == "move":
-                src_data["rows"].remove(table_name)
+                src_rows.remove(table_name)
                 src_data["cards"].pop(table_name, None)
                 src_data["row_colors"].pop(table_name, None)
+                self._invalidate_row_stats(source, table_name)
                 if self.data.get("current_table") == source and self.selected_row_name == table_name:
                     self.selected_row_name = None
 
@@ -2715,12 +3296,11 @@ class CardApp:
 
             self.save_data()
             self.ensure_row_selection_valid()
-            self.build_navigation_tree()
-            self.update_table()
+            self._request_rebuild()
 
             self.close_dialog(dialog)
             verb = "verschoben" if action == "move" else "kopiert"
-            messagebox.showinfo("Erfolg", f"Tabelle '{table_name}' wurde nach '{dest}' {verb} (als '{desired_name}').")
+            self._notify_success("Erfolg", f"Tabelle '{table_name}' wurde nach '{dest}' {verb} (als '{desired_name}').")
 
         src_combo.bind("<<ComboboxSelected>>", update_table_choices)
         dest_combo.bind("<<ComboboxSelected>>", update_info)
@@ -2745,13 +3325,13 @@ class CardApp:
         name_entry.focus_set()
 
     def import_table_from_file(self):
+        from tkinter import filedialog, simpledialog
         import_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")], title="Space importieren")
         if not import_path:
             return
 
         try:
-            with open(import_path, "r", encoding='utf-8') as f:
-                imported = json.load(f)
+            imported = load_json_file(import_path)
         except Exception as exc:
             messagebox.showerror("Fehler", f"Fehler beim Import: {exc}")
             return
@@ -2777,14 +3357,15 @@ class CardApp:
             if not overwrite:
                 return
 
-        self._record_history()
+        self._record_history(table_name)
+        normalize_cards_tree(table_payload["cards"])
         self.data["tables"][table_name] = table_payload
+        self._invalidate_nav_cache(table_name)
         self.data["current_table"] = table_name
         self.selected_row_name = None
         self.save_data()
-        self.build_navigation_tree()
-        self.update_table()
-        messagebox.showinfo("Erfolg", f"Space '{table_name}' importiert.")
+        self._request_rebuild()
+        self._notify_success("Erfolg", f"Space '{table_name}' importiert.")
 
     def _parse_card_import_block(self, raw_text: str) -> tuple[str, list[tuple[str, str]]]:
         text = raw_text.strip()
@@ -2811,19 +3392,10 @@ class CardApp:
             raise ValueError("Der Kartenblock ist leer.")
 
         cards_payload: list[tuple[str, str]] = []
-        for raw_line in remainder.split(";"):
-            line = raw_line.strip()
-            if not line:
-                continue
-            if "::" in line:
-                front, back = line.split("::", 1)
-            else:
-                front, back = line, ""
-            front = front.strip()
-            back = back.strip()
-            if not front:
-                continue
-            cards_payload.append((front, back))
+        for match in CARD_LINE_PATTERN.finditer(remainder):
+            front = match.group(1).strip()
+            if front:
+                cards_payload.append((front, (match.group(2) or "").strip()))
 
         if not cards_payload:
             raise ValueError("Es konnten keine gültigen Kartenzeilen gelesen werden.")
@@ -2857,45 +3429,35 @@ class CardApp:
             messagebox.showerror("Fehler", "Der Space verfügt über keine Spalten.")
             return
 
-        cards = table_data.setdefault("cards", {})
-        if row_name not in cards:
-            cards[row_name] = {col: [] for col in columns}
-        else:
-            for col in columns:
-                cards[row_name].setdefault(col, [])
-
-        first_column = columns[0]
-        existing_fronts = set()
+        row_cards = table_data.setdefault("cards", {}).setdefault(row_name, {})
         for col in columns:
-            for card in cards[row_name].get(col, []):
-                existing_fronts.add(str(card.get("front", "")))
+            row_cards.setdefault(col, [])
 
+        existing_fronts = {str(card.get("front", "")) for col in columns for card in row_cards.get(col, ())}
         unique_payload: list[tuple[str, str]] = []
-        skipped: list[str] = []
+        add_front = existing_fronts.add
         for front, back in cards_payload:
-            if front in existing_fronts:
-                skipped.append(front)
-                continue
-            existing_fronts.add(front)
-            unique_payload.append((front, back))
+            if front not in existing_fronts:
+                add_front(front)
+                unique_payload.append((front, back))
+        skipped = len(cards_payload) - len(unique_payload)
 
         if not unique_payload:
             messagebox.showinfo("Keine neuen Karten", "Alle übergebenen Karten existieren bereits in dieser Tabelle.")
             return
 
-        self._record_history()
-        for front, back in unique_payload:
-            cards[row_name][first_column].append(create_card(front, back))
+        self._record_history(space_name)
+        row_cards[columns[0]].extend([create_card(front, back) for front, back in unique_payload])
+        self._invalidate_row_stats(space_name, row_name)
 
         self.data["current_table"] = space_name
         self.selected_row_name = row_name
-        self.save_data()
-        self.build_navigation_tree()
-        self.update_table()
+        self._request_save()
+        self._request_rebuild()
 
         summary = f"{len(unique_payload)} Karten importiert."
         if skipped:
-            summary += f" {len(skipped)} doppelte Einträge übersprungen."
+            summary += f" {skipped} doppelte Einträge übersprungen."
         messagebox.showinfo("Import abgeschlossen", summary)
 
     def import_cards_via_text(self):
@@ -2952,6 +3514,9 @@ class CardApp:
         dialog.bind("<Control-Return>", lambda event: (confirm_import(), "break"))
 
     def export_current_table(self):
+        from tkinter import filedialog
+        # Persist pending edits first so the save file never lags behind an export.
+        self._flush_pending_save()
         current_table = self.data.get("current_table")
         if not current_table or current_table not in self.data.get("tables", {}):
             messagebox.showerror("Fehler", "Kein Space zum Exportieren ausgewählt.")
@@ -2968,14 +3533,21 @@ class CardApp:
 
         payload = {"name": current_table, "table": self.data["tables"][current_table]}
         try:
-            with open(export_path, "w", encoding='utf-8') as f:
-                json.dump(payload, f, indent=4, ensure_ascii=False)
+            encoded = encode_json(payload, indent=4)
         except Exception as exc:
             messagebox.showerror("Fehler", f"Export fehlgeschlagen: {exc}")
             return
-        messagebox.showinfo("Erfolg", f"Space wurde nach\n{export_path}\nexportiert.")
+        # The space is encoded up front; only the disk write runs on the save worker.
+        self._submit_write(
+            write_file_atomic,
+            export_path,
+            encoded,
+            on_error=lambda exc: messagebox.showerror("Fehler", f"Export fehlgeschlagen: {exc}"),
+            on_success=lambda: self._notify_success("Erfolg", f"Space wurde nach\n{export_path}\nexportiert."),
+        )
 
     def duplicate_current_table(self):
+        from tkinter import simpledialog
         current_table = self.data.get("current_table")
         if not current_table:
             messagebox.showerror("Fehler", "Kein Space ausgewählt.")
@@ -2994,16 +3566,19 @@ class CardApp:
             messagebox.showerror("Fehler", "Ein Space mit diesem Namen existiert bereits.")
             return
 
-        self._record_history()
-        self.data["tables"][new_name] = copy.deepcopy(source)
+        self._record_history(new_name)
+        self.data["tables"][new_name] = clone_table(source)
+        self._invalidate_nav_cache(new_name)
         self.data["current_table"] = new_name
         self.selected_row_name = None
         self.save_data()
-        self.build_navigation_tree()
-        self.update_table()
-        messagebox.showinfo("Erfolg", f"Space '{current_table}' wurde als '{new_name}' kopiert.")
+        self._request_rebuild()
+        self._notify_success("Erfolg", f"Space '{current_table}' wurde als '{new_name}' kopiert.")
 
     def check_for_updates(self):
+        # Imported on demand so startup does not pay for urllib and its ssl/email dependencies.
+        from main import updater
+
         with self.smooth_state_transition():
             try:
                 release = updater.fetch_latest_release()
@@ -3111,6 +3686,7 @@ class CardApp:
         self.canvas.bind_all("<Button-5>", self.on_mousewheel)
 
     def on_mousewheel(self, event):
+        self._column_bounds = None
         if getattr(event, "num", None) == 4:
             self.canvas.yview_scroll(-1, "units")
         elif getattr(event, "num", None) == 5:
@@ -3123,35 +3699,39 @@ class CardApp:
             self.delete_mode = False
         if self.moving_card:
             self.moving_card = None
-        self.update_table()
+        self._request_rebuild(REBUILD_TABLE)
 
     def toggle_delete_mode(self):
         self.delete_mode = not self.delete_mode
         if self.delete_mode and self.mark_mode:
             self.mark_mode = False
-        self.update_table()
+        self._request_rebuild(REBUILD_TABLE)
 
     def toggle_mark_mode(self):
         self.mark_mode = not self.mark_mode
         if self.mark_mode and self.delete_mode:
             self.delete_mode = False
-        self.update_table()
+        self._request_rebuild(REBUILD_TABLE)
+
+    def _finish_card_move(self, cards: dict, row_name: str, col_name: str):
+        # Drops the card picked up in move mode into the target column.
+        old_row, old_col, card_front = self.moving_card
+        source_cards = cards[old_row][old_col]
+        source_index = self._find_card_position(old_row, old_col, source_cards, card_front)
+        if source_index is None:
+            return
+        self._record_move(old_row, old_col, source_index, row_name, col_name, card_front)
+        cards[row_name][col_name].append(source_cards.pop(source_index))
+        self.moving_card = None
+        self._journal_card_move(old_row, old_col, row_name, col_name, card_front)
+        self._request_rebuild()
 
-    def on_column_click(self, row_name: str, col_name: str):
+    def on_column_click(self, row_name: str, col_name: str, _event=None):
         if self.moving_card:
             table_data = self.get_current_table_data()
             if table_data is None:
                 return
-            cards = table_data["cards"]
-            old_row, old_col, card_front = self.moving_card
-            old_card = find_card(cards[old_row][old_col], card_front)
-            if old_card:
-                self._record_history()
-                cards[old_row][old_col].remove(old_card)
-                cards[row_name][col_name].append(old_card)
-                self.moving_card = None
-                self.save_data()
-                self.update_table()
+            self._finish_card_move(table_data["cards"], row_name, col_name)
 
     def on_card_click(self, row_name: str, col_name: str, card_front: str):
         table_data = self.get_current_table_data()
@@ -3159,37 +3739,31 @@ class CardApp:
             return
 
         cards = table_data["cards"]
-        card_dict = find_card(cards[row_name][col_name], card_front)
-        if not card_dict:
+        card_list = cards[row_name][col_name]
+        card_index = self._find_card_position(row_name, col_name, card_list, card_front)
+        if card_index is None:
             return
+        card_dict = card_list[card_index]
 
         if self.mark_mode:
-            self._record_history()
+            self._record_row_history(row_name)
             card_dict["marked"] = not card_dict["marked"]
-            self.save_data()
-            self.update_table()
+            self._request_save()
+            self._request_rebuild(REBUILD_TABLE)
             return
 
         if self.delete_mode:
-            self._record_history()
-            cards[row_name][col_name].remove(card_dict)
+            self._record_row_history(row_name)
+            del card_list[card_index]
+            self._invalidate_row_stats(self.data.get("current_table"), row_name)
             self.delete_mode = False
-            self.save_data()
-            self.update_table()
+            self._request_save()
+            self._request_rebuild()
+        elif self.moving_card is None:
+            self.moving_card = (row_name, col_name, card_front)
+            self._request_rebuild(REBUILD_TABLE)
         else:
-            if self.moving_card is None:
-                self.moving_card = (row_name, col_name, card_front)
-                self.update_table()
-            else:
-                old_row, old_col, moving_front = self.moving_card
-                old_card = find_card(cards[old_row][old_col], moving_front)
-                if old_card:
-                    self._record_history()
-                    cards[old_row][old_col].remove(old_card)
-                    cards[row_name][col_name].append(old_card)
-                    self.moving_card = None
-                    self.save_data()
-                    self.update_table()
+            self._finish_card_move(cards, row_name, col_name)
 
     def _open_card_back_editor(self, row_name: str, col_name: str, card_front: str):
         table_data = self.get_current_table_data()
@@ -3197,7 +3771,7 @@ class CardApp:
             return
         cards = table_data["cards"]
 
-        card_dict = find_card(cards[row_name][col_name], card_front)
+        card_dict = self._find_card_in_column(row_name, col_name, cards[row_name][col_name], card_front)
         if not card_dict:
             return
 
@@ -3211,7 +3785,7 @@ class CardApp:
         text_widget.insert("1.0", card_dict.get("back", ""))
 
         status_var = tk.StringVar()
-        status_label = ttk.Label(editor, textvariable=status_var, foreground=TEXT_MUTED)
+        status_label = ttk.Label(editor, textvariable=status_var, foreground=THEME.TEXT_MUTED)
         status_label.pack(anchor=tk.W, padx=12, pady=(6, 0))
 
         button_frame = ttk.Frame(editor)
@@ -3221,9 +3795,9 @@ class CardApp:
             new_text = text_widget.get("1.0", "end-1c")
             if new_text == card_dict.get("back", ""):
                 return False
-            self._record_history()
+            self._record_row_history(row_name)
             card_dict["back"] = new_text
-            self.save_data()
+            self._request_save()
             self.refresh_card_column(row_name, col_name)
             return True
 
@@ -3254,14 +3828,13 @@ class CardApp:
         if self.delete_mode or self.mark_mode:
             self.drag_data = None
             return
-        card_frame = self._get_card_frame(event.widget)
-        payload = getattr(card_frame, "_card_payload", None)
+        payload = self._card_under_pointer(event.widget)
         self.drag_data = {
             "row": row_name,
             "col": col_name,
             "card": card_front,
             "start": (event.x_root, event.y_root),
-            "widget": card_frame,
+            "widget": event.widget,
             "moved": False,
             "payload": payload,
         }
@@ -3276,15 +3849,30 @@ class CardApp:
         if not self.drag_data["moved"] and max(dx, dy) > 8:
             self.drag_data["moved"] = True
             self.create_drag_preview(self.drag_data.get("payload"))
+            # The reused window still sits where the last drag left it; place it before Tk next redraws.
+            self.update_drag_preview_position(event.x_root, event.y_root)
         if not self.drag_data["moved"]:
             return
-        self.update_drag_preview_position(event.x_root, event.y_root)
-        self.highlight_column_under_pointer(event.x_root, event.y_root)
+        # Motion events arrive far faster than the screen refreshes; only the latest position is drawn.
+        self._last_motion_xy = (event.x_root, event.y_root)
+        if self._motion_after_id is None:
+            self._motion_after_id = self.root.after(DRAG_MOTION_MS, self._flush_drag_motion)
+
+    def _flush_drag_motion(self):
+        self._motion_after_id = None
+        if not self.drag_data:
+            return
+        x_root, y_root = self._last_motion_xy
+        self.update_drag_preview_position(x_root, y_root)
+        if self._preview_detail_after_id is not None:
+            # Details only appear once the pointer rests, so the timer restarts with every movement.
+            self.root.after_cancel(self._preview_detail_after_id)
+            self._preview_detail_after_id = self.root.after(DRAG_PREVIEW_DETAIL_MS, self._show_drag_preview_details)
+        self.highlight_column_under_pointer(x_root, y_root)
 
     def on_card_release(self, event, row_name: str, col_name: str, card_front: str):
         if self.drag_data and self.drag_data.get("moved"):
-            widget = self.root.winfo_containing(event.x_root, event.y_root)
-            column_frame = self._find_column_frame(widget)
+            column_frame = self._column_frame_at(event.x_root, event.y_root)
             if column_frame:
                 target_row = column_frame._row_name
                 target_col = column_frame._col_name
@@ -3295,71 +3883,116 @@ class CardApp:
         self.reset_drag_state()
         self.on_card_click(row_name, col_name, card_front)
 
+    def _get_drag_preview_parts(self) -> dict:
+        # The preview window is built once and only relabelled per drag instead of rebuilding its widgets.
+        if self._drag_preview_parts is None:
+            window = tk.Toplevel(self.root)
+            window.withdraw()
+            window.overrideredirect(True)
+            window.attributes("-topmost", True)
+            window.attributes("-alpha", 0.95)
+            frame = tk.Frame(window, padx=12, pady=10, bd=0, highlightthickness=1)
+            frame.pack()
+            front = tk.Label(frame, font=self._font(11, "bold"), wraplength=220, justify=tk.LEFT)
+            front.pack(fill=tk.X)
+            back = tk.Label(frame, font=self._font(9), wraplength=220, justify=tk.LEFT)
+            weight = tk.Label(frame, font=self._font(8, "bold"))
+            self._drag_preview_parts = {"window": window, "frame": frame, "front": front, "back": back, "weight": weight}
+        return self._drag_preview_parts
+
     def create_drag_preview(self, card_payload: dict | None):
-        self.destroy_drag_preview()
+        self.hide_drag_preview()
         if not card_payload:
             return
-        self.drag_preview = tk.Toplevel(self.root)
-        self.drag_preview.overrideredirect(True)
-        self.drag_preview.attributes("-topmost", True)
-        self.drag_preview.attributes("-alpha", 0.95)
-
-        preview_frame = tk.Frame(
-            self.drag_preview,
-            bg=CARD_BG,
-            padx=12,
-            pady=10,
-            bd=0,
-            highlightbackground=CARD_BORDER,
-            highlightthickness=1,
+        parts = self._get_drag_preview_parts()
+        # Colours are applied on every show so a theme switch between drags is picked up.
+        parts["frame"].configure(bg=THEME.CARD_BG, highlightbackground=THEME.CARD_BORDER)
+        parts["front"].configure(
+            text=str(card_payload.get("front", "")), bg=THEME.CARD_BG, fg=THEME.TEXT_PRIMARY, wraplength=160
         )
-        preview_frame.pack()
-
-        tk.Label(
-            preview_frame,
-            text=str(card_payload.get("front", "")),
-            font=("Segoe UI", 11, "bold"),
-            bg=CARD_BG,
-            fg=TEXT_PRIMARY,
-            wraplength=220,
-            justify=tk.LEFT,
-        ).pack(fill=tk.X)
-
+        # A quick drag only ever shows the front; back and weight are added if the pointer rests.
+        parts["back"].pack_forget()
+        parts["weight"].pack_forget()
+        self.drag_preview = parts["window"]
+        self._preview_last_xy = None
+        self.drag_preview.deiconify()
+        self._preview_detail_after_id = self.root.after(DRAG_PREVIEW_DETAIL_MS, self._show_drag_preview_details)
+
+    def _show_drag_preview_details(self):
+        self._preview_detail_after_id = None
+        card_payload = self.drag_data.get("payload") if self.drag_data else None
+        if self.drag_preview is None or not card_payload:
+            return
+        parts = self._drag_preview_parts
+        parts["front"].configure(wraplength=220)
         back_text = str(card_payload.get("back", "")).strip()
         if back_text:
             snippet = back_text if len(back_text) <= 120 else f"{back_text[:120]}…"
-            tk.Label(
-                preview_frame,
-                text=snippet,
-                font=("Segoe UI", 9),
-                bg=CARD_BG,
-                fg=TEXT_MUTED,
-                wraplength=220,
-                justify=tk.LEFT,
-            ).pack(fill=tk.X, pady=(6, 0))
-
-        weight = self._extract_card_weight(card_payload)
-        tk.Label(
-            preview_frame,
-            text=f"Gewicht: {weight:.0f}",
-            font=("Segoe UI", 8, "bold"),
-            bg=CARD_BG,
-            fg=TEXT_MUTED,
-        ).pack(anchor=tk.W, pady=(8, 0))
+            parts["back"].configure(text=snippet, bg=THEME.CARD_BG, fg=THEME.TEXT_MUTED)
+            parts["back"].pack(fill=tk.X, pady=(6, 0))
+        weight = card_payload["weight"]
+        parts["weight"].configure(text=f"Gewicht: {weight:.0f}", bg=THEME.CARD_BG, fg=THEME.TEXT_MUTED)
+        parts["weight"].pack(anchor=tk.W, pady=(8, 0))
 
     def update_drag_preview_position(self, x_root: int, y_root: int):
         if not self.drag_preview:
             return
+        last = self._preview_last_xy
+        if last is not None and abs(x_root - last[0]) + abs(y_root - last[1]) < 2:
+            return
+        self._preview_last_xy = (x_root, y_root)
         self.drag_preview.geometry(f"+{x_root + 12}+{y_root + 12}")
 
-    def destroy_drag_preview(self):
+    def hide_drag_preview(self):
+        if self._preview_detail_after_id is not None:
+            self.root.after_cancel(self._preview_detail_after_id)
+            self._preview_detail_after_id = None
         if self.drag_preview is not None:
-            self.drag_preview.destroy()
+            self.drag_preview.withdraw()
             self.drag_preview = None
 
+    def _column_frame_at(self, x_root: int, y_root: int) -> tk.Frame | None:
+        # The drop usually lands where the last motion was resolved, so that lookup is reused when close enough.
+        hover = self._hover_target
+        if hover is not None and abs(hover[0] - x_root) + abs(hover[1] - y_root) <= 4:
+            return hover[2]
+        return self._hit_column(x_root, y_root)
+
+    def _measure_column_bounds(self) -> list[tuple[int, int, int, int, tk.Frame]]:
+        # Screen rectangles of the visible part of each column; measured once per drag, scrolling invalidates them.
+        try:
+            view_x = self.canvas.winfo_rootx()
+            view_y = self.canvas.winfo_rooty()
+            view_right = view_x + self.canvas.winfo_width()
+            view_bottom = view_y + self.canvas.winfo_height()
+        except tk.TclError:
+            return []
+        bounds = []
+        for frame in self.column_frames:
+            try:
+                left = frame.winfo_rootx()
+                top = frame.winfo_rooty()
+                right = left + frame.winfo_width()
+                bottom = top + frame.winfo_height()
+            except tk.TclError:
+                continue
+            left, top = max(left, view_x), max(top, view_y)
+            right, bottom = min(right, view_right), min(bottom, view_bottom)
+            if left < right and top < bottom:
+                bounds.append((left, top, right, bottom, frame))
+        return bounds
+
+    def _hit_column(self, x_root: int, y_root: int) -> tk.Frame | None:
+        if self._column_bounds is None:
+            self._column_bounds = self._measure_column_bounds()
+        for left, top, right, bottom, frame in self._column_bounds:
+            if left <= x_root < right and top <= y_root < bottom:
+                return frame
+        return None
+
     def highlight_column_under_pointer(self, x_root: int, y_root: int):
-        widget = self.root.winfo_containing(x_root, y_root)
-        column_frame = self._find_column_frame(widget)
+        column_frame = self._hit_column(x_root, y_root)
+        self._hover_target = (x_root, y_root, column_frame)
         if column_frame == self.current_highlighted_column:
             return
         self._clear_column_highlight()
@@ -3370,7 +4003,7 @@ class CardApp:
     def _clear_column_highlight(self):
         if self.current_highlighted_column is None:
             return
-        base_color = getattr(self.current_highlighted_column, "_base_highlight_color", CARD_BORDER)
+        base_color = getattr(self.current_highlighted_column, "_base_highlight_color", THEME.CARD_BORDER)
         try:
             self.current_highlighted_column.configure(highlightthickness=0, highlightbackground=base_color)
         except tk.TclError:
@@ -3378,26 +4011,15 @@ class CardApp:
         self.current_highlighted_column = None
 
     def reset_drag_state(self):
-        self.destroy_drag_preview()
+        if self._motion_after_id is not None:
+            self.root.after_cancel(self._motion_after_id)
+            self._motion_after_id = None
+        self._hover_target = None
+        self._column_bounds = None
+        self.hide_drag_preview()
         self._clear_column_highlight()
         self.drag_data = None
 
-    def _get_card_frame(self, widget: tk.Widget) -> tk.Widget:
-        current = widget
-        while current is not None:
-            if getattr(current, "_is_card_frame", False):
-                return current
-            current = getattr(current, "master", None)
-        return widget
-
-    def _find_column_frame(self, widget: tk.Widget | None) -> tk.Frame | None:
-        current = widget
-        while current is not None:
-            if getattr(current, "_col_name", None) is not None:
-                return current
-            current = getattr(current, "master", None)
-        return None
-
     def move_card_between_columns(
         self,
         source_row: str,
@@ -3409,32 +4031,42 @@ class CardApp:
         table_data = self.get_current_table_data()
         if table_data is None:
             return
+        source_row = sys.intern(source_row)
+        source_col = sys.intern(source_col)
+        target_row = sys.intern(target_row)
+        target_col = sys.intern(target_col)
+        card_front = sys.intern(card_front)
         if source_row == target_row and source_col == target_col:
             return
 
+        # Undo and state imports replace whole rows and spaces, so the lists are resolved from the live data.
         cards = table_data["cards"]
-        if target_row not in cards or target_col not in cards[target_row]:
+        source_cards = cards.get(source_row, {}).get(source_col)
+        target_cards = cards.get(target_row, {}).get(target_col)
+        if source_cards is None or target_cards is None:
             return
-        old_card = find_card(cards[source_row][source_col], card_front)
-        if not old_card:
+        source_index = self._find_card_position(source_row, source_col, source_cards, card_front)
+        if source_index is None:
             return
 
-        self._record_history()
-        cards[source_row][source_col].remove(old_card)
-        cards[target_row][target_col].append(old_card)
-        self.save_data()
-        updated_source = self.refresh_card_column(source_row, source_col)
-        updated_target = self.refresh_card_column(target_row, target_col)
-        need_header_update = self.selected_row_name in {source_row, target_row}
-        header_updated = True
-        if need_header_update and self.selected_row_name:
-            header_updated = self.update_row_header_info(self.selected_row_name)
-
-        if not (updated_source or updated_target):
-            self.update_table()
+        self._record_move(source_row, source_col, source_index, target_row, target_col, card_front)
+        target_cards.append(source_cards.pop(source_index))
+        self._journal_card_move(source_row, source_col, target_row, target_col, card_front)
+        flags = REDRAW_COLUMNS
+        if self.selected_row_name in {source_row, target_row}:
+            flags |= REDRAW_HEADER
+        self._apply_redraw(flags, ((source_row, source_col), (target_row, target_col)))
+
+    def _apply_redraw(self, flags: int, columns: tuple = ()):
+        # Runs the cheapest redraw that covers the flags; columns and fallbacks are coalesced into the idle pass.
+        if flags & REDRAW_ALL:
+            self._request_rebuild(REBUILD_TABLE)
             return
-        if need_header_update and not header_updated:
-            self.update_table()
+        if flags & REDRAW_COLUMNS:
+            self._request_column_refresh(*columns)
+        if flags & REDRAW_HEADER and self.selected_row_name:
+            if not self.update_row_header_info(self.selected_row_name):
+                self._request_rebuild(REBUILD_TABLE)
 
     def on_tree_select(self, _event):
         selection = self.navigation_tree.selection()
@@ -3454,7 +4086,7 @@ class CardApp:
             self.set_active_table(table_name, rebuild=False)
             self.selected_row_name = None
 
-        self.update_table()
+        self._request_rebuild(REBUILD_TABLE)
 
     def set_active_table(self, table_name: str, rebuild: bool = True):
         if table_name not in self.data.get("tables", {}):
@@ -3462,10 +4094,10 @@ class CardApp:
         if self.data["current_table"] != table_name:
             self.data["current_table"] = table_name
             self.selected_row_name = None
-            self.save_data()
+            self._request_save()
         self.ensure_row_selection_valid()
         if rebuild:
-            self.build_navigation_tree()
+            self._request_rebuild(REBUILD_NAV)
 
 
 def run_app():
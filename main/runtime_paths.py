@@ -5,9 +5,12 @@ from __future__ import annotations
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from main.storage import write_file_atomic
+
 APP_NAME = "Klausurmaster"
 APP_VERSION = "0.69"
 CONFIG_FILENAME = "config.json"
@@ -44,9 +47,20 @@ def get_user_config_path() -> Path:
     return get_user_data_dir() / CONFIG_FILENAME
 
 
+_config_cache: dict[str, Any] | None = None
+
+
 def _load_config() -> dict[str, Any]:
+    """Return a copy of the user config; the file is only read on first use."""
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = _read_config()
+    return dict(_config_cache)
+
+
+def _read_config() -> dict[str, Any]:
     config_path = get_user_config_path()
-    if config_path.exists():
+    if config_path.is_file():
         try:
             with config_path.open("r", encoding="utf-8") as handle:
                 return json.load(handle)
@@ -54,7 +68,7 @@ def _load_config() -> dict[str, Any]:
             pass
 
     template_path = _assets_root() / CONFIG_FILENAME
-    if template_path.exists():
+    if template_path.is_file():
         try:
             with template_path.open("r", encoding="utf-8") as handle:
                 return json.load(handle)
@@ -64,11 +78,13 @@ def _load_config() -> dict[str, Any]:
 
 
 def _persist_config(config: dict[str, Any]) -> None:
-    data_dir = get_user_data_dir()
-    data_dir.mkdir(parents=True, exist_ok=True)
-    config_path = data_dir / CONFIG_FILENAME
-    with config_path.open("w", encoding="utf-8") as handle:
-        json.dump(config, handle, indent=2, ensure_ascii=False)
+    """Write the user config atomically; unchanged settings that are already on disk are not rewritten."""
+    global _config_cache
+    config_path = get_user_config_path()
+    if config == _config_cache and config_path.is_file():
+        return
+    write_file_atomic(config_path, json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8"))
+    _config_cache = dict(config)
 
 
 def _resolve_save_file(raw_value: str | None) -> Path:
@@ -87,7 +103,7 @@ def load_save_file_path() -> Path:
     env_override = os.environ.get("KLAUSURMASTER_SAVE_FILE")
     config = _load_config()
     target = _resolve_save_file(env_override or config.get("save_file"))
-    if env_override is None:
+    if env_override is None and config.get("save_file") != str(target):
         config["save_file"] = str(target)
         _persist_config(config)
     return target
@@ -144,8 +160,9 @@ def persist_bin_history_file_path(new_path: str | Path) -> str:
     return str(path_obj)
 
 
+@lru_cache(maxsize=None)
 def resource_path(relative_name: str) -> Path:
-    """Return a path to a bundled resource (works for PyInstaller and source runs)."""
+    """Return a path to a bundled resource (works for PyInstaller and source runs); bundled files do not change at runtime, so lookups are cached."""
     base = Path(getattr(sys, "_MEIPASS", _project_root()))
     candidate = base / relative_name
     if candidate.exists():
@@ -0,0 +1,246 @@
+"""Helpers for reading and writing the save files and their append-only change journal."""
+
+from __future__ import annotations
+
+import codecs
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib json module is the fallback
+    orjson = None
+
+JOURNAL_SUFFIX = ".log"
+JOURNAL_COMPACT_THRESHOLD = 200
+SNAPSHOT_SUFFIX = ".json.gz"
+SNAPSHOT_NAME_FORMAT = "%Y%m%d-%H%M%S-%f"
+SNAPSHOT_BLOB_DIRNAME = "spaces"
+
+
+def load_json_file(path: str | Path) -> Any:
+    """Parse a UTF-8 JSON file straight from its bytes, using orjson when it is installed."""
+    with open(path, "rb") as handle:
+        raw = handle.read()
+    if orjson is not None:
+        # orjson rejects a byte order mark, which some Windows editors prepend; skip it without copying.
+        return orjson.loads(memoryview(raw)[len(codecs.BOM_UTF8):] if raw.startswith(codecs.BOM_UTF8) else raw)
+    return json.loads(raw)
+
+
+def encode_json(data: Any, indent: int = 2) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes; orjson always indents by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json_file(path: str | Path, data: Any, indent: int = 2) -> None:
+    """Encode data in memory as indented UTF-8 JSON and write it out in one atomic write."""
+    write_file_atomic(path, encode_json(data, indent))
+
+
+def write_file_atomic(path: str | Path, payload: bytes) -> None:
+    """Write payload to a temporary sibling file, flush it to disk and swap it into place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_save_file(save_file: str | Path, payload: bytes) -> None:
+    """Replace the save file with an encoded snapshot and drop the journal it now contains."""
+    write_file_atomic(save_file, payload)
+    clear_journal(journal_path_for(save_file))
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes, e.g. for in-memory snapshots."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse bytes produced by dump_json_bytes back into fresh Python objects."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def clone_json(data: Any) -> Any:
+    """Return an independent copy of JSON-compatible data; much cheaper than copy.deepcopy."""
+    return load_json_bytes(dump_json_bytes(data))
+
+
+def journal_path_for(save_file: str | Path) -> Path:
+    """Return the journal file that sits next to the given save file."""
+    return Path(save_file).with_suffix(JOURNAL_SUFFIX)
+
+
+def append_journal_entry(journal_path: str | Path, entry: dict[str, Any]) -> None:
+    """Append one mutation record as a single JSON line."""
+    if orjson is not None:
+        line = orjson.dumps(entry).decode("utf-8")
+    else:
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+    with open(journal_path, "a", encoding="utf-8") as handle:
+        handle.write(line + "\n")
+
+
+def read_journal(journal_path: str | Path) -> list[dict[str, Any]]:
+    """Return all complete journal entries; a torn trailing line is ignored."""
+    entries: list[dict[str, Any]] = []
+    try:
+        with open(journal_path, "r", encoding="utf-8") as handle:
+            for raw_line in handle:
+                line = raw_line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = orjson.loads(line) if orjson is not None else json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                if isinstance(entry, dict):
+                    entries.append(entry)
+    except FileNotFoundError:
+        return []
+    return entries
+
+
+def clear_journal(journal_path: str | Path) -> None:
+    """Drop the journal once its entries are part of a full snapshot."""
+    try:
+        os.remove(journal_path)
+    except FileNotFoundError:
+        pass
+
+
+def snapshot_dir_for(bin_file: str | Path) -> Path:
+    """Return the directory that holds one compressed file per version snapshot."""
+    bin_file = Path(bin_file)
+    return bin_file.with_name(bin_file.stem + "_versions")
+
+
+def snapshot_name(timestamp: datetime) -> str:
+    """Return the file name for a snapshot; names sort chronologically."""
+    return timestamp.strftime(SNAPSHOT_NAME_FORMAT) + SNAPSHOT_SUFFIX
+
+
+def snapshot_timestamp(path: str | Path) -> datetime | None:
+    """Parse the creation time back out of a snapshot file name."""
+    name = Path(path).name
+    if not name.endswith(SNAPSHOT_SUFFIX):
+        return None
+    try:
+        return datetime.strptime(name[: -len(SNAPSHOT_SUFFIX)], SNAPSHOT_NAME_FORMAT)
+    except ValueError:
+        return None
+
+
+def list_snapshots(directory: str | Path) -> list[Path]:
+    """Return all snapshot files in the directory, oldest first."""
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(SNAPSHOT_SUFFIX))
+    except FileNotFoundError:
+        return []
+    return [Path(directory) / name for name in names]
+
+
+def _read_gzip_json(path: str | Path) -> Any:
+    with open(path, "rb") as handle:
+        return load_json_bytes(gzip.decompress(handle.read()))
+
+
+def encode_snapshot(timestamp: str, label: str, data: dict[str, Any]) -> tuple[bytes, dict[str, bytes]]:
+    """Split a snapshot into a small manifest plus one content-addressed blob per space."""
+    blobs: dict[str, bytes] = {}
+    table_refs: dict[str, str] = {}
+    for table_name, table_data in data.get("tables", {}).items():
+        blob = dump_json_bytes(table_data)
+        digest = hashlib.sha1(blob).hexdigest()
+        blobs[digest] = blob
+        table_refs[table_name] = digest
+    meta = {key: value for key, value in data.items() if key != "tables"}
+    manifest = {"timestamp": timestamp, "label": label, "meta": meta, "tables": table_refs}
+    return dump_json_bytes(manifest), blobs
+
+
+def read_snapshot(path: str | Path) -> dict[str, Any]:
+    """Load one snapshot and rebuild its full data from the shared space blobs."""
+    snapshot = _read_gzip_json(path)
+    if "data" in snapshot:
+        return snapshot
+    blob_dir = Path(path).parent / SNAPSHOT_BLOB_DIRNAME
+    data = dict(snapshot.get("meta", {}))
+    data["tables"] = {
+        table_name: _read_gzip_json(blob_dir / (digest + SNAPSHOT_SUFFIX))
+        for table_name, digest in snapshot.get("tables", {}).items()
+    }
+    return {"timestamp": snapshot.get("timestamp", ""), "label": snapshot.get("label", ""), "data": data}
+
+
+def write_snapshots(directory: str | Path, snapshots: list[tuple[str, bytes, dict[str, bytes]]], keep: int) -> None:
+    """Write snapshot manifests and any new space blobs, then prune to the newest `keep` snapshots."""
+    directory = Path(directory)
+    blob_dir = directory / SNAPSHOT_BLOB_DIRNAME
+    for name, manifest, blobs in snapshots:
+        for digest, blob in blobs.items():
+            blob_path = blob_dir / (digest + SNAPSHOT_SUFFIX)
+            # Unchanged spaces hash to an existing blob, so only edited spaces cost disk space.
+            if not blob_path.exists():
+                write_file_atomic(blob_path, gzip.compress(blob, compresslevel=6))
+        write_file_atomic(directory / name, gzip.compress(manifest, compresslevel=6))
+
+    remaining = list_snapshots(directory)
+    stale_snapshots = remaining[:-keep]
+    for stale in stale_snapshots:
+        try:
+            os.remove(stale)
+        except FileNotFoundError:
+            pass
+    if not stale_snapshots:
+        return
+    referenced = set()
+    for path in remaining[-keep:]:
+        try:
+            referenced.update(_read_gzip_json(path).get("tables", {}).values())
+        except (OSError, ValueError):
+            return
+    for blob_path in list_snapshots(blob_dir):
+        if blob_path.name[: -len(SNAPSHOT_SUFFIX)] not in referenced:
+            try:
+                os.remove(blob_path)
+            except FileNotFoundError:
+                pass
+
+
+def migrate_bin_history_file(bin_file: str | Path, keep: int) -> None:
+    """Split a legacy single-file version history into snapshot files and set the old file aside."""
+    bin_file = Path(bin_file)
+    try:
+        payload = load_json_file(bin_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return
+    history = payload.get("history", []) if isinstance(payload, dict) else []
+    snapshots = []
+    for index, entry in enumerate(history if isinstance(history, list) else []):
+        if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+            continue
+        try:
+            timestamp = datetime.fromisoformat(str(entry.get("timestamp")))
+        except ValueError:
+            timestamp = datetime(1970, 1, 1, microsecond=index)
+        manifest, blobs = encode_snapshot(timestamp.isoformat(), str(entry.get("label", "")), entry["data"])
+        snapshots.append((snapshot_name(timestamp), manifest, blobs))
+    write_snapshots(snapshot_dir_for(bin_file), snapshots, keep)
+    os.replace(bin_file, bin_file.with_name(bin_file.name + ".migrated"))
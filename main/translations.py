@@ -0,0 +1,489 @@
+"""Translated UI strings, keyed by message id and then language code."""
+
+from __future__ import annotations
+
+TRANSLATIONS: dict[str, dict[str, str]] = {
+    "app.subtitle": {
+        "de": "Wähle links Space und Tabelle, um Karten zu fokussieren.",
+        "en": "Choose a space and table on the left to focus your cards.",
+        "es": "Elige a la izquierda un espacio y una tabla para enfocarte en las tarjetas.",
+        "fr": "Choisissez à gauche un espace et une table pour vous concentrer sur les cartes.",
+        "sq": "Zgjidh në të majtë një hapësirë dhe tabelë për t'u fokusuar te kartat.",
+    },
+    "nav.collections": {
+        "de": "Sammlungen",
+        "en": "Collections",
+        "es": "Colecciones",
+        "fr": "Collections",
+        "sq": "Koleksione",
+    },
+    "menu.file": {
+        "de": "Datei",
+        "en": "File",
+        "es": "Archivo",
+        "fr": "Fichier",
+        "sq": "Skedar",
+    },
+    "menu.edit": {
+        "de": "Bearbeiten",
+        "en": "Edit",
+        "es": "Editar",
+        "fr": "Édition",
+        "sq": "Redakto",
+    },
+    "menu.space": {
+        "de": "Space",
+        "en": "Space",
+        "es": "Espacio",
+        "fr": "Espace",
+        "sq": "Hapësirë",
+    },
+    "menu.help": {
+        "de": "Hilfe",
+        "en": "Help",
+        "es": "Ayuda",
+        "fr": "Aide",
+        "sq": "Ndihmë",
+    },
+    "menu.language": {
+        "de": "Sprache",
+        "en": "Language",
+        "es": "Idioma",
+        "fr": "Langue",
+        "sq": "Gjuha",
+    },
+    "menu.actions": {
+        "de": "Aktionen",
+        "en": "Actions",
+        "es": "Acciones",
+        "fr": "Actions",
+        "sq": "Veprime",
+    },
+    "menu.file.save": {
+        "de": "Speichern",
+        "en": "Save",
+        "es": "Guardar",
+        "fr": "Enregistrer",
+        "sq": "Ruaj",
+    },
+    "menu.file.reload": {
+        "de": "Neu laden",
+        "en": "Reload",
+        "es": "Recargar",
+        "fr": "Recharger",
+        "sq": "Ringarko",
+    },
+    "menu.file.view_state": {
+        "de": "Status ansehen aus…",
+        "en": "View state from…",
+        "es": "Ver estado desde…",
+        "fr": "Afficher l'état depuis…",
+        "sq": "Shiko gjendjen nga…",
+    },
+    "menu.file.load_state": {
+        "de": "Status laden aus…",
+        "en": "Load state from…",
+        "es": "Cargar estado desde…",
+        "fr": "Charger l'état depuis…",
+        "sq": "Ngarko gjendjen nga…",
+    },
+    "menu.file.add_table": {
+        "de": "Tabelle hinzufügen (Strg+N)",
+        "en": "Add table (Ctrl+N)",
+        "es": "Añadir tabla (Ctrl+N)",
+        "fr": "Ajouter une table (Ctrl+N)",
+        "sq": "Shto tabelë (Ctrl+N)",
+    },
+    "menu.file.delete_table": {
+        "de": "Tabelle löschen",
+        "en": "Delete table",
+        "es": "Eliminar tabla",
+        "fr": "Supprimer la table",
+        "sq": "Fshi tabelën",
+    },
+    "menu.file.add_card": {
+        "de": "Karte hinzufügen (1–9)",
+        "en": "Add card (1–9)",
+        "es": "Añadir tarjeta (1–9)",
+        "fr": "Ajouter une carte (1–9)",
+        "sq": "Shto kartë (1–9)",
+    },
+    "menu.file.toggle_delete": {
+        "de": "Löschmodus umschalten (Strg+W)",
+        "en": "Toggle delete mode (Ctrl+W)",
+        "es": "Cambiar modo borrar (Ctrl+W)",
+        "fr": "Basculer le mode suppression (Ctrl+W)",
+        "sq": "Ndrysho modalitetin e fshirjes (Ctrl+W)",
+    },
+    "menu.file.cancel_action": {
+        "de": "Aktion abbrechen (Esc)",
+        "en": "Cancel action (Esc)",
+        "es": "Cancelar acción (Esc)",
+        "fr": "Annuler l'action (Esc)",
+        "sq": "Anulo veprimin (Esc)",
+    },
+    "menu.file.choose_folder": {
+        "de": "Speicherordner wählen…",
+        "en": "Choose save folder…",
+        "es": "Elegir carpeta de guardado…",
+        "fr": "Choisir le dossier de sauvegarde…",
+        "sq": "Zgjidh dosjen e ruajtjes…",
+    },
+    "menu.file.change_file": {
+        "de": "Speicherdatei ändern…",
+        "en": "Change save file…",
+        "es": "Cambiar archivo de guardado…",
+        "fr": "Changer le fichier de sauvegarde…",
+        "sq": "Ndrysho skedarin e ruajtjes…",
+    },
+    "menu.file.exit": {
+        "de": "Beenden",
+        "en": "Exit",
+        "es": "Salir",
+        "fr": "Quitter",
+        "sq": "Dalje",
+    },
+    "menu.edit.undo": {
+        "de": "Rückgängig (Strg+Z)",
+        "en": "Undo (Ctrl+Z)",
+        "es": "Deshacer (Ctrl+Z)",
+        "fr": "Annuler (Ctrl+Z)",
+        "sq": "Zhbëj (Ctrl+Z)",
+    },
+    "menu.edit.redo": {
+        "de": "Wiederholen (Strg+Shift+Z)",
+        "en": "Redo (Ctrl+Shift+Z)",
+        "es": "Rehacer (Ctrl+Shift+Z)",
+        "fr": "Rétablir (Ctrl+Shift+Z)",
+        "sq": "Ribëj (Ctrl+Shift+Z)",
+    },
+    "menu.space.new": {
+        "de": "Neuer Space (Strg+S)",
+        "en": "New space (Ctrl+S)",
+        "es": "Nuevo espacio (Ctrl+S)",
+        "fr": "Nouvel espace (Ctrl+S)",
+        "sq": "Hapësirë e re (Ctrl+S)",
+    },
+    "menu.space.load": {
+        "de": "Space laden…",
+        "en": "Load space…",
+        "es": "Cargar espacio…",
+        "fr": "Charger un espace…",
+        "sq": "Ngarko hapësirë…",
+    },
+    "menu.space.import_space": {
+        "de": "Space importieren…",
+        "en": "Import space…",
+        "es": "Importar espacio…",
+        "fr": "Importer un espace…",
+        "sq": "Importo hapësirë…",
+    },
+    "menu.space.export_space": {
+        "de": "Space exportieren…",
+        "en": "Export space…",
+        "es": "Exportar espacio…",
+        "fr": "Exporter un espace…",
+        "sq": "Eksporto hapësirë…",
+    },
+    "menu.space.import_cards": {
+        "de": "Karten importieren…",
+        "en": "Import cards…",
+        "es": "Importar tarjetas…",
+        "fr": "Importer des cartes…",
+        "sq": "Importo karta…",
+    },
+    "menu.space.import_short": {
+        "de": "Import",
+        "en": "Import",
+        "es": "Importar",
+        "fr": "Importer",
+        "sq": "Importo",
+    },
+    "menu.space.duplicate": {
+        "de": "Space duplizieren…",
+        "en": "Duplicate space…",
+        "es": "Duplicar espacio…",
+        "fr": "Dupliquer l'espace…",
+        "sq": "Dupliko hapësirën…",
+    },
+    "menu.space.transfer": {
+        "de": "Tabelle verschieben/kopieren…",
+        "en": "Move/copy table…",
+        "es": "Mover/copiar tabla…",
+        "fr": "Déplacer/copier la table…",
+        "sq": "Zhvendos/kopjo tabelën…",
+    },
+    "menu.space.delete": {
+        "de": "Space löschen…",
+        "en": "Delete space…",
+        "es": "Eliminar espacio…",
+        "fr": "Supprimer l'espace…",
+        "sq": "Fshi hapësirën…",
+    },
+    "menu.space.theme": {
+        "de": "Theme",
+        "en": "Theme",
+        "es": "Tema",
+        "fr": "Thème",
+        "sq": "Tema",
+    },
+    "menu.space.theme.dark": {
+        "de": "Dunkel",
+        "en": "Dark",
+        "es": "Oscuro",
+        "fr": "Sombre",
+        "sq": "I errët",
+    },
+    "menu.space.theme.beige": {
+        "de": "Beige",
+        "en": "Beige",
+        "es": "Beige",
+        "fr": "Beige",
+        "sq": "Bezhë",
+    },
+    "menu.space.theme.custom": {
+        "de": "Eigenes Theme…",
+        "en": "Custom theme…",
+        "es": "Tema personalizado…",
+        "fr": "Thème personnalisé…",
+        "sq": "Temë e personalizuar…",
+    },
+    "menu.help.check_updates": {
+        "de": "Auf Updates prüfen…",
+        "en": "Check for updates…",
+        "es": "Buscar actualizaciones…",
+        "fr": "Rechercher des mises à jour…",
+        "sq": "Kontrollo për përditësime…",
+    },
+    "menu.help.about": {
+        "de": "Über",
+        "en": "About",
+        "es": "Acerca de",
+        "fr": "À propos",
+        "sq": "Rreth",
+    },
+    "action.toggle_mark_mode": {
+        "de": "Markiermodus umschalten",
+        "en": "Toggle mark mode",
+        "es": "Cambiar modo marcado",
+        "fr": "Basculer le mode de marquage",
+        "sq": "Ndrysho modalitetin e shënimit",
+    },
+    "save_prompt.title": {
+        "de": "Speicherort wählen",
+        "en": "Choose storage location",
+        "es": "Elegir ubicación de guardado",
+        "fr": "Choisir l'emplacement de stockage",
+        "sq": "Zgjidh vendndodhjen e ruajtjes",
+    },
+    "save_prompt.body": {
+        "de": "Klausurmaster benötigt einen Speicherordner für Ihre Tabellen.\n\nMöchten Sie jetzt einen Ordner wählen? Andernfalls wird der Standardordner im Benutzerverzeichnis verwendet.",
+        "en": "Klausurmaster needs a folder to store your tables.\n\nDo you want to choose one now? Otherwise the default directory in your user profile will be used.",
+        "es": "Klausurmaster necesita una carpeta para guardar tus tablas.\n\n¿Quieres elegir una ahora? De lo contrario se usará la carpeta predeterminada de tu perfil.",
+        "fr": "Klausurmaster a besoin d'un dossier pour enregistrer vos tableaux.\n\nSouhaitez-vous en choisir un maintenant ? Sinon, le dossier par défaut de votre profil sera utilisé.",
+        "sq": "Klausurmaster ka nevojë për një dosje për të ruajtur tabelat tuaja.\n\nDëshiron të zgjedhësh tani një dosje? Përndryshe përdoret dosja standarde në profilin tënd.",
+    },
+    "save_prompt.default_title": {
+        "de": "Standard verwendet",
+        "en": "Default used",
+        "es": "Se usa el predeterminado",
+        "fr": "Emplacement par défaut",
+        "sq": "Është përdorur parazgjedhja",
+    },
+    "save_prompt.default_body": {
+        "de": "Es wird der Standardordner verwendet.",
+        "en": "The default folder will be used.",
+        "es": "Se usará la carpeta predeterminada.",
+        "fr": "Le dossier par défaut sera utilisé.",
+        "sq": "Do të përdoret dosja e parazgjedhur.",
+    },
+    "save_prompt.option_custom": {
+        "de": "Eigenen Ordner wählen",
+        "en": "Choose custom folder",
+        "es": "Elegir carpeta personalizada",
+        "fr": "Choisir un dossier personnalisé",
+        "sq": "Zgjidh dosje të personalizuar",
+    },
+    "save_prompt.option_default": {
+        "de": "Standard verwenden",
+        "en": "Use default",
+        "es": "Usar predeterminado",
+        "fr": "Utiliser par défaut",
+        "sq": "Përdor parazgjedhjen",
+    },
+    "save_prompt.option_existing": {
+        "de": "Bestehende Daten suchen",
+        "en": "Locate existing data",
+        "es": "Buscar datos existentes",
+        "fr": "Rechercher des données existantes",
+        "sq": "Gjej të dhëna ekzistuese",
+    },
+    "save_prompt.locate_save_title": {
+        "de": "Tabellenspeicher-Datei auswählen",
+        "en": "Select table storage file",
+        "es": "Selecciona el archivo de tablas",
+        "fr": "Sélectionner le fichier des tableaux",
+        "sq": "Zgjidh skedarin e tabelave",
+    },
+    "save_prompt.locate_bin_title": {
+        "de": "Versionshistorie-Datei auswählen",
+        "en": "Select history file",
+        "es": "Selecciona el archivo de historial",
+        "fr": "Sélectionner le fichier d'historique",
+        "sq": "Zgjidh skedarin e historikut",
+    },
+    "save_prompt.existing_cancelled_title": {
+        "de": "Suche abgebrochen",
+        "en": "Search canceled",
+        "es": "Búsqueda cancelada",
+        "fr": "Recherche annulée",
+        "sq": "Kërkimi u anulua",
+    },
+    "save_prompt.existing_cancelled_body": {
+        "de": "Es wurden keine Dateien gewählt. Der Standardordner wird verwendet.",
+        "en": "No files were selected. The default folder will be used.",
+        "es": "No se seleccionaron archivos. Se usará la carpeta predeterminada.",
+        "fr": "Aucun fichier sélectionné. Le dossier par défaut sera utilisé.",
+        "sq": "Nuk u zgjodhën skedarë. Do të përdoret dosja e parazgjedhur.",
+    },
+    "save_prompt.existing_success_title": {
+        "de": "Daten gefunden",
+        "en": "Data linked",
+        "es": "Datos vinculados",
+        "fr": "Données liées",
+        "sq": "Të dhënat u lidhën",
+    },
+    "save_prompt.existing_success_body": {
+        "de": "Tabellen: {save}\nHistorie: {bin}",
+        "en": "Tables: {save}\nHistory: {bin}",
+        "es": "Tablas: {save}\nHistorial: {bin}",
+        "fr": "Tables : {save}\nHistorique : {bin}",
+        "sq": "Tabela: {save}\nHistoria: {bin}",
+    },
+    "status.current_path": {
+        "de": "Aktueller Speicherpfad: {path}",
+        "en": "Current save path: {path}",
+        "es": "Ruta de guardado actual: {path}",
+        "fr": "Chemin d'enregistrement actuel : {path}",
+        "sq": "Shtegu aktual i ruajtjes: {path}",
+    },
+    "choose_directory.success_title": {
+        "de": "Erfolg",
+        "en": "Success",
+        "es": "Éxito",
+        "fr": "Succès",
+        "sq": "Sukses",
+    },
+    "choose_directory.success_body": {
+        "de": "Speicherpfad gesetzt auf:\n{path}",
+        "en": "Save path set to:\n{path}",
+        "es": "Ruta de guardado establecida en:\n{path}",
+        "fr": "Chemin d'enregistrement défini sur :\n{path}",
+        "sq": "Shtegu i ruajtjes u vendos në:\n{path}",
+    },
+    "change_save.option_title": {
+        "de": "Speicheroption",
+        "en": "Storage option",
+        "es": "Opción de guardado",
+        "fr": "Option de stockage",
+        "sq": "Opsioni i ruajtjes",
+    },
+    "change_save.option_question": {
+        "de": "Möchten Sie eine neue JSON-Datei erstellen oder eine bestehende Datei laden?",
+        "en": "Do you want to create a new JSON file or load an existing one?",
+        "es": "¿Quieres crear un archivo JSON nuevo o cargar uno existente?",
+        "fr": "Souhaitez-vous créer un nouveau fichier JSON ou en charger un existant ?",
+        "sq": "Dëshiron të krijosh një skedar të ri JSON apo të ngarkosh një ekzistues?",
+    },
+    "change_save.new_dialog_title": {
+        "de": "Neuen Speicherort für die JSON-Datei wählen",
+        "en": "Choose a new location for the JSON file",
+        "es": "Elige una nueva ubicación para el archivo JSON",
+        "fr": "Choisir un nouvel emplacement pour le fichier JSON",
+        "sq": "Zgjidh një vendndodhje të re për skedarin JSON",
+    },
+    "change_save.existing_dialog_title": {
+        "de": "Vorhandene JSON-Datei auswählen",
+        "en": "Select an existing JSON file",
+        "es": "Selecciona un archivo JSON existente",
+        "fr": "Sélectionner un fichier JSON existant",
+        "sq": "Zgjidh një skedar ekzistues JSON",
+    },
+    "change_save.no_change": {
+        "de": "Keine Änderung vorgenommen.",
+        "en": "No changes were made.",
+        "es": "No se realizaron cambios.",
+        "fr": "Aucun changement effectué.",
+        "sq": "Asnjë ndryshim nuk u bë.",
+    },
+    "update.available.title": {
+        "de": "Update verfügbar",
+        "en": "Update available",
+        "es": "Actualización disponible",
+        "fr": "Mise à jour disponible",
+        "sq": "Përditësim i disponueshëm",
+    },
+    "update.available.body": {
+        "de": "Version {version} ist verfügbar. Installer herunterladen und starten? Deine gespeicherten Tabellen bleiben erhalten.\n\nHinweise:\n{notes}",
+        "en": "Version {version} is available. Download and launch the installer? Your saved tables stay untouched.\n\nNotes:\n{notes}",
+        "es": "La versión {version} está disponible. ¿Descargar e iniciar el instalador? Tus tablas guardadas no se tocan.\n\nNotas:\n{notes}",
+        "fr": "La version {version} est disponible. Télécharger et lancer l'installateur ? Vos tableaux enregistrés restent inchangés.\n\nNotes :\n{notes}",
+        "sq": "Versioni {version} është gati. Ta shkarkoj dhe nis instaluesin? Tabelat e ruajtura mbeten të paprekura.\n\nShënime:\n{notes}",
+    },
+    "update.no_notes": {
+        "de": "Keine zusätzlichen Hinweise.",
+        "en": "No additional notes.",
+        "es": "Sin notas adicionales.",
+        "fr": "Aucune note supplémentaire.",
+        "sq": "Pa shënime shtesë.",
+    },
+    "update.asset.missing": {
+        "de": "Für dieses Betriebssystem wurde kein Installationspaket gefunden.",
+        "en": "No installer asset was found for this operating system.",
+        "es": "No se encontró un instalador para este sistema operativo.",
+        "fr": "Aucun installateur n'a été trouvé pour ce système.",
+        "sq": "Nuk u gjet instalues për këtë sistem.",
+    },
+    "update.up_to_date": {
+        "de": "Sie verwenden bereits Version {version}.",
+        "en": "You're already running version {version}.",
+        "es": "Ya usas la versión {version}.",
+        "fr": "Vous utilisez déjà la version {version}.",
+        "sq": "Po përdor tashmë versionin {version}.",
+    },
+    "update.error.title": {
+        "de": "Update fehlgeschlagen",
+        "en": "Update failed",
+        "es": "Actualización fallida",
+        "fr": "Échec de la mise à jour",
+        "sq": "Përditësimi dështoi",
+    },
+    "update.error.generic": {
+        "de": "Fehler: {error}",
+        "en": "Error: {error}",
+        "es": "Error: {error}",
+        "fr": "Erreur : {error}",
+        "sq": "Gabim: {error}",
+    },
+    "update.error.no_version": {
+        "de": "Im Release wurde keine Version gefunden.",
+        "en": "No version value was found in the release metadata.",
+        "es": "No se encontró ninguna versión en los metadatos de la publicación.",
+        "fr": "Aucune version n'a été trouvée dans la publication.",
+        "sq": "Nuk u gjet version në publikim.",
+    },
+    "update.download.success.title": {
+        "de": "Installer bereit",
+        "en": "Installer ready",
+        "es": "Instalador listo",
+        "fr": "Programme d'installation prêt",
+        "sq": "Instaluesi gati",
+    },
+    "update.download.success.body": {
+        "de": "Der Installer befindet sich unter:\n{path}\nEr startet jetzt; schließe die App danach, damit die Installation abschließen kann.",
+        "en": "The installer was saved to:\n{path}\nIt will launch now; close the app afterward to let it finish.",
+        "es": "El instalador se guardó en:\n{path}\nSe iniciará ahora; cierra la app después para completar la instalación.",
+        "fr": "L'installateur a été enregistré ici :\n{path}\nIl va se lancer maintenant ; fermez l'app ensuite pour terminer.",
+        "sq": "Instaluesi u ruajt te:\n{path}\nDo të niset tani; mbylle aplikacionin më pas që të përfundojë.",
+    },
+}
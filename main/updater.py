@@ -2,34 +2,45 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
-import stat
-import subprocess
 import sys
-import tempfile
-import urllib.error
-import urllib.request
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable
 
+from main.runtime_paths import get_user_data_dir
+from main.storage import load_json_file, write_file_atomic
+
 GITHUB_REPO = "CSRuger/Klausurmaster"
 API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 WINDOWS_SUFFIXES: tuple[str, ...] = (".exe", ".msi")
 MAC_SUFFIXES: tuple[str, ...] = (".dmg", ".pkg", ".zip")
 LINUX_SUFFIXES: tuple[str, ...] = (".AppImage", ".tar.gz", ".sh")
+_IS_WINDOWS = sys.platform.startswith("win")
+_IS_MAC = sys.platform == "darwin"
+_SUFFIXES = WINDOWS_SUFFIXES if _IS_WINDOWS else MAC_SUFFIXES if _IS_MAC else LINUX_SUFFIXES
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+RELEASE_CACHE_FILENAME = "release_cache.json"
+_VERSION_SPLIT = re.compile(r"[._-]")
+
+# urllib, tempfile, subprocess and stat are imported where they are used: this module is only loaded
+# when the user checks for updates, and urllib.request alone pulls in ssl, socket and email.
+_opener: Any = None
 
 
 class UpdateError(RuntimeError):
     """Raised when update steps fail."""
 
 
+@lru_cache(maxsize=256)
 def _normalize_version(value: str) -> tuple[int, ...]:
     cleaned = value.strip().lstrip("vV")
     if not cleaned:
         return ()
-    parts = re.split(r"[._-]", cleaned)
+    parts = _VERSION_SPLIT.split(cleaned)
     normalized = []
     for part in parts:
         if part.isdigit():
@@ -37,16 +48,60 @@ def _normalize_version(value: str) -> tuple[int, ...]:
     return tuple(normalized)
 
 
+def _load_release_cache() -> dict[str, Any]:
+    try:
+        cache = load_json_file(get_user_data_dir() / RELEASE_CACHE_FILENAME)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _store_release_cache(etag: str, payload: dict[str, Any]) -> None:
+    try:
+        write_file_atomic(
+            get_user_data_dir() / RELEASE_CACHE_FILENAME,
+            json.dumps({"etag": etag, "release": payload}, ensure_ascii=False).encode("utf-8"),
+        )
+    except OSError:
+        pass
+
+
+def _get_opener() -> Any:
+    """Return the opener shared by all update requests, building it on first use."""
+    global _opener
+    if _opener is None:
+        import urllib.request
+
+        _opener = urllib.request.build_opener(urllib.request.HTTPSHandler())
+    return _opener
+
+
 def fetch_latest_release(timeout: int = 10) -> dict[str, Any]:
+    import urllib.error
+    import urllib.request
+
+    cache = _load_release_cache()
+    cached_release = cache.get("release")
+    request = urllib.request.Request(API_URL)
+    if isinstance(cache.get("etag"), str) and isinstance(cached_release, dict):
+        # GitHub answers an unchanged release with an empty 304 that does not count against the rate limit.
+        request.add_header("If-None-Match", cache["etag"])
     try:
-        with urllib.request.urlopen(API_URL, timeout=timeout) as response:
+        with _get_opener().open(request, timeout=timeout) as response:
             data = response.read()
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and isinstance(cached_release, dict):
+            return cached_release
+        raise UpdateError(f"GitHub Anfrage fehlgeschlagen: {exc}") from exc
     except urllib.error.URLError as exc:
         raise UpdateError(f"GitHub Anfrage fehlgeschlagen: {exc}") from exc
     try:
         payload = json.loads(data.decode("utf-8"))
     except json.JSONDecodeError as exc:
         raise UpdateError("Antwort von GitHub konnte nicht gelesen werden") from exc
+    if etag and isinstance(payload, dict):
+        _store_release_cache(etag, payload)
     return payload
 
 
@@ -55,25 +110,28 @@ def is_newer_version(current: str, latest: str) -> bool:
 
 
 def _pick_suffixes() -> Iterable[str]:
-    if sys.platform.startswith("win"):
-        return WINDOWS_SUFFIXES
-    if sys.platform == "darwin":
-        return MAC_SUFFIXES
-    return LINUX_SUFFIXES
+    return _SUFFIXES
 
 
 def select_best_asset(release_payload: dict[str, Any]) -> dict[str, Any] | None:
     assets = release_payload.get("assets") or []
-    suffixes = _pick_suffixes()
-    for suffix in suffixes:
-        for asset in assets:
-            name = asset.get("name") or ""
-            if name.endswith(suffix):
-                return asset
-    return None
+    suffixes = tuple(_pick_suffixes())
+    # One pass over the assets; the earliest suffix wins, and among equals the first listed asset.
+    best_asset = None
+    best_priority = len(suffixes)
+    for asset in assets:
+        name = asset.get("name") or ""
+        priority = next((index for index, suffix in enumerate(suffixes) if name.endswith(suffix)), None)
+        if priority is not None and priority < best_priority:
+            best_asset, best_priority = asset, priority
+            if priority == 0:
+                break
+    return best_asset
+
+
+def download_asset(asset: dict[str, Any], directory: Path | None = None, timeout: int = 30) -> Path:
+    import tempfile
 
-
-def download_asset(asset: dict[str, Any], directory: Path | None = None) -> Path:
     url = asset.get("browser_download_url")
     name = asset.get("name")
     if not url or not name:
@@ -81,18 +139,48 @@ def download_asset(asset: dict[str, Any], directory: Path | None = None) -> Path
     target_dir = directory or Path(tempfile.gettempdir())
     target_dir.mkdir(parents=True, exist_ok=True)
     target_path = target_dir / name
+    # The installer only appears under its real name once it is complete and verified.
+    part_path = target_dir / (name + ".part")
+    digest = hashlib.sha256()
+    written = 0
     try:
-        with urllib.request.urlopen(url) as response, target_path.open("wb") as handle:
-            handle.write(response.read())
-    except urllib.error.URLError as exc:
+        # Streamed in chunks so an installer never has to fit in memory; hashed on the way through.
+        with _get_opener().open(url, timeout=timeout) as response, part_path.open("wb") as handle:
+            expected_size = response.headers.get("Content-Length")
+            while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                handle.write(chunk)
+                written += len(chunk)
+            handle.flush()
+            os.fsync(handle.fileno())
+    except OSError as exc:
+        # URLError, read timeouts and a full disk all land here; none may leave a truncated installer behind.
+        part_path.unlink(missing_ok=True)
+        raise UpdateError(f"Download fehlgeschlagen: {exc}") from exc
+
+    if expected_size is not None and expected_size.isdigit() and written != int(expected_size):
+        part_path.unlink(missing_ok=True)
+        raise UpdateError("Download unvollständig")
+    expected_digest = asset.get("digest")
+    if isinstance(expected_digest, str) and expected_digest.startswith("sha256:"):
+        if expected_digest[len("sha256:"):].lower() != digest.hexdigest():
+            part_path.unlink(missing_ok=True)
+            raise UpdateError("Prüfsumme des Downloads stimmt nicht überein")
+    try:
+        os.replace(part_path, target_path)
+    except OSError as exc:
+        part_path.unlink(missing_ok=True)
         raise UpdateError(f"Download fehlgeschlagen: {exc}") from exc
     return target_path
 
 
 def launch_installer(installer_path: Path) -> None:
-    if sys.platform.startswith("win"):
+    import stat
+    import subprocess
+
+    if _IS_WINDOWS:
         subprocess.Popen([str(installer_path)], shell=False)
-    elif sys.platform == "darwin":
+    elif _IS_MAC:
         subprocess.Popen(["open", str(installer_path)], shell=False)
     else:
         current_mode = os.stat(installer_path).st_mode
@@ -1,4 +1,4 @@
 """Table layout helpers for colors and column generation."""
 
-from .colors import interpolate_color, random_pastel_color  # noqa: F401
+from .colors import contrast_text_color, hex_to_rgb, interpolate_color, random_pastel_color  # noqa: F401
 from .structure import generate_columns  # noqa: F401
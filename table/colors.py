@@ -1,24 +1,53 @@
 """Color helpers to keep UI styling logic centralized."""
 
+from __future__ import annotations
+
 import colorsys
 import random
+from functools import lru_cache
+
+
+_PASTEL_POOL_SIZE = 256
+_pastel_pool: list[str] = []
+
+
+# Fills the pastel pool in one batch so the HSV conversion runs with bound locals.
+def _refill_pastel_pool() -> None:
+    hsv_to_rgb = colorsys.hsv_to_rgb
+    rand = random.random
+    uniform = random.uniform
+    append = _pastel_pool.append
+    for _ in range(_PASTEL_POOL_SIZE):
+        # Full hue range, a widened saturation band and a bright value for readability.
+        r, g, b = hsv_to_rgb(rand(), uniform(0.35, 0.75), uniform(0.75, 0.95))
+        append(f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}")
 
 
 # Generates a pastel color that keeps the UI subtle and readable.
 def random_pastel_color() -> str:
     """Return a soft tone while covering ~200% more hue/saturation range."""
 
-    hue = random.random()  # full 360° hue range
-    saturation = random.uniform(0.35, 0.75)  # widened saturation band
-    value = random.uniform(0.75, 0.95)  # keep it bright for readability
-    r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-    return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+    if not _pastel_pool:
+        _refill_pastel_pool()
+    return _pastel_pool.pop()
 
 
-# Converts a hexadecimal color string into an RGB tuple.
+# Converts a hexadecimal color string into an RGB tuple; cached since the UI reuses a few theme colors.
+@lru_cache(maxsize=1024)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+    raw = bytes.fromhex(hex_color.lstrip('#')[:6])
+    return raw[0], raw[1], raw[2]
+
+
+# Picks black or white text for the given background; None for unparsable colors. Cached per color.
+@lru_cache(maxsize=256)
+def contrast_text_color(hex_color: str) -> str | None:
+    try:
+        r, g, b = hex_to_rgb(hex_color)
+    except (ValueError, IndexError, TypeError):
+        return None
+    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    return "#000000" if luminance > 0.6 else "#ffffff"
 
 
 # Converts RGB values back to a hexadecimal color string.
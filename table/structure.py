@@ -8,9 +8,4 @@ def generate_columns(num_columns: int) -> list[str]:
     diff = start_value - end_value
     steps = num_columns - 1 if num_columns > 1 else 1
     step = diff / steps
-
-    columns: list[str] = []
-    for idx in range(num_columns):
-        val = start_value - idx * step
-        columns.append(f"{val:.1f}")
-    return columns
+    return [f"{start_value - idx * step:.1f}" for idx in range(num_columns)]